@@ -126,6 +126,62 @@ def create_app():
     app.config["PLAID_COUNTRY_CODES"] = os.environ.get("PLAID_COUNTRY_CODES", "US").strip()
     app.config["PLAID_REDIRECT_URI"] = os.environ.get("PLAID_REDIRECT_URI", "").strip()
 
+    # Bank-holiday calendar for projected occurrence dates (app/business_days.py).
+    # "none" (default) rolls weekends only; "us_federal_reserve" also skips
+    # Federal Reserve holidays. HOLIDAY_DATES adds comma-separated YYYY-MM-DD
+    # closures on top of the selected calendar.
+    from .business_days import configure_business_calendar, parse_holiday_dates
+    app.config["HOLIDAY_CALENDAR"] = os.environ.get("HOLIDAY_CALENDAR", "none").strip().lower() or "none"
+    app.config["HOLIDAY_DATES"] = parse_holiday_dates(os.environ.get("HOLIDAY_DATES", ""))
+    configure_business_calendar(app.config["HOLIDAY_CALENDAR"], app.config["HOLIDAY_DATES"])
+
+    # Per-process LRU of computed projections (app/projection_cache.py), keyed
+    # on a content hash of the inputs. Set PROJECTION_CACHE_SIZE=0 to disable.
+    from .projection_cache import projection_cache
+    app.config["PROJECTION_CACHE_SIZE"] = int(os.environ.get("PROJECTION_CACHE_SIZE", "256"))
+    projection_cache.configure(app.config["PROJECTION_CACHE_SIZE"])
+
+    # Per-user incremental projection state (app/incremental_projection.py):
+    # after an edit only the changed rows are re-expanded. Set
+    # INCREMENTAL_PROJECTION_USERS=0 to always recompute from scratch.
+    from .incremental_projection import incremental_projections
+    app.config["INCREMENTAL_PROJECTION_USERS"] = int(os.environ.get("INCREMENTAL_PROJECTION_USERS", "256"))
+    incremental_projections.configure(app.config["INCREMENTAL_PROJECTION_USERS"])
+
+    # Dashboard chart downsampling (app/chart_series.py): lines longer than
+    # CHART_MAX_POINTS are thinned with CHART_DOWNSAMPLE ("minmax" or "lttb").
+    # Set CHART_MAX_POINTS=0 to always send every point.
+    from .chart_series import DOWNSAMPLE_METHODS
+    app.config["CHART_MAX_POINTS"] = int(os.environ.get("CHART_MAX_POINTS", "1000"))
+    app.config["CHART_DOWNSAMPLE"] = os.environ.get("CHART_DOWNSAMPLE", "minmax").strip().lower() or "minmax"
+    if app.config["CHART_DOWNSAMPLE"] not in DOWNSAMPLE_METHODS:
+        raise ValueError(
+            f"Unknown CHART_DOWNSAMPLE {app.config['CHART_DOWNSAMPLE']!r}; "
+            f"expected one of {', '.join(DOWNSAMPLE_METHODS)}"
+        )
+
+    # Response compression (app/compression.py): gzip, or brotli when the
+    # optional brotli package is installed, for text responses of at least
+    # COMPRESSION_MIN_SIZE bytes. COMPRESSION_CACHE_STATIC keeps compressed
+    # /static, /manifest.json and /sw.js bodies in memory.
+    app.config["COMPRESSION_ENABLED"] = os.environ.get("COMPRESSION_ENABLED", "true").lower() == "true"
+    app.config["COMPRESSION_MIN_SIZE"] = int(os.environ.get("COMPRESSION_MIN_SIZE", "500"))
+    app.config["COMPRESSION_CACHE_STATIC"] = (
+        os.environ.get("COMPRESSION_CACHE_STATIC", "true").lower() == "true"
+    )
+    if app.config["COMPRESSION_MIN_SIZE"] < 0:
+        raise ValueError("COMPRESSION_MIN_SIZE must be >= 0")
+
+    # Opt-in SQLite performance profile (app/sqlite_profile.py): WAL journal,
+    # synchronous=NORMAL, a busy timeout, a larger page cache/mmap and
+    # in-memory temp storage on every connection. Ignored for other databases.
+    app.config["SQLITE_PERFORMANCE_PROFILE"] = (
+        os.environ.get("SQLITE_PERFORMANCE_PROFILE", "false").lower() == "true"
+    )
+    app.config["SQLITE_BUSY_TIMEOUT_MS"] = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    app.config["SQLITE_CACHE_SIZE_KB"] = int(os.environ.get("SQLITE_CACHE_SIZE_KB", "20000"))
+    app.config["SQLITE_MMAP_SIZE_MB"] = int(os.environ.get("SQLITE_MMAP_SIZE_MB", "256"))
+
     basedir = os.path.abspath(os.path.dirname(__file__))
 
     # Prefer a stable SECRET_KEY from the environment so sessions survive restarts.
@@ -136,6 +192,24 @@ def create_app():
     app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL') or \
     'sqlite:///' + os.path.join(basedir, 'data/db.sqlite')
 
+    # Connection pooling for server databases such as PostgreSQL
+    # (app/db_pool.py); SQLite keeps SQLAlchemy's defaults. The pool holds one
+    # connection per gunicorn thread plus DB_MAX_OVERFLOW spares, pre-pings
+    # and recycles connections, and PostgreSQL sessions get a server-side
+    # statement_timeout (0 disables it). Checkouts slower than
+    # DB_POOL_SLOW_CHECKOUT_MS are logged as pool starvation.
+    from .db_pool import engine_options, pool_metrics
+    _threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+    app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE', str(_threads)))
+    app.config['DB_MAX_OVERFLOW'] = int(os.environ.get('DB_MAX_OVERFLOW', str(max(2, _threads // 4))))
+    app.config['DB_POOL_TIMEOUT'] = float(os.environ.get('DB_POOL_TIMEOUT', '10'))
+    app.config['DB_POOL_RECYCLE'] = int(os.environ.get('DB_POOL_RECYCLE', '1800'))
+    app.config['DB_STATEMENT_TIMEOUT_MS'] = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', '30000'))
+    app.config['DB_APPLICATION_NAME'] = os.environ.get('DB_APPLICATION_NAME', 'pycashflow').strip()
+    app.config['DB_POOL_SLOW_CHECKOUT_MS'] = int(os.environ.get('DB_POOL_SLOW_CHECKOUT_MS', '100'))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
+    pool_metrics.configure(app.config['DB_POOL_SLOW_CHECKOUT_MS'])
+
     # Harden session and remember-me cookies.
     # SESSION_COOKIE_SECURE defaults to True; set SESSION_COOKIE_SECURE=false in .env
     # only when running without TLS (e.g. local dev over plain HTTP).
@@ -171,6 +245,9 @@ def create_app():
 
     db.init_app(app)
     migrate.init_app(app, db)
+
+    from .sqlite_profile import init_sqlite_profile
+    init_sqlite_profile(app)
     limiter.init_app(app)
     csrf.init_app(app)
 
@@ -178,13 +255,14 @@ def create_app():
     login_manager.login_view = 'auth.login'
     login_manager.init_app(app)
 
-    from .models import User
-    from .subscription import enforce_user_access
+    from .subscription import enforce_user_access, load_request_identity
 
     @login_manager.user_loader
     def load_user(user_id):
-        # since the user_id is just the primary key of our user table, use it in the query for the user
-        return User.query.get(int(user_id))
+        # One joined query loads the user, their account owner and the owner's
+        # effective subscription; access enforcement and routes reuse it via g.
+        identity = load_request_identity(int(user_id))
+        return identity.user if identity is not None else None
 
     @app.before_request
     def _enforce_authenticated_access():
@@ -223,6 +301,9 @@ def create_app():
         response.headers.setdefault(csp_header, _CONTENT_SECURITY_POLICY)
         return response
 
+    from .compression import init_compression
+    init_compression(app)
+
     # blueprint for auth routes in our app
     from .auth import auth as auth_blueprint
     app.register_blueprint(auth_blueprint)
@@ -236,6 +317,10 @@ def create_app():
     app.register_blueprint(api_blueprint, url_prefix="/api/v1")
     csrf.exempt(api_blueprint)
 
+    # `flask housekeeping` — batch schedule bookkeeping (app/housekeeping.py)
+    from .housekeeping import housekeeping_command
+    app.cli.add_command(housekeeping_command)
+
     # Don't use db.create_all() - use flask db upgrade instead
     # with app.app_context():
     #     db.create_all()
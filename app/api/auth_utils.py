@@ -26,6 +26,15 @@ Token lifecycle
 - Only the SHA-256 hash is stored; the raw token is returned once.
 - Default TTL: 30 days.  Expired tokens are rejected and can be purged.
 
+Verification cache
+------------------
+Validated tokens are kept in a small per-process TTL cache
+(``app.auth_revision.token_cache``), so an authenticated call only loads the
+user row instead of also querying ``UserToken``.  Revocation goes through
+``delete_token`` / ``revoke_user_tokens``, which bump ``User.auth_revision``;
+every worker compares that revision on the user row it loads anyway and
+drops its stale cache entry.
+
 Import note
 -----------
 ``db`` and ``UserToken`` are imported at module level (not inside functions)
@@ -42,11 +51,13 @@ from functools import wraps
 from flask import g, request
 from flask_login import current_user
 from flask_wtf.csrf import ValidationError, validate_csrf
+from sqlalchemy import select
 
 # Module-level imports: captured at app-creation time, before test stubs.
 from app import db
-from app.models import UserToken
-from app.subscription import enforce_user_access
+from app.auth_revision import bump_auth_revision, token_cache
+from app.models import User, UserToken
+from app.subscription import enforce_user_access, load_request_identity
 
 from .errors import unauthorized
 
@@ -85,8 +96,11 @@ def create_token_for_user(user) -> tuple[str, object]:
 
 def delete_token(raw_token: str) -> bool:
     """Delete the ``UserToken`` matching *raw_token*.  Returns ``True`` if found."""
-    record = UserToken.query.filter_by(token_hash=hash_token(raw_token)).first()
+    token_hash = hash_token(raw_token)
+    token_cache.discard(token_hash)
+    record = UserToken.query.filter_by(token_hash=token_hash).first()
     if record:
+        bump_auth_revision(record.user_id)
         db.session.delete(record)
         db.session.commit()
         return True
@@ -95,6 +109,13 @@ def delete_token(raw_token: str) -> bool:
 
 # ── Request-level token validation ────────────────────────────────────────────
 
+def _load_identity_user(user_id: int):
+    # Also loads the owner and effective subscription that
+    # enforce_user_access needs, in the same query (app/subscription.py).
+    identity = load_request_identity(user_id)
+    return identity.user if identity is not None else None
+
+
 def _load_user_from_bearer() -> object | None:
     """Extract and validate a Bearer token from the request.
 
@@ -108,12 +129,33 @@ def _load_user_from_bearer() -> object | None:
     if not raw_token:
         return None
 
-    record = UserToken.query.filter_by(token_hash=hash_token(raw_token)).first()
-    if record is None:
+    token_hash = hash_token(raw_token)
+    cached = token_cache.get(token_hash)
+    if cached is not None:
+        user_id, expires_at, auth_revision = cached
+        if expires_at < datetime.now(timezone.utc):
+            token_cache.discard(token_hash)
+            return None
+        user = _load_identity_user(user_id)
+        if user is not None and user.auth_revision == auth_revision:
+            return user
+        # A token of this user was revoked somewhere; re-check this one.
+        token_cache.discard(token_hash)
+
+    # Read the revision in the same statement as the token, so a revocation
+    # committed after this lookup always invalidates the cached entry.
+    row = db.session.execute(
+        select(UserToken.user_id, UserToken.expires_at, User.auth_revision)
+        .join(User, User.id == UserToken.user_id)
+        .where(UserToken.token_hash == token_hash)
+    ).first()
+    if row is None:
         return None
-    if record.expires_at.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc):
+    expires_at = row.expires_at.replace(tzinfo=timezone.utc)
+    if expires_at < datetime.now(timezone.utc):
         return None
-    return record.user
+    token_cache.put(token_hash, row.user_id, expires_at, row.auth_revision)
+    return _load_identity_user(row.user_id)
 
 
 def get_api_user():
@@ -0,0 +1,48 @@
+"""Conditional GET helpers (strong ETags + ``If-None-Match``) for the API.
+
+Projection-backed endpoints derive an ETag from a cheap version of the data
+they would render.  A client that sends that tag back in ``If-None-Match``
+gets an empty ``304 Not Modified`` before any projection is computed or
+serialized:
+
+    etag = make_etag("projections", version, horizon_days)
+    if (resp := not_modified(etag)) is not None:
+        return resp
+    ...
+    return with_etag(api_ok(payload), etag)
+
+Responses carry ``Cache-Control: private, no-cache`` so clients (and no
+shared cache) may reuse a body only after revalidating it.  Matching uses
+weak comparison (as RFC 9110 requires for ``If-None-Match``), so the tag
+still matches after response compression marks it weak.
+"""
+
+import hashlib
+
+from flask import Response, make_response, request
+
+
+_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Return an opaque strong ETag value (unquoted) identifying *parts*."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def not_modified(etag: str):
+    """Return a 304 response when the request's ``If-None-Match`` matches *etag*."""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return response
+
+
+def with_etag(result, etag: str):
+    """Attach *etag* to a view result (e.g. ``api_ok(...)``) and return the response."""
+    response = make_response(result)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return response
@@ -0,0 +1,73 @@
+"""Keyset (cursor) pagination helpers for API list endpoints.
+
+``LIMIT/OFFSET`` makes the database walk and discard every row before the
+requested page, and each paged request also pays for a ``COUNT(*)``.  A
+keyset page instead continues strictly after the sort key of the previous
+page's last row, so every page is a bounded index range scan:
+
+    rows, next_key = keyset_page(query, (Balance.date, Balance.id), limit=50,
+                                 after=after, descending=True)
+    next_cursor = encode_page_cursor("balances", next_key) if next_key else None
+
+Cursors are opaque, URL-safe strings bound to the list they came from
+(*scope*), so a schedules cursor cannot be replayed against balances.
+"""
+
+import base64
+import json
+from datetime import date
+
+from sqlalchemy import tuple_
+
+
+_CURSOR_VERSION = 1
+
+
+def _dump(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _load(kind, value):
+    return date.fromisoformat(value) if kind is date else kind(value)
+
+
+def encode_page_cursor(scope: str, key) -> str:
+    """Encode the sort *key* of a page's last row as an opaque cursor."""
+    raw = json.dumps([_CURSOR_VERSION, scope, [_dump(v) for v in key]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_page_cursor(scope: str, cursor: str, key_types) -> tuple:
+    """Inverse of ``encode_page_cursor``; raises ``ValueError`` if *cursor* is
+    malformed or was issued for another list."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        version, cursor_scope, values = json.loads(
+            base64.b64decode(padded, altchars=b"-_", validate=True)
+        )
+        if version != _CURSOR_VERSION or cursor_scope != scope or len(values) != len(key_types):
+            raise ValueError("cursor does not belong to this list")
+        return tuple(_load(kind, value) for kind, value in zip(key_types, values))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("invalid page cursor") from exc
+
+
+def keyset_page(query, columns, *, limit: int, after=None, descending: bool = False, offset: int = 0):
+    """Return ``(rows, next_key)`` for the page of *query* following *after*.
+
+    *columns* is the unique sort key (e.g. ``(Balance.date, Balance.id)``).
+    ``next_key`` is the last row's key when more rows follow, else ``None``.
+    *offset* serves legacy ``offset`` requests through the same path so their
+    responses can hand out a cursor too.
+    """
+    key = tuple_(*columns) if len(columns) > 1 else columns[0]
+    if after is not None:
+        bound = tuple_(*after) if len(columns) > 1 else after[0]
+        query = query.filter(key < bound if descending else key > bound)
+    ordering = [c.desc() if descending else c.asc() for c in columns]
+    rows = query.order_by(*ordering).offset(offset or None).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, tuple(getattr(last, c.key) for c in columns)
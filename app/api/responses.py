@@ -6,7 +6,7 @@ All successful responses share one of these shapes:
         { "data": { ... } }
 
     Collection (200):
-        { "data": [ ... ], "meta": { "total": N, "limit": N, "offset": N } }
+        { "data": [ ... ], "meta": { "total": N, "limit": N, "offset": N, "next_cursor": "..." } }
 
     No content (204):
         <empty body>
@@ -30,17 +30,25 @@ def api_no_content():
     return "", 204
 
 
-def api_list(items: list, *, total: int | None = None, limit: int | None = None, offset: int | None = None):
+def api_list(
+    items: list,
+    *,
+    total: int | None = None,
+    limit: int | None = None,
+    offset: int | None = None,
+    next_cursor: str | None = None,
+):
     """200 OK — collection with optional pagination metadata.
 
     Args:
-        items:  Serialized list of resources.
-        total:  Total count across all pages (omitted when not paginated).
-        limit:  Page size requested by the client.
-        offset: Page offset requested by the client.
+        items:       Serialized list of resources.
+        total:       Total count across all pages (omitted when not paginated).
+        limit:       Page size requested by the client.
+        offset:      Page offset requested by the client.
+        next_cursor: Opaque cursor for the next keyset page (omitted on the last page).
     """
     body: dict = {"data": items}
-    if total is not None or limit is not None or offset is not None:
+    if total is not None or limit is not None or offset is not None or next_cursor is not None:
         meta: dict = {}
         if total is not None:
             meta["total"] = total
@@ -48,5 +56,7 @@ def api_list(items: list, *, total: int | None = None, limit: int | None = None,
             meta["limit"] = limit
         if offset is not None:
             meta["offset"] = offset
+        if next_cursor is not None:
+            meta["next_cursor"] = next_cursor
         body["meta"] = meta
     return jsonify(body), 200
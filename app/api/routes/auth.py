@@ -12,8 +12,9 @@ from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from app import limiter, db
-from app.models import PasskeyCredential, User, UserToken
+from app.models import PasskeyCredential, User
 from app.auth import _DUMMY_HASH, _passkey_enabled
+from app.auth_revision import revoke_user_tokens
 from app.password_setup import consume_password_setup_token
 from app.totp_utils import decrypt_totp_secret, verify_totp, verify_and_consume_backup_code
 from app.subscription import enforce_user_access
@@ -269,7 +270,7 @@ def api_change_password():
         return unauthorized("Current password is incorrect")
 
     user.password = generate_password_hash(body["new_password"], method="scrypt")
-    UserToken.query.filter_by(user_id=user.id).delete(synchronize_session=False)
+    revoke_user_tokens(user.id)
     db.session.commit()
     return api_ok({"message": "Password updated"})
 
@@ -1,16 +1,21 @@
 """API v1 data endpoints for mobile clients (read + write)."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from itertools import chain, islice
 import json
 
-from sqlalchemy import desc
+from sqlalchemy import desc, or_
 from sqlalchemy.exc import IntegrityError
 
-from flask import request, g
+from flask import Response, request, g, stream_with_context
 
 from app import db
 from app.models import Schedule, Scenario, Balance, Hold, Skip, AISettings
-from app.cashflow import update_cash, calculate_cash_risk_score
+from app.cashflow import update_cash, calculate_cash_risk_score, iter_balances
+from app.projection_cache import cached_update_cash
+from app.data_revision import bump_data_revision, get_data_revision
+from app.sync import changes_since, decode_cursor, delete_with_tombstones
+from app.recurrence import MAX_HORIZON_DAYS, MIN_HORIZON_DAYS, validate_horizon
 from app.ai_insights import (
     AIProviderError,
     AIInsightsFormatError,
@@ -24,11 +29,13 @@ from app.plaid_service import (
     safe_update_plaid_balance_for_user,
     record_manual_balance_entry,
 )
-from app.models import User
+from app.subscription import owner_for_user
 
 from app.api import api
 from app.api.auth_utils import api_login_required, get_api_user
 from app.api.errors import validation_error, not_found, forbidden
+from app.api.etags import make_etag, not_modified, with_etag
+from app.api.pagination import decode_page_cursor, encode_page_cursor, keyset_page
 from app.api.responses import api_ok, api_list, api_created, api_no_content
 from app.api.serializers import (
     serialize_schedule,
@@ -36,15 +43,33 @@ from app.api.serializers import (
     serialize_balance,
     serialize_hold,
     serialize_skip,
+    serialize_series,
+    serialize_series_columnar,
     _amount,
+    _cents,
     _date,
     _datetime,
 )
 
 
+_SYNC_SERIALIZERS = {
+    "schedules": serialize_schedule,
+    "scenarios": serialize_scenario,
+    "holds": serialize_hold,
+    "skips": serialize_skip,
+    "balances": serialize_balance,
+}
+
+_DEFAULT_PAGE_SIZE = 50
+
 _VALID_TYPES = {"Income", "Expense"}
 _VALID_FREQUENCIES = {"Monthly", "Quarterly", "Yearly", "Weekly", "BiWeekly", "Onetime"}
 _MAX_NAME_LEN = 100
+_PROJECTION_ENCODINGS = ("objects", "columnar")
+_EXPORT_MIMETYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+_EXPORT_CHUNK_ROWS = 1000
+_MAX_BATCH_OPERATIONS = 500
+_BATCH_OPS = ("create", "update", "delete")
 
 
 def _effective_user_id() -> int:
@@ -54,11 +79,7 @@ def _effective_user_id() -> int:
 
 def _balance_owner_user():
     """Return the user object whose balance is the source of truth."""
-    user = get_api_user()
-    effective_id = _effective_user_id()
-    if effective_id == user.id:
-        return user
-    return User.query.get(effective_id)
+    return owner_for_user(get_api_user())
 
 
 def _forbid_guest_writes():
@@ -80,7 +101,7 @@ def _parse_limit_offset():
 
     errors = {}
     try:
-        limit = int(limit_raw) if limit_raw is not None else 50
+        limit = int(limit_raw) if limit_raw is not None else _DEFAULT_PAGE_SIZE
         if limit <= 0:
             raise ValueError
     except (TypeError, ValueError):
@@ -100,6 +121,65 @@ def _parse_limit_offset():
     return None, limit, offset
 
 
+def _parse_include_total(default: bool):
+    raw = request.args.get("include_total")
+    if raw is None:
+        return None, default
+    value = raw.strip().lower()
+    if value in ("1", "true"):
+        return None, True
+    if value in ("0", "false"):
+        return None, False
+    return {"include_total": "include_total must be true or false"}, None
+
+
+def _paginated_list(scope: str, query, columns, serializer, *, key_types, descending=False):
+    """Serve a list endpoint unpaginated, by ``limit/offset`` or by ``cursor``.
+
+    Offset pages report ``meta.total`` unless ``include_total=false``; cursor
+    (keyset) pages skip the count unless ``include_total=true``.  Both hand
+    out ``meta.next_cursor`` while more rows follow.
+    """
+    errors, limit, offset = _parse_limit_offset()
+    errors = dict(errors or {})
+
+    cursor = request.args.get("cursor")
+    after = None
+    if cursor is not None:
+        if request.args.get("offset") is not None:
+            errors["cursor"] = "cursor cannot be combined with offset"
+        else:
+            try:
+                after = decode_page_cursor(scope, cursor, key_types)
+            except ValueError:
+                errors["cursor"] = "cursor is not a valid page cursor"
+        offset = None
+        if limit is None and "limit" not in errors:
+            limit = _DEFAULT_PAGE_SIZE
+
+    total_errors, include_total = _parse_include_total(default=cursor is None)
+    errors.update(total_errors or {})
+    if errors:
+        return validation_error(errors)
+
+    if limit is None:
+        ordering = [c.desc() if descending else c.asc() for c in columns]
+        items = [serializer(row) for row in query.order_by(*ordering).all()]
+        return api_list(items, total=len(items))
+
+    total = query.count() if include_total else None
+    rows, next_key = keyset_page(
+        query, columns, limit=limit, after=after, descending=descending, offset=offset or 0,
+    )
+    return api_list(
+        [serializer(row) for row in rows],
+        total=total,
+        limit=limit,
+        offset=offset,
+        next_cursor=encode_page_cursor(scope, next_key) if next_key else None,
+    )
+
+
 def _validate_schedule_payload(body: dict) -> dict:
     errors = {}
     name_raw = body.get("name")
@@ -144,38 +224,82 @@ def _validate_balance_payload(body: dict) -> dict:
     return errors
 
 
-def _project_data(user_id: int):
+def _parse_horizon():
+    raw = request.args.get("horizon_days")
+    if raw is None:
+        return None, None
+    try:
+        return None, validate_horizon(int(raw))
+    except (TypeError, ValueError):
+        return {
+            "horizon_days": (
+                f"horizon_days must be an integer between {MIN_HORIZON_DAYS} and {MAX_HORIZON_DAYS}"
+            )
+        }, None
+
+
+def _projection_etag(user_id: int, endpoint: str, *extra, horizon_days=None):
+    """Strong ETag for a projection-backed response.
+
+    The projection version is the user's data revision (bumped by every write
+    to their projection inputs) plus today's date, so checking it costs one
+    primary-key read and no projection rows are loaded.  Revisions are per
+    account, so the tag also names the account and the requesting user: a
+    device that signs in as someone else must never revalidate the previous
+    account's body.
+    """
+    version = (get_data_revision(user_id), datetime.today().date().isoformat())
+    return make_etag(endpoint, user_id, get_api_user().id, version, horizon_days, *extra)
+
+
+def _load_user_rows(user_id: int):
+    """Load (balance, schedules, holds, skips, scenarios) once per request."""
+    cache = getattr(g, "_user_rows_cache", None)
+    if cache is None:
+        cache = {}
+        g._user_rows_cache = cache
+    if user_id not in cache:
+        cache[user_id] = (
+            _latest_balance(user_id),
+            Schedule.query.filter_by(user_id=user_id).order_by(Schedule.id.asc()).all(),
+            Hold.query.filter_by(user_id=user_id).order_by(Hold.id.asc()).all(),
+            Skip.query.filter_by(user_id=user_id).order_by(Skip.id.asc()).all(),
+            Scenario.query.filter_by(user_id=user_id).order_by(Scenario.id.asc()).all(),
+        )
+    return cache[user_id]
+
+
+def _project_data(user_id: int, horizon_days=None):
     cache = getattr(g, "_project_data_cache", None)
     if cache is None:
         cache = {}
         g._project_data_cache = cache
-    if user_id in cache:
-        return cache[user_id]
+    if (user_id, horizon_days) in cache:
+        return cache[(user_id, horizon_days)]
 
-    balance = _latest_balance(user_id)
+    balance, schedules, holds, skips, scenarios = _load_user_rows(user_id)
     try:
         balance_amount = float(balance.amount)
     except (ValueError, TypeError, AttributeError):
         balance_amount = 0.0
 
-    schedules = Schedule.query.filter_by(user_id=user_id).all()
-    holds = Hold.query.filter_by(user_id=user_id).all()
-    skips = Skip.query.filter_by(user_id=user_id).all()
-    scenarios = Scenario.query.filter_by(user_id=user_id).all()
-
-    trans, run, run_scenario = update_cash(balance_amount, schedules, holds, skips, scenarios, commit=True)
+    trans, run, run_scenario = cached_update_cash(
+        balance_amount, schedules, holds, skips, scenarios, commit=False, user_id=user_id,
+        horizon_days=horizon_days,
+    )
     result = (balance, balance_amount, trans, run, run_scenario)
-    cache[user_id] = result
+    cache[(user_id, horizon_days)] = result
     return result
 
 
-@api.route("/dashboard", methods=["GET"])
-@api_login_required
-def api_dashboard():
-    user_id = _effective_user_id()
-    # Refresh today's balance from Plaid before computing projections. Never
-    # raises — Plaid errors or missing config leave existing data intact.
-    safe_update_plaid_balance_for_user(_balance_owner_user())
+def _dashboard_etag_parts(ai_config):
+    return (
+        ai_config.last_updated if ai_config else None,
+        ai_config.last_insights if ai_config else None,
+    )
+
+
+def _dashboard_payload(user_id: int, ai_config) -> dict:
     balance, balance_amount, trans, run, _run_scenario = _project_data(user_id)
 
     cash_risk = calculate_cash_risk_score(balance_amount, run)
@@ -208,7 +332,6 @@ def api_dashboard():
         for row in trans.itertuples(index=False):
             upcoming.append({"name": row.name, "type": row.type, "amount": _amount(row.amount), "date": _date(row.date)})
 
-    ai_config = AISettings.query.filter_by(user_id=user_id).first()
     ai_insights = None
     ai_last_updated = None
     if ai_config and ai_config.last_insights:
@@ -219,7 +342,7 @@ def api_dashboard():
             ai_insights = None
 
     balance_date = balance.date if balance else todaydate
-    return api_ok({
+    return {
         "balance": _amount(balance_amount),
         "balance_date": _date(balance_date),
         "risk": cash_risk,
@@ -229,28 +352,35 @@ def api_dashboard():
         "min_balance": _amount(min_balance),
         "ai_insights": ai_insights,
         "ai_last_updated": ai_last_updated,
-    })
+    }
 
 
-@api.route("/schedules", methods=["GET"])
+@api.route("/dashboard", methods=["GET"])
 @api_login_required
-def api_schedules():
+def api_dashboard():
     user_id = _effective_user_id()
-    errors, limit, offset = _parse_limit_offset()
-    if errors:
-        return validation_error(errors)
+    # Refresh today's balance from Plaid before computing projections. Never
+    # raises — Plaid errors or missing config leave existing data intact.
+    safe_update_plaid_balance_for_user(_balance_owner_user())
 
-    query = Schedule.query.filter_by(user_id=user_id).order_by(Schedule.id.asc())
-    if limit is not None:
-        total = query.count()
-        query = query.limit(limit).offset(offset)
-    else:
-        total = None
+    ai_config = AISettings.query.filter_by(user_id=user_id).first()
+    etag = _projection_etag(user_id, "dashboard", *_dashboard_etag_parts(ai_config))
+    if (resp := not_modified(etag)) is not None:
+        return resp
 
-    items = [serialize_schedule(s) for s in query.all()]
-    if total is None:
-        total = len(items)
-    return api_list(items, total=total, limit=limit, offset=offset)
+    return with_etag(api_ok(_dashboard_payload(user_id, ai_config)), etag)
+
+
+@api.route("/schedules", methods=["GET"])
+@api_login_required
+def api_schedules():
+    return _paginated_list(
+        "schedules",
+        Schedule.query.filter_by(user_id=_effective_user_id()),
+        (Schedule.id,),
+        serialize_schedule,
+        key_types=(int,),
+    )
 
 
 @api.route("/schedules", methods=["POST"])
@@ -280,6 +410,7 @@ def api_create_schedule():
         firstdate=start,
     )
     db.session.add(record)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_created(serialize_schedule(record))
 
@@ -313,6 +444,7 @@ def api_update_schedule(schedule_id: int):
     record.type = body["type"]
     record.frequency = body["frequency"]
     record.startdate = start
+    bump_data_revision(user_id)
     db.session.commit()
     return api_ok(serialize_schedule(record))
 
@@ -327,43 +459,258 @@ def api_delete_schedule(schedule_id: int):
     if not record:
         return not_found("Schedule not found")
     db.session.delete(record)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_no_content()
 
 
+def _validate_batch_operations(operations) -> dict:
+    """Shape- and payload-check every batch operation; errors are keyed ``operations[i].field``."""
+    errors = {}
+    for index, op in enumerate(operations):
+        prefix = f"operations[{index}]"
+        if not isinstance(op, dict) or op.get("op") not in _BATCH_OPS:
+            errors[f"{prefix}.op"] = "op must be one of: " + ", ".join(_BATCH_OPS)
+            continue
+        if op["op"] != "create" and (not isinstance(op.get("id"), int) or isinstance(op["id"], bool)):
+            errors[f"{prefix}.id"] = "id must be an integer"
+        if op["op"] != "delete":
+            data = op.get("data")
+            if not isinstance(data, dict):
+                errors[f"{prefix}.data"] = "data must be an object"
+                continue
+            for field, message in _validate_schedule_payload(data).items():
+                errors[f"{prefix}.{field}"] = message
+    return errors
+
+
+@api.route("/schedules/batch", methods=["POST"])
+@api_login_required(require_bearer=True)
+def api_batch_schedules():
+    """Apply a list of schedule create/update/delete operations atomically.
+
+    Operations run in order with the same rules as the single-row endpoints.
+    Every operation is validated (including name uniqueness, checked with one
+    query) before anything is written; any failure rejects the whole batch
+    with a 422 whose ``fields`` are keyed ``operations[i].field``.  On success
+    all operations commit in one transaction and ``results`` mirrors the
+    request order.
+    """
+    if (resp := _forbid_guest_writes()) is not None:
+        return resp
+    user_id = _effective_user_id()
+    body = request.get_json(silent=True) or {}
+
+    operations = body.get("operations")
+    if not isinstance(operations, list) or not operations:
+        return validation_error({"operations": "operations must be a non-empty list"})
+    if len(operations) > _MAX_BATCH_OPERATIONS:
+        return validation_error({"operations": f"At most {_MAX_BATCH_OPERATIONS} operations per request"})
+
+    errors = _validate_batch_operations(operations)
+    if errors:
+        return validation_error(errors)
+
+    names = {op["data"]["name"].strip() for op in operations if op["op"] != "delete"}
+    ids = {op["id"] for op in operations if op["op"] != "create"}
+    rows = Schedule.query.filter(
+        Schedule.user_id == user_id,
+        or_(Schedule.name.in_(names), Schedule.id.in_(ids)),
+    ).all()
+    by_id = {row.id: row for row in rows}
+
+    # Replay the batch against the names it can touch, in request order.
+    holders = {row.name: row.id for row in rows}
+    current_name = {row.id: row.name for row in rows}
+    for index, op in enumerate(operations):
+        prefix = f"operations[{index}]"
+        if op["op"] != "create" and op["id"] not in current_name:
+            errors[f"{prefix}.id"] = "Schedule not found"
+            continue
+        if op["op"] == "delete":
+            holders.pop(current_name.pop(op["id"]), None)
+            continue
+        name = op["data"]["name"].strip()
+        holder = holders.get(name)
+        if op["op"] == "create":
+            if holder is not None:
+                errors[f"{prefix}.name"] = "Schedule already exists"
+            else:
+                holders[name] = ("new", index)
+        elif holder is not None and holder != op["id"]:
+            errors[f"{prefix}.name"] = "Schedule name already exists"
+        else:
+            holders.pop(current_name[op["id"]], None)
+            holders[name] = op["id"]
+            current_name[op["id"]] = name
+    if errors:
+        return validation_error(errors)
+
+    results = []
+    released = set()
+    for op in operations:
+        if op["op"] == "delete":
+            record = by_id[op["id"]]
+            released.add(record.name)
+            db.session.delete(record)
+            results.append({"op": "delete", "id": op["id"]})
+            continue
+
+        data = op["data"]
+        name = data["name"].strip()
+        if name in released:
+            # The name was freed earlier in this batch; write that change
+            # first so the (user_id, name) constraint sees it.
+            if not _flush_batch():
+                return _batch_conflict()
+            released.clear()
+        start = datetime.strptime(data["start_date"], "%Y-%m-%d").date()
+        if op["op"] == "create":
+            record = Schedule(user_id=user_id, firstdate=start)
+            db.session.add(record)
+        else:
+            record = by_id[op["id"]]
+            if start != record.startdate and start.day != record.startdate.day:
+                record.firstdate = start
+            if record.name != name:
+                released.add(record.name)
+        record.name = name
+        record.amount = data["amount"]
+        record.type = data["type"]
+        record.frequency = data["frequency"]
+        record.startdate = start
+        results.append({"op": op["op"], "record": record})
+
+    if not _flush_batch():
+        return _batch_conflict()
+    for result in results:
+        record = result.pop("record", None)
+        if record is not None:
+            result["id"] = record.id
+            result["data"] = serialize_schedule(record)
+    bump_data_revision(user_id)
+    db.session.commit()
+    return api_ok({"results": results})
+
+
+def _flush_batch() -> bool:
+    """Flush a batch's pending writes; roll back and return False on a name clash.
+
+    A concurrent request may have taken one of the names after the batch was
+    checked, which the (user_id, name) constraint reports on any flush.
+    """
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        return False
+    return True
+
+
+def _batch_conflict():
+    return validation_error({"operations": "Schedule names changed concurrently; retry the batch"})
+
+
+def _projections_payload(user_id: int, horizon_days=None, encoding="objects") -> dict:
+    _balance, _amount_value, _trans, run, run_scenario = _project_data(user_id, horizon_days)
+    if encoding == "columnar":
+        return {
+            "encoding": "columnar",
+            "schedule": serialize_series_columnar(run) or {
+                "start_date": None, "day_offsets": [], "amounts_cents": [],
+            },
+            "scenario": serialize_series_columnar(run_scenario),
+        }
+
+    return {"schedule": serialize_series(run) or [], "scenario": serialize_series(run_scenario)}
+
+
 @api.route("/projections", methods=["GET"])
 @api_login_required
 def api_projections():
     user_id = _effective_user_id()
-    _balance, _amount_value, _trans, run, run_scenario = _project_data(user_id)
+    errors, horizon_days = _parse_horizon()
+    encoding = request.args.get("encoding", "objects")
+    if encoding not in _PROJECTION_ENCODINGS:
+        errors = {**(errors or {}), "encoding": "encoding must be one of: " + ", ".join(_PROJECTION_ENCODINGS)}
+    if errors:
+        return validation_error(errors)
+    etag = _projection_etag(user_id, "projections", encoding, horizon_days=horizon_days)
+    if (resp := not_modified(etag)) is not None:
+        return resp
+    return with_etag(api_ok(_projections_payload(user_id, horizon_days, encoding)), etag)
 
-    def _series(df):
-        if df is None or df.empty:
-            return None
-        return [{"date": _date(row.date), "amount": _amount(row.amount)} for row in df.itertuples(index=False)]
 
-    return api_ok({"schedule": _series(run) or [], "scenario": _series(run_scenario)})
+def _series_rows(points, series: str):
+    for day, cents in points:
+        yield series, _date(day), _cents(cents)
 
 
-@api.route("/scenarios", methods=["GET"])
+def _projection_export_chunks(user_id: int, horizon_days, fmt: str):
+    """Yield the export in chunks of ``_EXPORT_CHUNK_ROWS`` lines.
+
+    The header goes out before anything is loaded.  Points come from
+    ``iter_balances``, which computes the running balance as it is consumed,
+    so each chunk is sent as soon as its rows are projected and neither the
+    series nor the response is ever held in memory as a whole.
+    """
+    if fmt == "csv":
+        yield "series,date,amount\n"
+    else:
+        meta = {"horizon_days": horizon_days, "generated_at": _datetime(datetime.now(timezone.utc))}
+        yield json.dumps({"meta": meta}) + "\n"
+
+    balance, schedules, holds, skips, scenarios = _load_user_rows(user_id)
+    amount = getattr(balance, "amount", None)
+    rows = _series_rows(iter_balances(amount, schedules, holds, skips, horizon_days=horizon_days), "schedule")
+    if scenarios:
+        rows = chain(rows, _series_rows(
+            iter_balances(amount, schedules, holds, skips, scenarios, horizon_days=horizon_days), "scenario"
+        ))
+    while chunk := list(islice(rows, _EXPORT_CHUNK_ROWS)):
+        if fmt == "csv":
+            yield "".join(f"{series},{day},{amount}\n" for series, day, amount in chunk)
+        else:
+            yield "".join(
+                json.dumps({"series": series, "date": day, "amount": amount}) + "\n"
+                for series, day, amount in chunk
+            )
+
+
+@api.route("/projections/export", methods=["GET"])
 @api_login_required
-def api_scenarios():
+def api_projections_export():
+    """Stream the projection series as NDJSON (default) or CSV."""
     user_id = _effective_user_id()
-    errors, limit, offset = _parse_limit_offset()
+    errors, horizon_days = _parse_horizon()
+    fmt = request.args.get("format", "ndjson").lower()
+    if fmt not in _EXPORT_MIMETYPES:
+        errors = {**(errors or {}), "format": "format must be one of: " + ", ".join(_EXPORT_MIMETYPES)}
     if errors:
         return validation_error(errors)
 
-    query = Scenario.query.filter_by(user_id=user_id).order_by(Scenario.id.asc())
-    if limit is not None:
-        total = query.count()
-        query = query.limit(limit).offset(offset)
-    else:
-        total = None
+    response = Response(
+        stream_with_context(_projection_export_chunks(user_id, horizon_days, fmt)),
+        mimetype=_EXPORT_MIMETYPES[fmt],
+    )
+    response.headers["Cache-Control"] = "private, no-store"
+    # Ask nginx-style proxies to pass chunks through instead of buffering.
+    response.headers["X-Accel-Buffering"] = "no"
+    if fmt == "csv":
+        response.headers["Content-Disposition"] = "attachment; filename=projection_export.csv"
+    return response
+
 
-    items = [serialize_scenario(s) for s in query.all()]
-    if total is None:
-        total = len(items)
-    return api_list(items, total=total, limit=limit, offset=offset)
+@api.route("/scenarios", methods=["GET"])
+@api_login_required
+def api_scenarios():
+    return _paginated_list(
+        "scenarios",
+        Scenario.query.filter_by(user_id=_effective_user_id()),
+        (Scenario.id,),
+        serialize_scenario,
+        key_types=(int,),
+    )
 
 
 @api.route("/scenarios", methods=["POST"])
@@ -392,6 +739,7 @@ def api_create_scenario():
         firstdate=start,
     )
     db.session.add(record)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_created(serialize_scenario(record))
 
@@ -425,6 +773,7 @@ def api_update_scenario(scenario_id: int):
     record.type = body["type"]
     record.frequency = body["frequency"]
     record.startdate = start
+    bump_data_revision(user_id)
     db.session.commit()
     return api_ok(serialize_scenario(record))
 
@@ -439,6 +788,7 @@ def api_delete_scenario(scenario_id: int):
     if not record:
         return not_found("Scenario not found")
     db.session.delete(record)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_no_content()
 
@@ -446,22 +796,13 @@ def api_delete_scenario(scenario_id: int):
 @api.route("/holds", methods=["GET"])
 @api_login_required
 def api_holds():
-    user_id = _effective_user_id()
-    errors, limit, offset = _parse_limit_offset()
-    if errors:
-        return validation_error(errors)
-
-    query = Hold.query.filter_by(user_id=user_id).order_by(Hold.id.asc())
-    if limit is not None:
-        total = query.count()
-        query = query.limit(limit).offset(offset)
-    else:
-        total = None
-
-    items = [serialize_hold(h) for h in query.all()]
-    if total is None:
-        total = len(items)
-    return api_list(items, total=total, limit=limit, offset=offset)
+    return _paginated_list(
+        "holds",
+        Hold.query.filter_by(user_id=_effective_user_id()),
+        (Hold.id,),
+        serialize_hold,
+        key_types=(int,),
+    )
 
 
 @api.route("/holds", methods=["POST"])
@@ -482,6 +823,7 @@ def api_create_hold():
 
     hold = Hold(name=schedule.name, type=schedule.type, amount=schedule.amount, user_id=user_id)
     db.session.add(hold)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_created(serialize_hold(hold))
 
@@ -497,6 +839,7 @@ def api_delete_hold(hold_id: int):
     if not hold:
         return not_found("Hold not found")
     db.session.delete(hold)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_no_content()
 
@@ -508,7 +851,8 @@ def api_clear_holds():
         return resp
 
     user_id = _effective_user_id()
-    Hold.query.filter_by(user_id=user_id).delete()
+    delete_with_tombstones(Hold, Hold.user_id == user_id)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_no_content()
 
@@ -516,22 +860,13 @@ def api_clear_holds():
 @api.route("/skips", methods=["GET"])
 @api_login_required
 def api_skips():
-    user_id = _effective_user_id()
-    errors, limit, offset = _parse_limit_offset()
-    if errors:
-        return validation_error(errors)
-
-    query = Skip.query.filter_by(user_id=user_id).order_by(Skip.id.asc())
-    if limit is not None:
-        total = query.count()
-        query = query.limit(limit).offset(offset)
-    else:
-        total = None
-
-    items = [serialize_skip(s) for s in query.all()]
-    if total is None:
-        total = len(items)
-    return api_list(items, total=total, limit=limit, offset=offset)
+    return _paginated_list(
+        "skips",
+        Skip.query.filter_by(user_id=_effective_user_id()),
+        (Skip.id,),
+        serialize_skip,
+        key_types=(int,),
+    )
 
 
 @api.route("/skips", methods=["POST"])
@@ -580,6 +915,7 @@ def api_create_skip():
         user_id=user_id,
     )
     db.session.add(skip)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_created(serialize_skip(skip))
 
@@ -595,6 +931,7 @@ def api_delete_skip(skip_id: int):
     if not skip:
         return not_found("Skip not found")
     db.session.delete(skip)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_no_content()
 
@@ -606,7 +943,8 @@ def api_clear_skips():
         return resp
 
     user_id = _effective_user_id()
-    Skip.query.filter_by(user_id=user_id).delete()
+    delete_with_tombstones(Skip, Skip.user_id == user_id)
+    bump_data_revision(user_id)
     db.session.commit()
     return api_no_content()
 
@@ -615,10 +953,13 @@ def api_clear_skips():
 @api_login_required
 def api_transactions():
     user_id = _effective_user_id()
-    _balance, _balance_amount, trans, _run, _run_scenario = _project_data(user_id)
     errors, limit, offset = _parse_limit_offset()
     if errors:
         return validation_error(errors)
+    etag = _projection_etag(user_id, "transactions", limit, offset)
+    if (resp := not_modified(etag)) is not None:
+        return resp
+    _balance, _balance_amount, trans, _run, _run_scenario = _project_data(user_id)
 
     items = []
     if not trans.empty:
@@ -629,17 +970,20 @@ def api_transactions():
     if limit is not None:
         items = items[offset:offset + limit]
 
-    return api_list(items, total=total, limit=limit, offset=offset)
+    return with_etag(api_list(items, total=total, limit=limit, offset=offset), etag)
 
 
 @api.route("/risk-score", methods=["GET"])
 @api_login_required
 def api_risk_score():
     user_id = _effective_user_id()
+    etag = _projection_etag(user_id, "risk-score")
+    if (resp := not_modified(etag)) is not None:
+        return resp
     _balance, balance_amount, _trans, run, _run_scenario = _project_data(user_id)
     raw = calculate_cash_risk_score(balance_amount, run)
 
-    return api_ok({
+    return with_etag(api_ok({
         "score": raw["score"],
         "status": raw["status"],
         "color": raw["color"],
@@ -651,20 +995,20 @@ def api_risk_score():
         "pct_below_threshold": raw["pct_below_threshold"],
         "recovery_days": raw["recovery_days"],
         "near_term_buffer": _amount(raw["near_term_buffer"]),
-    })
+    }), etag)
+
+
+def _balance_payload(balance) -> dict:
+    if balance:
+        return serialize_balance(balance)
+    todaydate = datetime.today().date()
+    return {"id": None, "amount": _amount(0), "date": _date(todaydate)}
 
 
 @api.route("/balance", methods=["GET"])
 @api_login_required
 def api_balance():
-    user_id = _effective_user_id()
-    balance = _latest_balance(user_id)
-
-    if balance:
-        return api_ok(serialize_balance(balance))
-
-    todaydate = datetime.today().date()
-    return api_ok({"id": None, "amount": _amount(0), "date": _date(todaydate)})
+    return api_ok(_balance_payload(_latest_balance(_effective_user_id())))
 
 
 @api.route("/balance", methods=["POST"])
@@ -689,12 +1033,14 @@ def api_set_balance():
     if existing is not None:
         existing.amount = body["amount"]
         record_manual_balance_entry(owner)
+        bump_data_revision(user_id)
         db.session.commit()
         return api_ok(serialize_balance(existing))
     balance = Balance(user_id=user_id, amount=body["amount"], date=balance_date)
     db.session.add(balance)
     record_manual_balance_entry(owner)
     try:
+        bump_data_revision(user_id)
         db.session.commit()
     except IntegrityError:
         # A concurrent request inserted a row for the same (user_id, date)
@@ -705,6 +1051,7 @@ def api_set_balance():
             raise
         existing.amount = body["amount"]
         record_manual_balance_entry(owner)
+        bump_data_revision(user_id)
         db.session.commit()
         return api_ok(serialize_balance(existing))
     return api_created(serialize_balance(balance))
@@ -713,30 +1060,43 @@ def api_set_balance():
 @api.route("/balance/history", methods=["GET"])
 @api_login_required
 def api_balance_history():
-    user_id = _effective_user_id()
-    errors, limit, offset = _parse_limit_offset()
-    if errors:
-        return validation_error(errors)
-
-    query = Balance.query.filter_by(user_id=user_id).order_by(desc(Balance.date), desc(Balance.id))
-    if limit is not None:
-        total = query.count()
-        query = query.limit(limit).offset(offset)
-    else:
-        total = None
-
-    items = [serialize_balance(b) for b in query.all()]
-    if total is None:
-        total = len(items)
-    return api_list(items, total=total, limit=limit, offset=offset)
+    # Newest first; keyset pages walk ix_balance_user_id_date_id backwards.
+    return _paginated_list(
+        "balances",
+        Balance.query.filter_by(user_id=_effective_user_id()),
+        (Balance.date, Balance.id),
+        serialize_balance,
+        key_types=(date, int),
+        descending=True,
+    )
 
 
-@api.route("/settings", methods=["GET"])
+@api.route("/sync", methods=["GET"])
 @api_login_required
-def api_settings():
-    user = get_api_user()
+def api_sync():
+    """Rows changed and ids deleted since ``cursor``; omit it for a full snapshot."""
     user_id = _effective_user_id()
+    since = None
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            since = decode_cursor(cursor)
+        except ValueError:
+            return validation_error({"cursor": "cursor is not a valid sync cursor"})
 
+    result = changes_since(user_id, since)
+    return api_ok({
+        "cursor": result["cursor"],
+        "full": result["full"],
+        "changes": {
+            kind: [_SYNC_SERIALIZERS[kind](row) for row in rows]
+            for kind, rows in result["changes"].items()
+        },
+        "deleted": result["deleted"],
+    })
+
+
+def _settings_payload(user, ai_config) -> dict:
     about = version()
     try:
         parts = about.split("::")
@@ -746,10 +1106,9 @@ def api_settings():
         app_version = about.strip()
         py_version = ""
 
-    ai_config = AISettings.query.filter_by(user_id=user_id).first()
     provider = select_provider(ai_config)
     provider_kind = provider["kind"] if provider else None
-    return api_ok({
+    return {
         "user": {
             "id": user.id,
             "email": user.email,
@@ -768,7 +1127,47 @@ def api_settings():
             "model": ai_config.model_version if ai_config else None,
             "last_updated": _datetime(ai_config.last_updated) if ai_config else None,
         },
-    })
+    }
+
+
+@api.route("/settings", methods=["GET"])
+@api_login_required
+def api_settings():
+    ai_config = AISettings.query.filter_by(user_id=_effective_user_id()).first()
+    return api_ok(_settings_payload(get_api_user(), ai_config))
+
+
+@api.route("/bootstrap", methods=["GET"])
+@api_login_required
+def api_bootstrap():
+    """Everything the mobile app renders on launch, in one response.
+
+    Equivalent to ``/dashboard``, ``/projections``, ``/schedules``,
+    ``/scenarios``, ``/holds``, ``/skips``, ``/balance`` and ``/settings``
+    (unpaginated, default horizon), built from a single load of the user's
+    rows and a single projection run.
+    """
+    user = get_api_user()
+    user_id = _effective_user_id()
+    safe_update_plaid_balance_for_user(_balance_owner_user())
+
+    ai_config = AISettings.query.filter_by(user_id=user_id).first()
+    settings = _settings_payload(user, ai_config)
+    etag = _projection_etag(user_id, "bootstrap", *_dashboard_etag_parts(ai_config), settings)
+    if (resp := not_modified(etag)) is not None:
+        return resp
+
+    balance, schedules, holds, skips, scenarios = _load_user_rows(user_id)
+    return with_etag(api_ok({
+        "dashboard": _dashboard_payload(user_id, ai_config),
+        "projections": _projections_payload(user_id),
+        "schedules": [serialize_schedule(s) for s in schedules],
+        "scenarios": [serialize_scenario(s) for s in scenarios],
+        "holds": [serialize_hold(h) for h in holds],
+        "skips": [serialize_skip(s) for s in skips],
+        "balance": _balance_payload(balance),
+        "settings": settings,
+    }), etag)
 
 
 @api.route("/insights", methods=["GET"])
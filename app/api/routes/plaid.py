@@ -22,7 +22,7 @@ from app.api import api
 from app.api.auth_utils import api_login_required, get_api_user
 from app.api.errors import api_error, forbidden
 from app.api.responses import api_ok, api_no_content
-from app.models import User
+from app.subscription import owner_for_user
 from app.plaid_service import (
     PlaidServiceError,
     create_link_token_for_user,
@@ -37,11 +37,7 @@ from app.plaid_service import (
 
 def _balance_owner_user():
     """Return the user object whose balance is the source of truth."""
-    user = get_api_user()
-    effective_id = user.owner_user_id or user.account_owner_id or user.id
-    if effective_id == user.id:
-        return user
-    return User.query.get(effective_id)
+    return owner_for_user(get_api_user())
 
 
 def _service_error(exc: PlaidServiceError):
@@ -8,11 +8,20 @@ required — conversion rules follow the conventions in ``API_CONVENTIONS.md``:
 - Datetimes   → ISO 8601 UTC string ``"YYYY-MM-DDTHH:MM:SSZ"``
 - Amounts     → string with 2 decimal places ``"1234.56"``
   (avoids floating-point representation errors for currency)
+
+Projection series are formatted from the frames' ``int64`` ``amount_cents``
+column (see ``app.money``).  ``serialize_series_columnar`` is the opt-in
+compact form for long series: a base date plus integer day offsets and
+integer-cent amounts, converted column-at-a-time rather than per point.
 """
 
 from decimal import Decimal
 from datetime import date, datetime, timezone
 
+import numpy as np
+import pandas as pd
+
+from app.money import format_cents, frame_cents
 from app.subscription import get_effective_subscription
 
 # ── Primitive converters ──────────────────────────────────────────────────────
@@ -43,6 +52,13 @@ def _amount(value) -> str | None:
     return f"{Decimal(str(value)):.2f}"
 
 
+def _cents(value) -> str | None:
+    """Format integer cents as a 2-decimal-place string, or ``None``."""
+    if value is None:
+        return None
+    return format_cents(value)
+
+
 # ── Model serializers ─────────────────────────────────────────────────────────
 
 def serialize_user(user) -> dict:
@@ -118,3 +134,31 @@ def serialize_skip(skip) -> dict:
         "amount": _amount(skip.amount),
         "type": skip.type,
     }
+
+
+def serialize_series(df) -> list[dict] | None:
+    """Encode a projection frame as ``[{"date", "amount"}, ...]`` points,
+    or ``None`` for a missing/empty frame."""
+    if df is None or df.empty:
+        return None
+    return [
+        {"date": _date(day), "amount": format_cents(cents)}
+        for day, cents in zip(df["date"], frame_cents(df).tolist())
+    ]
+
+
+def serialize_series_columnar(df) -> dict | None:
+    """Encode a projection frame (``date``/``amount`` columns) column-wise.
+
+    Returns ``{"start_date", "day_offsets", "amounts_cents"}`` — point *i* is
+    ``start_date + day_offsets[i]`` days with balance ``amounts_cents[i] / 100``
+    — or ``None`` for a missing/empty frame.
+    """
+    if df is None or df.empty:
+        return None
+    days = pd.to_datetime(df["date"]).to_numpy().astype("datetime64[D]")
+    return {
+        "start_date": str(days[0]),
+        "day_offsets": (days - days[0]).astype(np.int64).tolist(),
+        "amounts_cents": frame_cents(df).tolist(),
+    }
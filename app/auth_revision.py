@@ -0,0 +1,92 @@
+"""Per-user auth revision counter and bearer-token verification cache.
+
+``User.auth_revision`` is bumped whenever any of a user's API tokens is
+revoked (logout, refresh, password change or setup).  ``token_cache`` keeps
+recently verified tokens per process as ``token_hash -> (user_id,
+expires_at, auth_revision)``; app/api/auth_utils.py serves a cached token
+only while the user row it loads for the request still carries the cached
+revision, so a revocation in one worker is honoured by every other worker on
+its next request without a shared cache.
+
+Like ``bump_data_revision`` the increment is an atomic ``UPDATE ... SET
+auth_revision = auth_revision + 1``; the caller commits.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import update
+
+from app import db
+from app.models import User, UserToken
+
+
+_TOKEN_CACHE_SIZE = 1024
+_TOKEN_CACHE_TTL_SECONDS = 300
+
+
+class _TokenCache:
+    """Bounded, thread-safe TTL cache of verified bearer tokens."""
+
+    def __init__(self, maxsize=_TOKEN_CACHE_SIZE, ttl=_TOKEN_CACHE_TTL_SECONDS):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def get(self, token_hash):
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                return None
+            cached_at, value = entry
+            if time.monotonic() - cached_at > self.ttl:
+                del self._entries[token_hash]
+                return None
+            self._entries.move_to_end(token_hash)
+            return value
+
+    def put(self, token_hash, user_id, expires_at, auth_revision):
+        with self._lock:
+            self._entries[token_hash] = (time.monotonic(), (user_id, expires_at, auth_revision))
+            self._entries.move_to_end(token_hash)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, token_hash):
+        with self._lock:
+            self._entries.pop(token_hash, None)
+
+    def discard_user(self, user_id):
+        with self._lock:
+            stale = [key for key, (_, value) in self._entries.items() if value[0] == user_id]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = _TokenCache()
+
+
+def bump_auth_revision(user_id: int) -> None:
+    """Increment *user_id*'s auth revision; the caller commits."""
+    db.session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(auth_revision=User.auth_revision + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def revoke_user_tokens(user_id: int) -> None:
+    """Delete every API token of *user_id* and invalidate cached lookups.
+
+    The caller commits (together with e.g. the password change).
+    """
+    token_cache.discard_user(user_id)
+    bump_auth_revision(user_id)
+    UserToken.query.filter_by(user_id=user_id).delete(synchronize_session=False)
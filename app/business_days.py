@@ -0,0 +1,197 @@
+"""Business-day calendar used to land projected occurrences on banking days.
+
+Projection dates are rolled off non-business days in bulk.  Instead of asking
+pandas or ``np.busday_offset`` to search for the next business day for every
+occurrence, a ``BusinessCalendar`` precomputes, per covered year, a bitmap of
+business days together with "next" and "previous" business-day lookup tables,
+so rolling a whole occurrence array is a single indexing operation.
+
+Deployments can plug in a bank-holiday list so paydays land on the day the
+money actually moves:
+
+- ``HOLIDAY_CALENDAR=us_federal_reserve`` — US Federal Reserve holidays.
+- ``HOLIDAY_DATES=2026-12-24,2026-12-31`` — extra one-off closures.
+
+The default (``none``) treats every weekday as a business day, which matches
+the historical weekend-only rolling.  Calendars are built once and shared by
+every request in the process.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+
+_WEEKMASK = '1111100'
+# Tables are built for whole years, padded on both sides so every day in the
+# requested range has a business day before and after it.
+_YEAR_PADDING = 1
+
+
+def _nth_weekday(year, month, weekday, n):
+    """Return the *n*-th *weekday* ('Mon', 'Thu', ...) of a month; n=-1 is the last."""
+    if n > 0:
+        first = np.datetime64(f'{year:04d}-{month:02d}-01')
+        return np.busday_offset(first, n - 1, roll='forward', weekmask=weekday)
+    following = np.datetime64(f'{year:04d}-{month:02d}', 'M') + 1
+    return np.busday_offset(following.astype('datetime64[D]'), n, roll='forward', weekmask=weekday)
+
+
+def _observed_sunday_to_monday(day):
+    """Federal Reserve rule: a Sunday holiday is observed on Monday; Saturday ones are not moved."""
+    return day + 1 if day.astype(object).weekday() == 6 else day
+
+
+def us_federal_reserve_holidays(year):
+    """Return the US Federal Reserve bank holidays observed in *year*."""
+    fixed = [
+        np.datetime64(f'{year:04d}-01-01'),
+        np.datetime64(f'{year:04d}-07-04'),
+        np.datetime64(f'{year:04d}-11-11'),
+        np.datetime64(f'{year:04d}-12-25'),
+    ]
+    if year >= 2021:
+        fixed.append(np.datetime64(f'{year:04d}-06-19'))
+    floating = [
+        _nth_weekday(year, 1, 'Mon', 3),    # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 'Mon', 3),    # Washington's Birthday
+        _nth_weekday(year, 5, 'Mon', -1),   # Memorial Day
+        _nth_weekday(year, 9, 'Mon', 1),    # Labor Day
+        _nth_weekday(year, 10, 'Mon', 2),   # Columbus Day
+        _nth_weekday(year, 11, 'Thu', 4),   # Thanksgiving Day
+    ]
+    return [_observed_sunday_to_monday(d) for d in fixed] + floating
+
+
+HOLIDAY_CALENDARS = {
+    'none': lambda year: [],
+    'us_federal_reserve': us_federal_reserve_holidays,
+}
+
+
+class BusinessCalendar:
+    """Weekday/holiday bitmap with vectorized roll-forward and rollback.
+
+    Lookup tables are extended (under a lock) whenever a date outside the
+    covered years is rolled, so callers never need to size them up front.
+    """
+
+    def __init__(self, holiday_rule=None, extra_holidays=()):
+        self._holiday_rule = holiday_rule or HOLIDAY_CALENDARS['none']
+        self._extra_holidays = np.array(sorted(extra_holidays), dtype='datetime64[D]')
+        self._lock = threading.Lock()
+        self._origin = None
+        self._end = None
+        self._is_business = None
+        self._forward = None
+        self._backward = None
+
+    def _build(self, first_year, last_year):
+        origin = np.datetime64(f'{first_year:04d}-01-01')
+        end = np.datetime64(f'{last_year + 1:04d}-01-01')
+        holidays = [d for year in range(first_year, last_year + 1) for d in self._holiday_rule(year)]
+        holidays = np.concatenate(
+            [np.array(holidays, dtype='datetime64[D]'), self._extra_holidays]
+        )
+        days = np.arange(origin, end, dtype='datetime64[D]')
+        is_business = np.is_busday(days, weekmask=_WEEKMASK, holidays=holidays)
+
+        positions = np.arange(days.size)
+        forward = np.where(is_business, positions, days.size)
+        forward = np.minimum.accumulate(forward[::-1])[::-1]
+        backward = np.maximum.accumulate(np.where(is_business, positions, -1))
+
+        self._origin, self._end = origin, end
+        self._is_business = is_business
+        self._forward, self._backward = forward, backward
+
+    def _tables(self, dates):
+        """Return lookup tables covering every (non-NaT) value of *dates*."""
+        valid = dates[~np.isnat(dates)]
+        if valid.size == 0:
+            return None
+        low, high = valid.min(), valid.max()
+        with self._lock:
+            if self._origin is None or low < self._origin or high >= self._end:
+                first_year = int(low.astype('datetime64[Y]').astype(int)) + 1970 - _YEAR_PADDING
+                last_year = int(high.astype('datetime64[Y]').astype(int)) + 1970 + _YEAR_PADDING
+                if self._origin is not None:
+                    first_year = min(first_year, int(self._origin.astype('datetime64[Y]').astype(int)) + 1970)
+                    last_year = max(last_year, int(self._end.astype('datetime64[Y]').astype(int)) + 1969)
+                self._build(first_year, last_year)
+            return self._origin, self._is_business, self._forward, self._backward
+
+    def _roll(self, dates, direction):
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        tables = self._tables(dates)
+        if tables is None:
+            return dates.copy()
+        origin, _is_business, forward, backward = tables
+        table = forward if direction == 'forward' else backward
+        nat = np.isnat(dates)
+        offsets = np.where(nat, 0, (dates - origin).astype(np.int64))
+        return np.where(nat, dates, origin + table[offsets])
+
+    def roll_forward(self, dates):
+        """Move each non-business day to the next business day."""
+        return self._roll(dates, 'forward')
+
+    def roll_backward(self, dates):
+        """Move each non-business day to the preceding business day."""
+        return self._roll(dates, 'backward')
+
+    def is_business_day(self, dates):
+        """Return a boolean array flagging business days in *dates*."""
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        tables = self._tables(dates)
+        if tables is None:
+            return np.zeros(dates.shape, dtype=bool)
+        origin, is_business, _forward, _backward = tables
+        nat = np.isnat(dates)
+        offsets = np.where(nat, 0, (dates - origin).astype(np.int64))
+        return np.where(nat, False, is_business[offsets])
+
+
+def parse_holiday_dates(value):
+    """Parse a comma-separated ``YYYY-MM-DD`` list into a tuple of dates.
+
+    Raises:
+        ValueError: if any entry is not a valid ISO date.
+    """
+    return tuple(
+        date.fromisoformat(part.strip()) for part in (value or '').split(',') if part.strip()
+    )
+
+
+@lru_cache(maxsize=16)
+def get_business_calendar(name='none', extra_holidays=()):
+    """Return the shared ``BusinessCalendar`` for a holiday set.
+
+    Raises:
+        ValueError: if *name* is not a known holiday calendar.
+    """
+    key = (name or 'none').strip().lower()
+    if key not in HOLIDAY_CALENDARS:
+        raise ValueError(
+            f"Unknown holiday calendar {name!r}; expected one of {sorted(HOLIDAY_CALENDARS)}"
+        )
+    return BusinessCalendar(HOLIDAY_CALENDARS[key], tuple(extra_holidays))
+
+
+_default_calendar = get_business_calendar()
+
+
+def configure_business_calendar(name='none', extra_holidays=()):
+    """Select the process-wide calendar used by projections."""
+    global _default_calendar
+    _default_calendar = get_business_calendar(name, tuple(extra_holidays))
+    return _default_calendar
+
+
+def default_business_calendar():
+    """Return the process-wide calendar selected by ``configure_business_calendar``."""
+    return _default_calendar
@@ -1,18 +1,19 @@
 from app import db
 from .models import Schedule, Skip
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
+import heapq
+from operator import itemgetter
 import pandas as pd
 import json
-import plotly
 import os
 from dateutil.relativedelta import relativedelta
-from natsort import index_natsorted
 import numpy as np
-import decimal
-import plotly.graph_objs as go
+from .recurrence import expand_occurrences, iter_occurrences
+from .chart_series import chart_payload
+from .money import cents_array, cents_to_amounts, frame_cents, to_cents
 
 
-def update_cash(balance, schedules, holds, skips, scenarios=None, commit=True):
+def update_cash(balance, schedules, holds, skips, scenarios=None, commit=True, horizon_days=None):
     """
     Calculate cash flow with pre-filtered user data
 
@@ -24,7 +25,11 @@ def update_cash(balance, schedules, holds, skips, scenarios=None, commit=True):
         scenarios: List of Scenario objects (pre-filtered for user), optional
         commit: If True (default), persist housekeeping changes (date advances,
                 one-time deletions) to the database.  Pass False for read-only
-                callers such as GET API endpoints.
+                callers such as GET API endpoints; the batch job in
+                app/housekeeping.py applies the same changes for all users.
+        horizon_days: Project every occurrence up to this many days ahead
+                (30 days to 10 years) instead of the fixed per-frequency
+                occurrence counts.  None (default) keeps the fixed counts.
 
     Returns:
         trans: DataFrame of upcoming transactions
@@ -32,544 +37,581 @@ def update_cash(balance, schedules, holds, skips, scenarios=None, commit=True):
         run_scenario: DataFrame of running balance projections (schedules + scenarios),
                       or None if no scenarios provided
     """
-    total, total_scenario = calc_schedule(schedules, holds, skips, scenarios or [], commit=commit)
+    schedule_columns, scenario_columns, hold_columns, skip_columns = _schedule_columns(
+        schedules, holds, skips, scenarios or [], commit=commit, horizon_days=horizon_days
+    )
+    total = _columns_frame(_concat_columns(schedule_columns, hold_columns, skip_columns))
 
     trans, run = calc_transactions(balance, total)
 
+    # Scenarios are layered over the base projection instead of re-running
+    # calc_transactions over a schedules + scenarios copy of every row.
     run_scenario = None
     if scenarios:
-        _, run_scenario = calc_transactions(balance, total_scenario)
+        run_scenario = calc_scenario_overlay(run, _columns_frame(scenario_columns))
 
     return trans, run, run_scenario
 
 
-def _fast_forward_start(startdate_str, window_delta, step_delta, todaydate,
-                        fmt='%Y-%m-%d'):
-    """Advance *startdate_str* by whole *step_delta* increments until the
-    projection window (*start + window_delta*) extends past *todaydate*.
+_MONTH_STEP_DELTAS = {
+    'Monthly': relativedelta(months=1),
+    'Quarterly': relativedelta(months=3),
+    'Yearly': relativedelta(years=1),
+    'Weekly': relativedelta(weeks=1),
+    'BiWeekly': relativedelta(weeks=2),
+}
 
-    Returns the (possibly advanced) start-date string.  This ensures that
-    ``commit=False`` callers still produce future projection points even when
-    the persisted start date has not been advanced in a long time.
-    """
-    start = datetime.strptime(startdate_str, fmt).date()
-    for _ in range(5000):                  # generous upper bound (~400 years monthly)
-        if start + window_delta > todaydate:
-            return start.strftime(fmt)
-        start += step_delta
-    return start.strftime(fmt)
 
+def _advanced_startdate(futuredate, frequency, firstdateday):
+    """Return the start date that follows the already-passed *futuredate*.
 
-def calc_schedule(schedules, holds, skips, scenarios=None, commit=True):
+    Monthly and quarterly schedules walk a month-end-shortened day back
+    towards the day of ``firstdate`` (at most three days), exactly as the
+    projection does for each occurrence.
     """
-    Process schedules, holds, and skips into projected transactions.
-    Also processes scenarios into a combined schedule+scenario projection.
+    nextdate = futuredate + _MONTH_STEP_DELTAS[frequency]
+    if frequency not in ('Monthly', 'Quarterly'):
+        return nextdate
+    daycheck = nextdate.day
+    advanced = nextdate
+    if firstdateday > daycheck:
+        try:
+            for m in range(3):
+                daycheck += 1
+                if firstdateday >= daycheck:
+                    advanced = nextdate.replace(day=daycheck)
+        except ValueError:
+            pass
+    return advanced
+
+
+def _housekeep_items(items, last_past, todaydate, delete_past_onetime):
+    """Apply start-date bookkeeping to expanded Schedule/Scenario rows.
+
+    *last_past* is the ``last_past`` array returned by ``expand_occurrences``
+    for the same *items*.  Changes are left in the session for the caller to
+    commit.
+    """
+    advance = datetime.today().weekday() < 5
+    for item, last in zip(items, last_past.astype(object)):
+        if not item.startdate:
+            continue
+        if not item.firstdate:
+            item.firstdate = item.startdate
+        if item.frequency == 'Onetime':
+            if delete_past_onetime and item.startdate < todaydate:
+                db.session.delete(item)
+        elif advance and last is not None:
+            item.startdate = _advanced_startdate(last, item.frequency, item.firstdate.day)
 
-    Args:
-        schedules: List of Schedule objects (pre-filtered for user)
-        holds: List of Hold objects (pre-filtered for user)
-        skips: List of Skip objects (pre-filtered for user)
-        scenarios: List of Scenario objects (pre-filtered for user), optional
-        commit: If True (default), persist housekeeping changes to the database.
 
-    Returns:
-        Tuple of (total, total_scenario) DataFrames:
-            total: schedules + holds + skips only
-            total_scenario: schedules + scenarios + holds + skips
-    """
-    if scenarios is None:
-        scenarios = []
+def _expand_items(items, todaydate, commit, delete_past_onetime, horizon_days=None):
+    """Expand Schedule/Scenario rows into occurrence columns.
 
-    months = 13
-    weeks = 53
-    years = 2
-    quarters = 4
-    biweeks = 27
-
-    # Create lookup dictionaries to avoid re-querying
-    schedule_objects = {s.name: s for s in schedules}
-    scenario_objects = {s.name: s for s in scenarios}
-    skip_objects = {s.name: s for s in skips}
-
-    # Convert schedules to DataFrame
-    if schedules:
-        df = pd.DataFrame([{
-            'name': s.name,
-            'startdate': s.startdate.strftime('%Y-%m-%d') if s.startdate else None,
-            'firstdate': s.firstdate.strftime('%Y-%m-%d') if s.firstdate else None,
-            'frequency': s.frequency,
-            'amount': s.amount,
-            'type': s.type
-        } for s in schedules])
-    else:
-        df = pd.DataFrame(columns=['name', 'startdate', 'firstdate', 'frequency', 'amount', 'type'])
+    With *horizon_days* the occurrences come from the lazy, date-ordered
+    ``iter_occurrences`` stream (upcoming occurrences only) instead of the
+    fixed-count window.
 
-    # Convert scenarios to DataFrame
-    if scenarios:
-        df_scenario = pd.DataFrame([{
-            'name': s.name,
-            'startdate': s.startdate.strftime('%Y-%m-%d') if s.startdate else None,
-            'firstdate': s.firstdate.strftime('%Y-%m-%d') if s.firstdate else None,
-            'frequency': s.frequency,
-            'amount': s.amount,
-            'type': s.type
-        } for s in scenarios])
+    Applies the housekeeping side effects when *commit* is True: missing
+    ``firstdate`` values are filled in, start dates are advanced past
+    occurrences that are already due (weekdays only), and, when
+    *delete_past_onetime* is set, past one-time rows are deleted.
+
+    Returns a dict of ``type``/``name``/``amount``/``date``/``amount_cents``
+    lists; each row's amount is converted to cents once, not per occurrence.
+    """
+    if horizon_days is None:
+        counts, dates, last_past = expand_occurrences(items, todaydate)
+        positions = np.repeat(np.arange(len(items)), counts)
     else:
-        df_scenario = pd.DataFrame(columns=['name', 'startdate', 'firstdate', 'frequency', 'amount', 'type'])
+        stream = list(iter_occurrences(items, todaydate, horizon_days))
+        positions = np.array([position for _day, position in stream], dtype=np.int64)
+        dates = np.array([day for day, _position in stream], dtype='datetime64[D]')
+        if commit:
+            last_past = expand_occurrences(items, todaydate)[2]
+
+    if commit:
+        _housekeep_items(items, last_past, todaydate, delete_past_onetime)
+
+    return {
+        'type': np.array([item.type for item in items], dtype=object)[positions].tolist(),
+        'name': np.array([item.name for item in items], dtype=object)[positions].tolist(),
+        'amount': pd.Series([item.amount for item in items], dtype=None).to_numpy()[positions].tolist(),
+        'date': dates.astype(object).tolist(),
+        'amount_cents': cents_array([item.amount for item in items])[positions].tolist(),
+    }
+
+
+def _skip_date(skip):
+    """Return a Skip row's date, parsing legacy ``YYYY-MM-DD`` strings."""
+    return skip.date if isinstance(skip.date, date) else datetime.strptime(skip.date, '%Y-%m-%d').date()
 
-    total_dict = {}
-    total_dict_scenario = {}
 
-    # Loop through schedules — rows go into BOTH dicts
+def _concat_columns(*parts):
+    """Concatenate column dicts produced by ``_expand_items`` and friends."""
+    columns = {'type': [], 'name': [], 'amount': [], 'date': [], 'amount_cents': []}
+    for part in parts:
+        for key, values in columns.items():
+            values.extend(part[key])
+    return columns
+
+
+def _columns_frame(columns):
+    """Build a projection frame, keeping the legacy empty-frame shape."""
+    if not columns['date']:
+        return pd.DataFrame(columns=['type', 'name', 'amount', 'date'])
+    return pd.DataFrame(columns)
+
+
+def _schedule_columns(schedules, holds, skips, scenarios, commit, horizon_days):
+    """Expand schedules, scenarios, holds and skips into separate column dicts.
+
+    Returns a ``(schedule, scenario, hold, skip)`` tuple of the
+    ``type``/``name``/``amount``/``date``/``amount_cents`` dicts
+    ``_columns_frame`` accepts.
+    """
     todaydate = datetime.today().date()
-    today_weekday = datetime.today().weekday()
-    for i in df.itertuples(index=False):
-        format = '%Y-%m-%d'
-        name = i.name
-        startdate = i.startdate
-        firstdate = i.firstdate
-        frequency = i.frequency
-        amount = i.amount
-        type = i.type
-        existing = schedule_objects.get(name)
-        if not existing:
-            continue
-        if not firstdate:
-            firstdate_val = datetime.strptime(startdate, format).date()
-            if commit:
-                existing.firstdate = firstdate_val
-            firstdate = firstdate_val.strftime(format)
-        if frequency == 'Monthly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(months=months - 1),
-                relativedelta(months=1), todaydate)
-            for k in range(months):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(months=k)
-                futuredateday = futuredate.day
-                firstdateday = datetime.strptime(firstdate, format).date().day
-                if firstdateday > futuredateday:
-                    try:
-                        for m in range(3):
-                            futuredateday += 1
-                            if firstdateday >= futuredateday:
-                                futuredate = futuredate.replace(day=futuredateday)
-                    except ValueError:
-                        pass
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(months=1)
-                        daycheckdate = futuredate + relativedelta(months=1)
-                        daycheck = daycheckdate.day
-                        if firstdateday > daycheck:
-                            try:
-                                for m in range(3):
-                                    daycheck += 1
-                                    if firstdateday >= daycheck:
-                                        existing.startdate = daycheckdate.replace(day=daycheck)
-                            except ValueError:
-                                pass
-                if type == 'Income':
-                    rollbackdate = datetime.combine(futuredate, datetime.min.time())
-                    new_row = {
-                        'type': type,
-                        'name': name,
-                        'amount': amount,
-                        'date': pd.tseries.offsets.BDay(1).rollback(rollbackdate).date()
-                    }
-                    total_dict[len(total_dict)] = new_row
-                    total_dict_scenario[len(total_dict_scenario)] = new_row
-                else:
-                    new_row = {
-                        'type': type,
-                        'name': name,
-                        'amount': amount,
-                        'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                    }
-                    total_dict[len(total_dict)] = new_row
-                    total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'Weekly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(weeks=weeks - 1),
-                relativedelta(weeks=1), todaydate)
-            for k in range(weeks):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(weeks=k)
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(weeks=1)
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                }
-                total_dict[len(total_dict)] = new_row
-                total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'Yearly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(years=years - 1),
-                relativedelta(years=1), todaydate)
-            for k in range(years):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(years=k)
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(years=1)
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                }
-                total_dict[len(total_dict)] = new_row
-                total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'Quarterly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(months=3 * (quarters - 1)),
-                relativedelta(months=3), todaydate)
-            for k in range(quarters):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(months=3 * k)
-                futuredateday = futuredate.day
-                firstdateday = datetime.strptime(firstdate, format).date().day
-                if firstdateday > futuredateday:
-                    try:
-                        for m in range(3):
-                            futuredateday += 1
-                            if firstdateday >= futuredateday:
-                                futuredate = futuredate.replace(day=futuredateday)
-                    except ValueError:
-                        pass
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(months=3)
-                        daycheckdate = futuredate + relativedelta(months=3)
-                        daycheck = daycheckdate.day
-                        if firstdateday > daycheck:
-                            try:
-                                for m in range(3):
-                                    daycheck += 1
-                                    if firstdateday >= daycheck:
-                                        existing.startdate = daycheckdate.replace(day=daycheck)
-                            except ValueError:
-                                pass
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                }
-                total_dict[len(total_dict)] = new_row
-                total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'BiWeekly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(weeks=2 * (biweeks - 1)),
-                relativedelta(weeks=2), todaydate)
-            for k in range(biweeks):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(weeks=2 * k)
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(weeks=2)
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                }
-                total_dict[len(total_dict)] = new_row
-                total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'Onetime':
-            futuredate = datetime.strptime(startdate, format).date()
-            if futuredate < todaydate:
-                if commit:
-                    db.session.delete(existing)
-            else:
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': futuredate
-                }
-                total_dict[len(total_dict)] = new_row
-                total_dict_scenario[len(total_dict_scenario)] = new_row
+
+    # Schedule rows feed both the base and the scenario projection.
+    schedule_columns = _expand_items(
+        schedules, todaydate, commit, delete_past_onetime=True, horizon_days=horizon_days
+    )
     if commit:
         db.session.commit()
 
-    # Loop through scenarios — rows go into total_dict_scenario ONLY.
+    # Scenario rows feed the scenario projection ONLY.
     # Onetime scenarios are NOT auto-deleted when past (user removes them manually).
-    for i in df_scenario.itertuples(index=False):
-        format = '%Y-%m-%d'
-        name = i.name
-        startdate = i.startdate
-        firstdate = i.firstdate
-        frequency = i.frequency
-        amount = i.amount
-        type = i.type
-        existing = scenario_objects.get(name)
-        if not existing:
-            continue
-        if not firstdate:
-            firstdate_val = datetime.strptime(startdate, format).date()
-            if commit:
-                existing.firstdate = firstdate_val
-            firstdate = firstdate_val.strftime(format)
-        if frequency == 'Monthly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(months=months - 1),
-                relativedelta(months=1), todaydate)
-            for k in range(months):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(months=k)
-                futuredateday = futuredate.day
-                firstdateday = datetime.strptime(firstdate, format).date().day
-                if firstdateday > futuredateday:
-                    try:
-                        for m in range(3):
-                            futuredateday += 1
-                            if firstdateday >= futuredateday:
-                                futuredate = futuredate.replace(day=futuredateday)
-                    except ValueError:
-                        pass
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(months=1)
-                        daycheckdate = futuredate + relativedelta(months=1)
-                        daycheck = daycheckdate.day
-                        if firstdateday > daycheck:
-                            try:
-                                for m in range(3):
-                                    daycheck += 1
-                                    if firstdateday >= daycheck:
-                                        existing.startdate = daycheckdate.replace(day=daycheck)
-                            except ValueError:
-                                pass
-                if type == 'Income':
-                    rollbackdate = datetime.combine(futuredate, datetime.min.time())
-                    new_row = {
-                        'type': type,
-                        'name': name,
-                        'amount': amount,
-                        'date': pd.tseries.offsets.BDay(1).rollback(rollbackdate).date()
-                    }
-                    total_dict_scenario[len(total_dict_scenario)] = new_row
-                else:
-                    new_row = {
-                        'type': type,
-                        'name': name,
-                        'amount': amount,
-                        'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                    }
-                    total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'Weekly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(weeks=weeks - 1),
-                relativedelta(weeks=1), todaydate)
-            for k in range(weeks):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(weeks=k)
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(weeks=1)
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                }
-                total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'Yearly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(years=years - 1),
-                relativedelta(years=1), todaydate)
-            for k in range(years):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(years=k)
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(years=1)
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                }
-                total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'Quarterly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(months=3 * (quarters - 1)),
-                relativedelta(months=3), todaydate)
-            for k in range(quarters):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(months=3 * k)
-                futuredateday = futuredate.day
-                firstdateday = datetime.strptime(firstdate, format).date().day
-                if firstdateday > futuredateday:
-                    try:
-                        for m in range(3):
-                            futuredateday += 1
-                            if firstdateday >= futuredateday:
-                                futuredate = futuredate.replace(day=futuredateday)
-                    except ValueError:
-                        pass
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(months=3)
-                        daycheckdate = futuredate + relativedelta(months=3)
-                        daycheck = daycheckdate.day
-                        if firstdateday > daycheck:
-                            try:
-                                for m in range(3):
-                                    daycheck += 1
-                                    if firstdateday >= daycheck:
-                                        existing.startdate = daycheckdate.replace(day=daycheck)
-                            except ValueError:
-                                pass
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                }
-                total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'BiWeekly':
-            startdate = _fast_forward_start(
-                startdate, relativedelta(weeks=2 * (biweeks - 1)),
-                relativedelta(weeks=2), todaydate)
-            for k in range(biweeks):
-                futuredate = datetime.strptime(startdate, format).date() + relativedelta(weeks=2 * k)
-                if futuredate <= todaydate and today_weekday < 5:
-                    if commit:
-                        existing.startdate = futuredate + relativedelta(weeks=2)
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': (futuredate - pd.tseries.offsets.BDay(0)).date()
-                }
-                total_dict_scenario[len(total_dict_scenario)] = new_row
-        elif frequency == 'Onetime':
-            futuredate = datetime.strptime(startdate, format).date()
-            # Past Onetime scenarios are skipped in projection but NOT deleted
-            if futuredate >= todaydate:
-                new_row = {
-                    'type': type,
-                    'name': name,
-                    'amount': amount,
-                    'date': futuredate
-                }
-                total_dict_scenario[len(total_dict_scenario)] = new_row
+    scenario_columns = _expand_items(
+        scenarios, todaydate, commit, delete_past_onetime=False, horizon_days=horizon_days
+    )
     if commit:
         db.session.commit()
 
-    # Add holds to BOTH dicts
-    for hold in holds:
-        new_row = {
-            'type': hold.type,
-            'name': hold.name,
-            'amount': hold.amount,
-            'date': todaydate + relativedelta(days=1)
-        }
-        total_dict[len(total_dict)] = new_row
-        total_dict_scenario[len(total_dict_scenario)] = new_row
+    # Holds land tomorrow.
+    hold_columns = {
+        'type': [hold.type for hold in holds],
+        'name': [hold.name for hold in holds],
+        'amount': [hold.amount for hold in holds],
+        'date': [todaydate + relativedelta(days=1)] * len(holds),
+        'amount_cents': [to_cents(hold.amount) for hold in holds],
+    }
 
-    # Add skips to BOTH dicts
+    # Skips apply to both projections; past skips are purged.
+    skip_columns = {'type': [], 'name': [], 'amount': [], 'date': [], 'amount_cents': []}
     for skip in skips:
-        format = '%Y-%m-%d'
-        skip_date = skip.date if isinstance(skip.date, date) else datetime.strptime(skip.date, format).date()
+        skip_date = _skip_date(skip)
 
         if skip_date < todaydate:
             if commit:
                 db.session.delete(skip)
         else:
-            new_row = {
-                'type': skip.type,
-                'name': skip.name,
-                'amount': skip.amount,
-                'date': skip_date
-            }
-            total_dict[len(total_dict)] = new_row
-            total_dict_scenario[len(total_dict_scenario)] = new_row
+            skip_columns['type'].append(skip.type)
+            skip_columns['name'].append(skip.name)
+            skip_columns['amount'].append(skip.amount)
+            skip_columns['date'].append(skip_date)
+            skip_columns['amount_cents'].append(to_cents(skip.amount))
     if commit:
         db.session.commit()
 
-    total = pd.DataFrame.from_dict(total_dict, orient="index") if total_dict else pd.DataFrame(columns=['type', 'name', 'amount', 'date'])
-    total_scenario = pd.DataFrame.from_dict(total_dict_scenario, orient="index") if total_dict_scenario else pd.DataFrame(columns=['type', 'name', 'amount', 'date'])
+    return schedule_columns, scenario_columns, hold_columns, skip_columns
+
+
+def calc_schedule(schedules, holds, skips, scenarios=None, commit=True, horizon_days=None):
+    """
+    Process schedules, holds, and skips into projected transactions.
+    Also processes scenarios into a combined schedule+scenario projection.
+
+    Occurrences are expanded in bulk by ``app.recurrence.expand_occurrences``,
+    or streamed up to *horizon_days* by ``app.recurrence.iter_occurrences``.
+
+    Args:
+        schedules: List of Schedule objects (pre-filtered for user)
+        holds: List of Hold objects (pre-filtered for user)
+        skips: List of Skip objects (pre-filtered for user)
+        scenarios: List of Scenario objects (pre-filtered for user), optional
+        commit: If True (default), persist housekeeping changes to the database.
+        horizon_days: Optional projection horizon in days (see ``update_cash``).
+
+    Returns:
+        Tuple of (total, total_scenario) DataFrames:
+            total: schedules + holds + skips only
+            total_scenario: schedules + scenarios + holds + skips
+    """
+    if scenarios is None:
+        scenarios = []
+
+    schedule_columns, scenario_columns, hold_columns, skip_columns = _schedule_columns(
+        schedules, holds, skips, scenarios, commit=commit, horizon_days=horizon_days
+    )
+
+    total = _columns_frame(_concat_columns(schedule_columns, hold_columns, skip_columns))
+    total_scenario = _columns_frame(
+        _concat_columns(schedule_columns, scenario_columns, hold_columns, skip_columns)
+    )
 
     return total, total_scenario
 
 
+_TRANSACTION_WINDOW_DAYS = 90
+
+
 def calc_transactions(balance, total):
-    # retrieve the total future transactions
+    """
+    Turn projected occurrences into upcoming transactions and a running balance.
+
+    Columnar: rows are ordered with a stable sort on ``datetime64`` dates,
+    the 90-day listing window and ``(SKIP)`` rows are boolean masks, signed
+    amounts are summed per date with ``np.add.reduceat`` and the running
+    balance is a single ``np.cumsum`` seeded with the current balance, all
+    in ``int64`` cents (see ``app.money``).
+
+    Args:
+        balance: Current balance amount
+        total: DataFrame with ``type``/``name``/``amount``/``date`` columns
+               (as returned by ``calc_schedule``); its ``amount_cents``
+               column is used when present
+
+    Returns:
+        trans: Transactions strictly between today and today + 90 days,
+               excluding ``(SKIP)`` rows, in date order
+        run: Running balance, starting with today's balance and followed by
+             one row per future date; ``amount`` is ``amount_cents / 100``
+    """
+    todaydate = datetime.today().date()
+    balance_cents = to_cents(balance)
     if total.empty:
         trans = pd.DataFrame(columns=['name', 'type', 'amount', 'date'])
-        run_dict = {0: {'amount': float(balance), 'date': datetime.today().date()}}
-        run = pd.DataFrame.from_dict(run_dict, orient="index")
-        return trans, run
+        return trans, _run_frame(np.array([balance_cents], dtype=np.int64), [todaydate])
+
+    days = pd.to_datetime(total['date']).to_numpy().astype('datetime64[D]')
+    order = np.argsort(days, kind='stable')
+    days = days[order]
+    today = np.datetime64(todaydate, 'D')
+
+    names = total['name'].to_numpy(dtype=object)[order]
+    listed = (days > today) & (days < today + _TRANSACTION_WINDOW_DAYS)
+    listed &= np.array(['(SKIP)' not in name for name in names], dtype=bool)
+    if listed.any():
+        rows = total.iloc[order[listed]]
+        trans = pd.DataFrame({
+            'name': rows['name'].tolist(),
+            'type': rows['type'].tolist(),
+            'amount': rows['amount'].tolist(),
+            'date': rows['date'].tolist(),
+        })
+    else:
+        trans = pd.DataFrame.from_dict({}, orient="index")
 
-    df = total.sort_values(by="date", key=lambda x: np.argsort(index_natsorted(total["date"]))).reset_index(drop=True)
-    trans_dict = {}
-    todaydate = datetime.today().date()
-    todaydateplus = todaydate + timedelta(days=90)
-    for i in df.itertuples(index=False):
-        if todaydateplus > \
-                i.date > todaydate and "(SKIP)" not in i.name:
-            new_row = {
-                'name': i.name,
-                'type': i.type,
-                'amount': i.amount,
-                'date': i.date
-            }
-            trans_dict[len(trans_dict)] = new_row
-
-    trans = pd.DataFrame.from_dict(trans_dict, orient="index")
-
-    df = df.copy()
-    df['amount'] = df['amount'].astype(float)
-    df['amount'] = np.where(df['type'] == 'Expense', -df['amount'], df['amount'])
-
-    df = df.groupby("date")['amount'].sum().reset_index()
-
-    runbalance = float(balance)
-    run_dict = {}
-    new_row = {
-        'amount': runbalance,
-        'date': datetime.today().date()
-    }
-    run_dict[len(run_dict)] = new_row
-    for i in df.itertuples(index=False):
-        rundate = i.date
-        amount = i.amount
-        if i.date > todaydate:
-            runbalance += amount
-            new_row = {
-                'amount': runbalance,
-                'date': rundate
-            }
-            run_dict[len(run_dict)] = new_row
+    cents = frame_cents(total)[order]
+    cents = np.where(total['type'].to_numpy()[order] == 'Expense', -cents, cents)
 
-    run = pd.DataFrame.from_dict(run_dict, orient="index")
+    # One net amount per distinct date; only dates after today move the balance.
+    starts = np.flatnonzero(np.concatenate(([True], days[1:] != days[:-1])))
+    future = days[starts] > today
+    nets = np.add.reduceat(cents, starts)[future]
+    balances = np.cumsum(np.concatenate(([balance_cents], nets)))
+    dates = total['date'].to_numpy(dtype=object)[order][starts][future]
 
-    return trans, run
+    return trans, _run_frame(balances, [todaydate] + dates.tolist())
 
 
-def calculate_cash_risk_score(balance, run):
+def _run_frame(balance_cents, dates):
+    """Build a running-balance frame from ``int64`` cents."""
+    return pd.DataFrame({
+        'amount': cents_to_amounts(balance_cents),
+        'date': dates,
+        'amount_cents': balance_cents,
+    })
+
+
+def calc_scenario_overlay(run, overlay):
     """
-    Calculate a 0-100 cash risk score (higher = safer).
+    Layer scenario occurrences over a base running balance.
 
-    Evaluates actual projected liquidity risk over the forecast path rather than
-    relying on naive runway math (current_balance / avg_daily_expense). This
-    prevents over-penalising businesses with healthy cyclical cash flows (e.g.
-    monthly income arriving near month-end) that show a short naive runway but
-    never actually dip into a dangerous liquidity position.
+    The scenario balance on any date is the base balance on that date plus
+    the cumulative net of the scenario rows up to it, so only the scenario
+    rows are sorted and summed (in cents); the base projection is reused as
+    is.
 
-    Factors and weights:
-        35% min_balance_ratio    — lowest_projected_balance / avg_monthly_expense
-        25% days_below_threshold — % of horizon days where balance < 1 month of expenses
-        20% recovery_speed       — days to recover above threshold after the lowest point
-        20% near_term_buffer     — minimum balance over the next 14 days
+    Args:
+        run: Base running balance (as returned by ``calc_transactions``)
+        overlay: DataFrame of scenario rows only, with ``type``/``name``/
+                 ``amount``/``date`` columns
 
-    Runway (current_balance / avg_daily_expense) is retained as an informational
-    output field but is no longer a primary scoring input.
+    Returns:
+        Running balance of base + scenarios: today's balance followed by one
+        row per future date of either series, matching ``calc_transactions``
+        over the combined rows.
+    """
+    if overlay.empty:
+        return run.copy()
+
+    today = np.datetime64(datetime.today().date(), 'D')
+    days = pd.to_datetime(overlay['date']).to_numpy().astype('datetime64[D]')
+    amounts = frame_cents(overlay)
+    amounts = np.where(overlay['type'].to_numpy() == 'Expense', -amounts, amounts)
+
+    # Only dates after today move the balance.
+    future = days > today
+    if not future.any():
+        return run.copy()
+    days, amounts = days[future], amounts[future]
+    order = np.argsort(days, kind='stable')
+    days, amounts = days[order], amounts[order]
+
+    # Cumulative scenario delta per distinct date, prefixed with "no delta yet".
+    starts = np.flatnonzero(np.concatenate(([True], days[1:] != days[:-1])))
+    scenario_days = days[starts]
+    deltas = np.concatenate(([0], np.cumsum(np.add.reduceat(amounts, starts))))
+
+    base_days = pd.to_datetime(run['date']).to_numpy().astype('datetime64[D]')
+    base_cents = frame_cents(run)
+
+    dates = np.union1d(base_days[1:], scenario_days)
+    balances = (
+        base_cents[np.searchsorted(base_days, dates, side='right') - 1]
+        + deltas[np.searchsorted(scenario_days, dates, side='right')]
+    )
 
-    Returns a dict with: score, status, color, runway_days,
-    lowest_balance, days_to_lowest, avg_daily_expense.
+    return _run_frame(
+        np.concatenate((base_cents[:1], balances)),
+        [run['date'].iloc[0]] + dates.astype(object).tolist(),
+    )
+
+
+def _signed_cents(amount, kind_type):
+    cents = to_cents(amount)
+    return -cents if kind_type == 'Expense' else cents
+
+
+def _signed_occurrences(items, todaydate, horizon_days):
+    """Yield ``(datetime64[D], signed cents)`` for *items*' occurrences in date order."""
+    cents = [_signed_cents(item.amount, item.type) for item in items]
+    if horizon_days is not None:
+        for day, position in iter_occurrences(items, todaydate, horizon_days):
+            yield day, cents[position]
+        return
+    # The fixed-count window is small and bounded; sort it as a whole.
+    counts, dates, _last_past = expand_occurrences(items, todaydate)
+    positions = np.repeat(np.arange(len(items)), counts)
+    order = np.argsort(dates, kind='stable')
+    for day, position in zip(dates[order], positions[order].tolist()):
+        yield day, cents[position]
+
+
+def iter_balances(balance, schedules, holds, skips, scenarios=None, horizon_days=None):
+    """
+    Yield a running balance lazily as ``(date, cents)`` pairs.
+
+    Produces the points of ``update_cash(..., commit=False)``'s ``run`` (or
+    ``run_scenario`` when *scenarios* are given) without building any frame:
+    occurrences are heap-merged in date order — from ``iter_occurrences``
+    with *horizon_days*, otherwise from the fixed-count window — and each
+    date's balance is yielded as soon as the next date starts, so memory does
+    not grow with the horizon.  No housekeeping is applied.
     """
     todaydate = datetime.today().date()
-    current_balance = float(balance)
+    today = np.datetime64(todaydate, 'D')
+    tomorrow = np.datetime64(todaydate + relativedelta(days=1), 'D')
+    extras = [(tomorrow, _signed_cents(hold.amount, hold.type)) for hold in holds]
+    extras += [(np.datetime64(_skip_date(skip), 'D'), _signed_cents(skip.amount, skip.type)) for skip in skips]
+    extras.sort(key=itemgetter(0))
+    sources = [extras] + [
+        _signed_occurrences(items, todaydate, horizon_days) for items in (schedules, scenarios or [])
+    ]
+
+    running = to_cents(balance)
+    yield todaydate, running
+    pending = None
+    for day, cents in heapq.merge(*sources, key=itemgetter(0)):
+        if day <= today:
+            continue
+        if pending is not None and day != pending:
+            yield pending.astype(object), running
+        pending = day
+        running += cents
+    if pending is not None:
+        yield pending.astype(object), running
+
+
+_RISK_HORIZON_DAYS = 90
+_NEAR_TERM_DAYS = 14
+
+
+def _cover_score(ratio):
+    """Score months of expense cover (balance / monthly expense), elementwise."""
+    ratio = np.asarray(ratio, dtype=float)
+    return np.select(
+        [ratio >= 1.5, ratio >= 1.0, ratio >= 0.5, ratio >= 0.0],
+        [
+            100.0,
+            # Strong: between 1 and 1.5 months of cover
+            75.0 + (ratio - 1.0) / 0.5 * 25.0,
+            # Moderate: between half and one month of cover
+            40.0 + (ratio - 0.5) / 0.5 * 35.0,
+            # Weak: less than half a month of cover but still positive
+            ratio / 0.5 * 40.0,
+        ],
+        # Balance goes negative — critical
+        default=0.0,
+    )
+
+
+def _recovery_score(days):
+    """Score days taken to climb back above the liquidity threshold, elementwise."""
+    days = np.asarray(days, dtype=float)
+    return np.select(
+        [days <= 7, days <= 30],
+        [
+            # Very fast (≤1 week): near-perfect score
+            90.0 + (7 - days) / 7.0 * 10.0,
+            # Moderate (1 week – 1 month): linear 50–90
+            50.0 + (30 - days) / 23.0 * 40.0,
+        ],
+        # Slow (>1 month): linear 0–50
+        default=np.maximum(0.0, 50.0 - (days - 30) / 60.0 * 50.0),
+    )
+
 
+def _score_status(score):
+    if score >= 80:
+        return 'Safe', 'green'
+    if score >= 60:
+        return 'Stable', 'blue'
+    if score >= 40:
+        return 'Watch', 'yellow'
+    if score >= 20:
+        return 'Risk', 'orange'
+    return 'Critical', 'red'
+
+
+def _risk_run_arrays(run):
+    """Return (days, amounts) of a run frame as date-sorted NumPy arrays."""
+    days = pd.to_datetime(run['date']).to_numpy().astype('datetime64[D]')
+    amounts = run['amount'].astype(float).to_numpy()
+    order = np.argsort(days, kind='stable')
+    return days[order], amounts[order]
+
+
+def _score_risk_paths(current, paths, todaydate):
+    """Score several multi-row projection paths at once.
+
+    *paths* is a list of ``(days, amounts)`` array pairs (each sorted by date,
+    at least two rows) and *current* the matching current balances.  All
+    paths are concatenated and every factor is computed with segment
+    reductions, so the cost is a handful of array passes for the whole batch.
+    """
+    n = len(paths)
+    current = np.asarray(current, dtype=float)
+    today = np.datetime64(todaydate, 'D')
+    horizon = today + _RISK_HORIZON_DAYS
+    near_term_horizon = today + _NEAR_TERM_DAYS
+
+    lengths = np.fromiter((len(days) for days, _ in paths), dtype=np.int64, count=n)
+    all_days = np.concatenate([days for days, _ in paths])
+    all_amounts = np.concatenate([amounts for _, amounts in paths])
+    all_seg = np.repeat(np.arange(n), lengths)
+    all_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    # Near-term window for the 14-day buffer factor; when no transactions fall
+    # within 14 days current_balance is used (no change expected).
+    near = np.minimum.reduceat(
+        np.where(all_days <= near_term_horizon, all_amounts, np.inf), all_starts
+    )
+    near_term_min = np.where(np.isinf(near), current, near)
+
+    # Scope primary calculations to the 90-day window (whole path if empty)
+    in_window = all_days <= horizon
+    has_window = np.bincount(all_seg, weights=in_window, minlength=n) > 0
+    in_window |= ~has_window[all_seg]
+    days = all_days[in_window]
+    amounts = all_amounts[in_window]
+    seg = all_seg[in_window]
+    counts = np.bincount(seg, minlength=n)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    ends = starts + counts - 1
+
+    # Lowest balance and the first time it occurs
+    lowest = np.minimum.reduceat(amounts, starts)
+    minima = np.flatnonzero(amounts == lowest[seg])
+    low_pos = minima[np.searchsorted(minima, starts)]
+    days_to_lowest = np.maximum(0, (days[low_pos] - today).astype(np.int64))
+
+    # Average daily expense: sum of all downward balance moves divided by horizon
+    # days.  Only negative changes count so income does not distort the rate.
+    steps = np.diff(amounts)
+    drops = np.where((seg[1:] == seg[:-1]) & (steps < 0), -steps, 0.0)
+    expense_total = np.bincount(seg[1:], weights=drops, minlength=n)
+    total_days = np.maximum(1, (days[ends] - days[starts]).astype(np.int64))
+    avg_daily_expense = expense_total / total_days
+    avg_daily_expense[avg_daily_expense == 0] = 1.0
+    avg_monthly_expense = avg_daily_expense * 30
+
+    # Liquidity threshold: one month of average expenses
+    threshold = avg_monthly_expense
+    min_balance_score = _cover_score(lowest / avg_monthly_expense)
+
+    # Days below threshold: each checkpoint holds until the next one; the last
+    # one counts the remaining days to the end of the horizon.
+    held = np.empty(len(days), dtype=np.int64)
+    held[:-1] = (days[1:] - days[:-1]).astype(np.int64)
+    held[ends] = (horizon - days[ends]).astype(np.int64)
+    held = np.maximum(0, held)
+    below = amounts < threshold[seg]
+    days_below = np.bincount(seg, weights=np.where(below, held, 0), minlength=n).astype(np.int64)
+    pct_below = days_below / _RISK_HORIZON_DAYS
+    # Linear: 0% of horizon below threshold → 100; 50%+ → 0
+    days_below_score = np.maximum(0.0, 100.0 - (pct_below / 0.5) * 100.0)
+
+    # Recovery: first checkpoint at or after the low back above threshold
+    breached = lowest < threshold
+    above = np.flatnonzero(~below)
+    nxt = np.searchsorted(above, low_pos)
+    recovery_pos = above[np.minimum(nxt, max(len(above) - 1, 0))] if len(above) else low_pos
+    recovered = (nxt < len(above)) & (recovery_pos <= ends)
+    recovery_days = np.maximum(0, (days[recovery_pos] - days[low_pos]).astype(np.int64))
+    recovery_score = np.where(
+        breached, np.where(recovered, _recovery_score(recovery_days), 0.0), 100.0
+    )
+
+    near_term_score = _cover_score(near_term_min / avg_monthly_expense)
+
+    composite = (
+        min_balance_score * 0.35 +
+        days_below_score  * 0.25 +
+        recovery_score    * 0.20 +
+        near_term_score   * 0.20
+    )
+
+    results = []
+    for i in range(n):
+        score = int(max(0, min(100, round(float(composite[i])))))
+        status, color = _score_status(score)
+        if not breached[i]:
+            recovery_days_val = 0  # threshold never breached
+        elif recovered[i]:
+            recovery_days_val = int(recovery_days[i])
+        else:
+            recovery_days_val = None  # never recovered within the horizon
+        results.append({
+            'score': score,
+            'status': status,
+            'color': color,
+            # Runway kept as informational output only (not used in scoring)
+            'runway_days': float(np.round(current[i] / avg_daily_expense[i], 1)),
+            'lowest_balance': round(float(lowest[i]), 2),
+            'days_to_lowest': int(days_to_lowest[i]),
+            'avg_daily_expense': float(np.round(avg_daily_expense[i], 2)),
+            'days_below_threshold': int(days_below[i]),
+            'pct_below_threshold': round(float(pct_below[i]), 4),
+            'recovery_days': recovery_days_val,
+            'near_term_buffer': round(float(near_term_min[i]), 2),
+        })
+    return results
+
+
+def _edge_case_risk(current_balance, run, todaydate):
+    """Score the degenerate cases (no cash, no rows, one row) or return None."""
     if current_balance <= 0:
         return {
             'score': 0,
@@ -659,270 +701,73 @@ def calculate_cash_risk_score(balance, run):
             'near_term_buffer': round(near_term_buffer, 2),
         }
 
-    run_copy = run.copy()
-    run_copy['amount'] = run_copy['amount'].astype(float)
-    run_copy['date_val'] = run_copy['date'].apply(
-        lambda d: d if hasattr(d, 'year') else datetime.strptime(str(d), '%Y-%m-%d').date()
-    )
-    run_copy = run_copy.sort_values('date_val').reset_index(drop=True)
-
-    # Scope primary calculations to 90-day window
-    horizon = todaydate + timedelta(days=90)
-    run_90 = run_copy[run_copy['date_val'] <= horizon].reset_index(drop=True)
-    if run_90.empty:
-        run_90 = run_copy.reset_index(drop=True)
-
-    # Near-term window for the 14-day buffer factor
-    near_term_horizon = todaydate + timedelta(days=14)
-    run_14 = run_copy[run_copy['date_val'] <= near_term_horizon]
-
-    # Lowest balance and when it occurs (within 90-day window)
-    min_idx = run_90['amount'].idxmin()
-    lowest_balance = float(run_90.loc[min_idx, 'amount'])
-    lowest_date = run_90.loc[min_idx, 'date_val']
-    days_to_lowest = max(0, (lowest_date - todaydate).days)
-
-    # Average daily expense: sum of all downward balance moves divided by horizon days.
-    # Only negative changes count so that income events do not distort the expense rate.
-    amounts = run_90['amount'].values
-    total_days = max(1, (run_90['date_val'].iloc[-1] - run_90['date_val'].iloc[0]).days)
-    expense_total = sum(
-        abs(amounts[i] - amounts[i - 1])
-        for i in range(1, len(amounts))
-        if amounts[i] < amounts[i - 1]
-    )
-    avg_daily_expense = expense_total / total_days if total_days > 0 else 1.0
-    if avg_daily_expense == 0:
-        avg_daily_expense = 1.0
+    return None
 
-    avg_monthly_expense = avg_daily_expense * 30
 
-    # Runway kept as informational output only (not used in scoring below)
-    cash_runway_days = current_balance / avg_daily_expense
-
-    # Liquidity threshold: one month of average expenses.
-    # A balance above this level is considered adequately liquid.
-    liquidity_threshold = avg_monthly_expense
-
-    # --- Component scores (0–100, higher = safer) ---
-
-    # 1. Minimum balance ratio (35%)
-    # Answers: "Does the balance ever fall dangerously low relative to monthly expenses?"
-    # A ratio >= 1.5 means the worst-case balance covers 1.5 months of expenses — very healthy.
-    # This factor directly fixes the cyclical-income problem: a business whose balance briefly
-    # dips mid-month but whose lowest point still covers >1 month of expenses is rated safely.
-    ratio = lowest_balance / avg_monthly_expense if avg_monthly_expense > 0 else 1.0
-    if ratio >= 1.5:
-        min_balance_score = 100.0
-    elif ratio >= 1.0:
-        # Strong: between 1 and 1.5 months of cover
-        min_balance_score = 75.0 + (ratio - 1.0) / 0.5 * 25.0
-    elif ratio >= 0.5:
-        # Moderate: between half and one month of cover
-        min_balance_score = 40.0 + (ratio - 0.5) / 0.5 * 35.0
-    elif ratio >= 0.0:
-        # Weak: less than half a month of cover but still positive
-        min_balance_score = ratio / 0.5 * 40.0
-    else:
-        # Balance goes negative — critical
-        min_balance_score = 0.0
-
-    # 2. Days below liquidity threshold (25%)
-    # Answers: "How much of the forecast period is spent in a low-cash state?"
-    # A one-day dip (e.g. income arrives the day after expenses) is very different from
-    # spending 30% of the horizon below threshold. This factor captures that distinction.
-    days_below = 0
-    for i in range(len(run_90)):
-        if float(run_90.loc[i, 'amount']) < liquidity_threshold:
-            if i < len(run_90) - 1:
-                seg_days = (run_90.loc[i + 1, 'date_val'] - run_90.loc[i, 'date_val']).days
-            else:
-                # Last checkpoint: count remaining days to the end of the 90-day horizon
-                seg_days = max(0, (horizon - run_90.loc[i, 'date_val']).days)
-            days_below += max(0, seg_days)
-
-    horizon_days = 90
-    pct_below = days_below / horizon_days
-    # Linear: 0% of horizon below threshold → 100; 50%+ → 0
-    days_below_score = max(0.0, 100.0 - (pct_below / 0.5) * 100.0)
-
-    # 3. Recovery speed (20%)
-    # Answers: "After the worst-case low, how quickly does cash recover above the threshold?"
-    # Fast recovery (e.g. payroll income arriving soon after month-end) signals a healthy
-    # cyclical pattern. Slow or absent recovery signals sustained structural risk.
-    recovery_days_val = None  # None = never recovered; 0 = threshold never breached
-    if lowest_balance >= liquidity_threshold:
-        # Balance never fell below threshold — no recovery needed
-        recovery_score = 100.0
-        recovery_days_val = 0
-    else:
-        post_low = run_90[run_90['date_val'] >= lowest_date]
-        recovered = post_low[post_low['amount'] >= liquidity_threshold]
-        if not recovered.empty:
-            recovery_date = recovered.iloc[0]['date_val']
-            recovery_days = max(0, (recovery_date - lowest_date).days)
-            recovery_days_val = recovery_days
-            if recovery_days <= 7:
-                # Very fast (≤1 week): near-perfect score
-                recovery_score = 90.0 + (7 - recovery_days) / 7.0 * 10.0
-            elif recovery_days <= 30:
-                # Moderate (1 week – 1 month): linear 50–90
-                recovery_score = 50.0 + (30 - recovery_days) / 23.0 * 40.0
-            else:
-                # Slow (>1 month): linear 0–50
-                recovery_score = max(0.0, 50.0 - (recovery_days - 30) / 60.0 * 50.0)
-        else:
-            # No recovery within the 90-day horizon — major risk signal
-            recovery_score = 0.0
-
-    # 4. Near-term liquidity buffer (14 days) (20%)
-    # Answers: "Is there an imminent cash shortfall in the next two weeks?"
-    # Imminent dips should be penalised more heavily than distant ones.
-    # If no transactions fall within 14 days, current_balance is used (no change expected).
-    near_term_min = float(run_14['amount'].min()) if not run_14.empty else current_balance
-    nt_ratio = near_term_min / avg_monthly_expense if avg_monthly_expense > 0 else 1.0
-    if nt_ratio >= 1.5:
-        near_term_score = 100.0
-    elif nt_ratio >= 1.0:
-        near_term_score = 75.0 + (nt_ratio - 1.0) / 0.5 * 25.0
-    elif nt_ratio >= 0.5:
-        near_term_score = 40.0 + (nt_ratio - 0.5) / 0.5 * 35.0
-    elif nt_ratio >= 0.0:
-        near_term_score = nt_ratio / 0.5 * 40.0
-    else:
-        near_term_score = 0.0
-
-    # Weighted composite
-    score = (
-        min_balance_score * 0.35 +
-        days_below_score  * 0.25 +
-        recovery_score    * 0.20 +
-        near_term_score   * 0.20
-    )
-    score = int(max(0, min(100, round(score))))
-
-    if score >= 80:
-        status, color = 'Safe', 'green'
-    elif score >= 60:
-        status, color = 'Stable', 'blue'
-    elif score >= 40:
-        status, color = 'Watch', 'yellow'
-    elif score >= 20:
-        status, color = 'Risk', 'orange'
-    else:
-        status, color = 'Critical', 'red'
+def calculate_cash_risk_score(balance, run):
+    """
+    Calculate a 0-100 cash risk score (higher = safer).
 
-    return {
-        'score': score,
-        'status': status,
-        'color': color,
-        'runway_days': round(cash_runway_days, 1),
-        'lowest_balance': round(lowest_balance, 2),
-        'days_to_lowest': days_to_lowest,
-        'avg_daily_expense': round(avg_daily_expense, 2),
-        'days_below_threshold': days_below,
-        'pct_below_threshold': round(pct_below, 4),
-        'recovery_days': recovery_days_val,
-        'near_term_buffer': round(near_term_min, 2),
-    }
+    Evaluates actual projected liquidity risk over the forecast path rather than
+    relying on naive runway math (current_balance / avg_daily_expense). This
+    prevents over-penalising businesses with healthy cyclical cash flows (e.g.
+    monthly income arriving near month-end) that show a short naive runway but
+    never actually dip into a dangerous liquidity position.
 
+    Factors and weights:
+        35% min_balance_ratio    — lowest_projected_balance / avg_monthly_expense
+        25% days_below_threshold — % of horizon days where balance < 1 month of expenses
+        20% recovery_speed       — days to recover above threshold after the lowest point
+        20% near_term_buffer     — minimum balance over the next 14 days
 
-def plot_cash(run, run_scenario=None):
-    # plot the running balances by date on a line plot
-    # Schedule-only line
-    df = run.sort_values(by='date', ascending=False)
-    df['amount'] = df['amount'].astype(float)
-    todaydate = datetime.today().date()
-    horizon_90 = todaydate + timedelta(days=90)
-    df_90 = df[df['date'] <= horizon_90]
-    minbalance = df_90['amount'].min() if not df_90.empty else df['amount'].min()
-    minbalance = decimal.Decimal(str(minbalance)).quantize(decimal.Decimal('.01'))
+    Runway (current_balance / avg_daily_expense) is retained as an informational
+    output field but is no longer a primary scoring input.
 
-    todaydateplus = todaydate + timedelta(days=90)
+    Returns a dict with: score, status, color, runway_days,
+    lowest_balance, days_to_lowest, avg_daily_expense.
+    """
+    return calculate_cash_risk_scores([(balance, run)])[0]
 
-    if float(minbalance) >= 0:
-        minrange = 0.0
-    else:
-        minrange = float(minbalance) * 1.1
-
-    maxbalance = 0.0
-    for i in df.itertuples(index=False):
-        if todaydateplus > i.date > todaydate:
-            if i.amount > maxbalance:
-                maxbalance = i.amount
-
-    # Scenario line setup
-    min_scenario = None
-    df_s = None
-    if run_scenario is not None:
-        df_s = run_scenario.sort_values(by='date', ascending=False)
-        df_s['amount'] = df_s['amount'].astype(float)
-        df_s_90 = df_s[df_s['date'] <= horizon_90]
-        scenario_min = df_s_90['amount'].min() if not df_s_90.empty else df_s['amount'].min()
-        min_scenario = decimal.Decimal(str(scenario_min)).quantize(decimal.Decimal('.01'))
-
-        # Expand y-axis range to fit both lines
-        if float(min_scenario) < minrange:
-            minrange = float(min_scenario) * 1.1 if float(min_scenario) < 0 else minrange
-        for i in df_s.itertuples(index=False):
-            if todaydateplus > i.date > todaydate:
-                if i.amount > maxbalance:
-                    maxbalance = i.amount
-
-    maxrange = maxbalance * 1.1
-
-    start_date = str(todaydate)
-    end_date = str(todaydate + timedelta(days=90))
-
-    layout = go.Layout(
-        yaxis=dict(range=[minrange, maxrange]),
-        xaxis=dict(range=[start_date, end_date]),
-        margin=dict(l=0, r=0, t=0, b=0),
-        dragmode='pan',
-        clickmode='event',
-        hovermode='closest',
-        showlegend=(run_scenario is not None),
-        legend=dict(
-            orientation='h',
-            yanchor='bottom',
-            y=1.02,
-            xanchor='right',
-            x=1,
-            font=dict(color='#cbd5e1')
-        )
-    )
 
-    traces = []
-
-    if df_s is not None:
-        traces.append(
-            go.Scatter(
-                name='With Scenarios',
-                x=df_s['date'].values.tolist(),
-                y=df_s['amount'].values.tolist(),
-                mode='lines',
-                hovertemplate='%{x|%b %d, %Y}<br>$%{y:,.2f}<extra>With Scenarios</extra>',
-                line=dict(shape='spline', smoothing=0.8, color='#f59e0b', dash='dash')
-            )
-        )
+def calculate_cash_risk_scores(series):
+    """
+    Score many projection paths in one call.
 
-    traces.append(
-        go.Scatter(
-            name='Schedule',
-            x=df['date'].values.tolist(),
-            y=df['amount'].values.tolist(),
-            mode='lines',
-            hovertemplate='%{x|%b %d, %Y}<br>$%{y:,.2f}<extra>Schedule</extra>',
-            line=dict(shape='spline', smoothing=0.8, color='#3b82f6')
-        )
-    )
+    Args:
+        series: Iterable of ``(balance, run)`` pairs, as accepted by
+                calculate_cash_risk_score.
 
-    fig = go.Figure(data=traces)
-    fig.update_layout(layout)
-    fig.update_layout(paper_bgcolor="PaleTurquoise")
-    fig.update_layout(xaxis_type='date')
-    fig.update_layout(yaxis_tickformat='$,.0f')
+    Returns a list of result dicts in input order.  Multi-row paths are scored
+    together by a single vectorized pass, so reporting and alerting jobs can
+    score every account without per-path DataFrame work.
+    """
+    todaydate = datetime.today().date()
+    results = []
+    pending, current, paths = [], [], []
+    for balance, run in series:
+        current_balance = float(balance)
+        result = _edge_case_risk(current_balance, run, todaydate)
+        if result is None:
+            pending.append(len(results))
+            current.append(current_balance)
+            paths.append(_risk_run_arrays(run))
+        results.append(result)
+    if paths:
+        for index, result in zip(pending, _score_risk_paths(current, paths, todaydate)):
+            results[index] = result
+    return results
+
+
+def plot_cash(run, run_scenario=None, max_points=0, method='minmax'):
+    """
+    Render the running balances as the dashboard chart's Plotly JSON.
 
-    graphJSON = json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    The figure is assembled from plain dicts by ``app.chart_series`` rather
+    than through the plotly object model; see ``chart_payload`` for the
+    optional downsampling of long series.
 
-    return minbalance, min_scenario, graphJSON
+    Returns:
+        Tuple of (minbalance, min_scenario, graphJSON)
+    """
+    minbalance, min_scenario, figure = chart_payload(run, run_scenario, max_points, method)
+    return minbalance, min_scenario, json.dumps(figure)
@@ -0,0 +1,214 @@
+"""Balance-chart payloads for the dashboard.
+
+``plot_cash`` used to build a ``plotly.graph_objs.Figure`` (traces, layout
+objects and validation) and serialize it through ``PlotlyJSONEncoder`` on
+every render.  The chart only ever needs a fixed layout with a handful of
+per-render values, so the figure is assembled here as plain dicts instead:
+the Plotly default template is resolved once per process, ranges come from
+vectorized masks over the balance arrays, and the result is the same figure
+JSON the templates already consume.
+
+Long projections can be thinned to a target point count before they are
+sent to the browser:
+
+- ``minmax`` keeps the lowest and highest balance of every bucket, so dips
+  and peaks survive (default).
+- ``lttb`` (Largest-Triangle-Three-Buckets) keeps the visually most
+  significant point of every bucket.
+
+The headline minimum balances and axis ranges are always computed from the
+full series.
+"""
+
+import decimal
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+DOWNSAMPLE_METHODS = ('minmax', 'lttb')
+_CHART_HORIZON_DAYS = 90
+
+
+@lru_cache(maxsize=1)
+def _layout_template():
+    """Return Plotly's default layout template as a plain dict (built once)."""
+    import plotly.graph_objs as go
+
+    return go.Figure().to_plotly_json()['layout']['template']
+
+
+def _first_in_segments(values, targets, offsets):
+    """Index of the first element equal to its segment's target, per segment."""
+    segment = np.repeat(np.arange(len(offsets)), np.diff(np.append(offsets, len(values))))
+    hits = np.flatnonzero(values == targets[segment])
+    return hits[np.searchsorted(hits, offsets)]
+
+
+def minmax_indices(amounts, max_points):
+    """Indices of a min/max-bucketed subset of *amounts* (at most *max_points*).
+
+    The first and last points are always kept; the rest are split into equal
+    buckets that each contribute their minimum and maximum.
+    """
+    n = len(amounts)
+    if max_points >= n or max_points < 4:
+        return np.arange(n)
+    inner = np.asarray(amounts[1:n - 1], dtype=float)
+    buckets = (max_points - 2) // 2
+    offsets = np.linspace(0, len(inner), buckets + 1).astype(np.int64)[:-1]
+    lows = _first_in_segments(inner, np.minimum.reduceat(inner, offsets), offsets)
+    highs = _first_in_segments(inner, np.maximum.reduceat(inner, offsets), offsets)
+    return np.unique(np.concatenate(([0, n - 1], lows + 1, highs + 1)))
+
+
+def lttb_indices(x, y, max_points):
+    """Indices picked by Largest-Triangle-Three-Buckets (at most *max_points*).
+
+    *x* must be ascending (e.g. day numbers).  The first and last points are
+    always kept.
+    """
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    edges = np.append(edges, n)
+
+    picked = np.empty(max_points, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    anchor = 0
+    for b in range(max_points - 2):
+        lo, hi = edges[b], edges[b + 1]
+        next_lo, next_hi = edges[b + 1], edges[b + 2]
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        area = np.abs(
+            (x[anchor] - avg_x) * (y[lo:hi] - y[anchor])
+            - (x[anchor] - x[lo:hi]) * (avg_y - y[anchor])
+        )
+        anchor = lo + int(np.argmax(area))
+        picked[b + 1] = anchor
+    return picked
+
+
+def downsample_indices(days, amounts, max_points, method='minmax'):
+    """Pick at most *max_points* indices of a date-ascending balance series.
+
+    ``max_points`` of 0 (or None) keeps every point.
+    """
+    if not max_points or len(amounts) <= max_points:
+        return np.arange(len(amounts))
+    if method == 'lttb':
+        return lttb_indices(days.astype(np.int64), amounts, max_points)
+    if method == 'minmax':
+        return minmax_indices(amounts, max_points)
+    raise ValueError(f"Unknown downsampling method {method!r}; expected one of {DOWNSAMPLE_METHODS}")
+
+
+def _balance_arrays(run):
+    """Return (days, amounts) of a running-balance frame, newest date first."""
+    days = pd.to_datetime(run['date']).to_numpy().astype('datetime64[D]')
+    amounts = run['amount'].astype(float).to_numpy()
+    order = np.argsort(days, kind='stable')[::-1]
+    return days[order], amounts[order]
+
+
+def _window_min(days, amounts, horizon):
+    """Lowest balance up to *horizon* (whole series if none), as Decimal cents."""
+    in_window = days <= horizon
+    lowest = amounts[in_window].min() if in_window.any() else amounts.min()
+    return decimal.Decimal(str(lowest)).quantize(decimal.Decimal('.01'))
+
+
+def _window_max(days, amounts, today, horizon):
+    """Highest balance strictly between *today* and *horizon*, floored at 0."""
+    upcoming = amounts[(days > today) & (days < horizon)]
+    return max(0.0, float(upcoming.max())) if upcoming.size else 0.0
+
+
+def _trace(name, days, amounts, line, max_points, method):
+    # Downsampling works on ascending dates; the chart keeps newest first.
+    keep = downsample_indices(days[::-1], amounts[::-1], max_points, method)
+    keep = len(days) - 1 - keep[::-1]
+    return {
+        'hovertemplate': f'%{{x|%b %d, %Y}}<br>$%{{y:,.2f}}<extra>{name}</extra>',
+        'line': line,
+        'mode': 'lines',
+        'name': name,
+        'x': np.datetime_as_string(days[keep], unit='D').tolist(),
+        'y': amounts[keep].tolist(),
+        'type': 'scatter',
+    }
+
+
+def chart_payload(run, run_scenario=None, max_points=0, method='minmax'):
+    """
+    Build the dashboard balance chart as a Plotly figure dict.
+
+    Args:
+        run: Running balance DataFrame (schedules only)
+        run_scenario: Running balance DataFrame with scenarios, optional
+        max_points: Downsample each line to at most this many points;
+                    0 (default) sends every point.
+        method: ``'minmax'`` (default) or ``'lttb'``.
+
+    Returns:
+        Tuple of (minbalance, min_scenario, figure) where the minimums are
+        Decimal cents over the next 90 days (``min_scenario`` is None without
+        scenarios) and ``figure`` is a JSON-serializable dict.
+    """
+    todaydate = datetime.today().date()
+    today = np.datetime64(todaydate, 'D')
+    horizon = today + _CHART_HORIZON_DAYS
+
+    days, amounts = _balance_arrays(run)
+    minbalance = _window_min(days, amounts, horizon)
+    minrange = 0.0 if float(minbalance) >= 0 else float(minbalance) * 1.1
+    maxbalance = _window_max(days, amounts, today, horizon)
+
+    min_scenario = None
+    traces = []
+    if run_scenario is not None:
+        scenario_days, scenario_amounts = _balance_arrays(run_scenario)
+        min_scenario = _window_min(scenario_days, scenario_amounts, horizon)
+        # Expand y-axis range to fit both lines
+        if float(min_scenario) < minrange and float(min_scenario) < 0:
+            minrange = float(min_scenario) * 1.1
+        maxbalance = max(maxbalance, _window_max(scenario_days, scenario_amounts, today, horizon))
+        traces.append(_trace(
+            'With Scenarios', scenario_days, scenario_amounts,
+            {'color': '#f59e0b', 'dash': 'dash', 'shape': 'spline', 'smoothing': 0.8},
+            max_points, method,
+        ))
+
+    traces.append(_trace(
+        'Schedule', days, amounts,
+        {'color': '#3b82f6', 'shape': 'spline', 'smoothing': 0.8},
+        max_points, method,
+    ))
+
+    layout = {
+        'template': _layout_template(),
+        'legend': {
+            'font': {'color': '#cbd5e1'},
+            'orientation': 'h',
+            'x': 1,
+            'xanchor': 'right',
+            'y': 1.02,
+            'yanchor': 'bottom',
+        },
+        'margin': {'b': 0, 'l': 0, 'r': 0, 't': 0},
+        'xaxis': {'range': [str(todaydate), str(horizon)], 'type': 'date'},
+        'yaxis': {'range': [minrange, maxbalance * 1.1], 'tickformat': '$,.0f'},
+        'clickmode': 'event',
+        'dragmode': 'pan',
+        'hovermode': 'closest',
+        'showlegend': run_scenario is not None,
+        'paper_bgcolor': 'PaleTurquoise',
+    }
+
+    return minbalance, min_scenario, {'data': traces, 'layout': layout}
@@ -0,0 +1,189 @@
+"""gzip / brotli response compression.
+
+``init_compression(app)`` registers an ``after_request`` hook that compresses
+text-like responses (HTML, JSON, CSS, JS, CSV, ...) when the client accepts
+it.  Brotli is preferred when the optional ``brotli`` package is installed;
+gzip (stdlib) is always available.  A response is left untouched when it is:
+
+- smaller than ``COMPRESSION_MIN_SIZE`` bytes,
+- not a compressible content type (images, fonts, archives are already
+  compressed),
+- already encoded, streamed, a partial (``206``) or bodiless (``204``/``304``)
+  response,
+- an HTML page rendered with a CSRF token.  Compressing a secret next to
+  content that reflects request input lets an attacker who can observe
+  response sizes recover the secret byte by byte (BREACH), so such pages
+  are always sent uncompressed.  The API and static assets carry no CSRF
+  token and are compressed as usual.
+
+Compressed responses get ``Vary: Accept-Encoding`` and any strong ETag is
+downgraded to a weak one, since the bytes differ from the identity
+representation (``If-None-Match`` uses weak comparison, so revalidation keeps
+working — see app/api/etags.py).
+
+Static assets (``/static/*``, ``/manifest.json``, ``/sw.js``) never change
+while the process runs, so their compressed bytes are kept in a small LRU
+keyed on path, encoding and the file's validators when
+``COMPRESSION_CACHE_STATIC`` is enabled.
+"""
+
+import gzip
+import threading
+from collections import OrderedDict
+
+from flask import current_app, g, request
+
+try:
+    import brotli  # optional dependency
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+
+COMPRESSIBLE_MIMETYPES = frozenset({
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/csv",
+    "text/javascript",
+    "text/xml",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+})
+
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+_STATIC_CACHE_SIZE = 128
+_STATIC_PATHS = ("/manifest.json", "/sw.js")
+_STATIC_PREFIX = "/static/"
+
+
+def available_encodings():
+    """Content codings this process can produce, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+
+
+class _StaticCache:
+    """Bounded, thread-safe LRU of compressed static asset bodies."""
+
+    def __init__(self, maxsize=_STATIC_CACHE_SIZE):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.maxsize = maxsize
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+static_cache = _StaticCache()
+
+
+def _is_static_path(path: str) -> bool:
+    return path in _STATIC_PATHS or path.startswith(_STATIC_PREFIX)
+
+
+def _carries_csrf_token(response) -> bool:
+    """True when *response* is HTML rendered with a CSRF token."""
+    # flask_wtf.csrf.generate_csrf caches the request's token on ``g``.
+    field_name = current_app.config.get("WTF_CSRF_FIELD_NAME", "csrf_token")
+    return response.mimetype == "text/html" and field_name in g
+
+
+def _should_compress(response, min_size: int) -> bool:
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if response.is_streamed and not response.direct_passthrough:
+        return False
+    if "Content-Encoding" in response.headers:
+        return False
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return False
+    if _carries_csrf_token(response):
+        return False
+    length = response.content_length
+    return length is None or length >= min_size
+
+
+def compress_response(response, min_size: int, cache_static: bool):
+    """Compress *response* in place for the current request, if worthwhile."""
+    if not _should_compress(response, min_size):
+        return response
+    # The representation depends on Accept-Encoding whether or not this
+    # particular client gets a compressed body.
+    response.vary.add("Accept-Encoding")
+    encoding = request.accept_encodings.best_match(available_encodings())
+    if encoding is None:
+        return response
+
+    cache_key = None
+    if cache_static and _is_static_path(request.path):
+        cache_key = (
+            request.path,
+            encoding,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            response.content_length,
+        )
+        body = static_cache.get(cache_key)
+    else:
+        body = None
+
+    if body is not None:
+        if hasattr(response.response, "close"):
+            response.response.close()
+    else:
+        # send_file responses stream the file; read it so it can be encoded.
+        response.direct_passthrough = False
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        body = compress(data, encoding)
+        if len(body) >= len(data):
+            return response
+        if cache_key is not None:
+            static_cache.put(cache_key, body)
+
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app):
+    """Register the compression hook on *app* when ``COMPRESSION_ENABLED``."""
+    if not app.config.get("COMPRESSION_ENABLED", True):
+        return
+
+    @app.after_request
+    def _compress_response(response):
+        return compress_response(
+            response,
+            app.config.get("COMPRESSION_MIN_SIZE", 500),
+            app.config.get("COMPRESSION_CACHE_STATIC", True),
+        )
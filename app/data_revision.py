@@ -0,0 +1,50 @@
+"""Per-user data revision counter.
+
+``User.data_revision`` is a monotonically increasing integer on the account
+owner's row.  Every write path that changes a user's projection inputs —
+schedules, scenarios, holds, skips or the balance — calls
+``bump_data_revision`` in the same transaction as the write, so any worker
+can tell whether a user's data changed with a single primary-key read of
+``get_data_revision``.
+
+The increment is an atomic ``UPDATE ... SET data_revision = data_revision + 1``
+so concurrent writers in different workers never lose a bump.  It also locks
+the owner's row until the transaction ends, which is what lets delta sync
+(app/sync.py) stamp rows with the revision: no other transaction can commit
+that user's next revision first.
+"""
+
+from sqlalchemy import select, update
+
+from app import db
+from app.models import User
+
+
+# Session.info key holding the user ids bumped in the current transaction.
+BUMPED_USERS_KEY = "bumped_data_revisions"
+
+
+def bump_data_revision(user_id: int, session=None) -> None:
+    """Increment *user_id*'s data revision; the caller commits.
+
+    *session* defaults to ``db.session``.
+    """
+    if session is None:
+        session = db.session
+    session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(data_revision=User.data_revision + 1)
+        .execution_options(synchronize_session=False)
+    )
+    session.info.setdefault(BUMPED_USERS_KEY, set()).add(user_id)
+
+
+def get_data_revision(user_id: int, session=None) -> int:
+    """Return *user_id*'s current data revision (0 for unknown users)."""
+    if session is None:
+        session = db.session
+    revision = session.execute(
+        select(User.data_revision).where(User.id == user_id)
+    ).scalar_one_or_none()
+    return revision or 0
@@ -0,0 +1,140 @@
+"""SQLAlchemy connection pooling for server databases (PostgreSQL).
+
+``engine_options(config)`` builds ``SQLALCHEMY_ENGINE_OPTIONS`` for any
+non-SQLite ``DATABASE_URL``:
+
+- ``pool_size`` / ``max_overflow`` sized from the gunicorn thread count, so
+  every request thread of a worker can hold a connection at once,
+- ``pool_timeout`` shorter than the gunicorn worker timeout, so a starved
+  thread fails fast instead of hanging the request,
+- ``pool_pre_ping`` and ``pool_recycle`` so connections dropped by the server
+  or a proxy are replaced instead of surfacing as errors,
+- on PostgreSQL, a server-side ``statement_timeout`` and an
+  ``application_name`` (visible in ``pg_stat_activity``).
+
+Checkout waits are recorded by ``TimedQueuePool`` into ``pool_metrics``; a
+checkout slower than ``DB_POOL_SLOW_CHECKOUT_MS`` or a pool timeout is logged,
+so thread starvation on the pool shows up in the logs and in
+``/global_admin/db_pool`` rather than only as tail latency.  SQLite keeps
+SQLAlchemy's defaults (see app/sqlite_profile.py for its tuning).
+"""
+
+import logging
+import threading
+import time
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """Thread-safe counters of connection-pool checkout waits."""
+
+    def __init__(self, slow_checkout_ms=100):
+        self._lock = threading.Lock()
+        self.slow_checkout_ms = slow_checkout_ms
+        self.clear()
+
+    def configure(self, slow_checkout_ms):
+        self.slow_checkout_ms = slow_checkout_ms
+
+    def clear(self):
+        with self._lock:
+            self.checkouts = self.timeouts = self.slow_checkouts = 0
+            self.wait_total = self.wait_max = 0.0
+
+    def record(self, wait: float, timed_out: bool = False):
+        slow = wait * 1000 >= self.slow_checkout_ms
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            if timed_out:
+                self.timeouts += 1
+            elif slow:
+                self.slow_checkouts += 1
+        if timed_out:
+            logger.warning("DB pool checkout timed out after %.0f ms; pool exhausted", wait * 1000)
+        elif slow:
+            logger.warning("Slow DB pool checkout: waited %.0f ms for a connection", wait * 1000)
+
+    def stats(self, pool=None) -> dict:
+        with self._lock:
+            stats = {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'slow_checkouts': self.slow_checkouts,
+                'wait_avg_ms': round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                'wait_max_ms': round(self.wait_max * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+        return stats
+
+
+pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """``QueuePool`` that records how long each checkout waited."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.record(time.perf_counter() - start)
+        return connection
+
+
+def engine_options(config) -> dict:
+    """Return ``SQLALCHEMY_ENGINE_OPTIONS`` for ``config['SQLALCHEMY_DATABASE_URI']``.
+
+    Empty for SQLite.  Raises ``ValueError`` for out-of-range settings.
+    """
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite':
+        return {}
+
+    pool_size = int(config['DB_POOL_SIZE'])
+    max_overflow = int(config['DB_MAX_OVERFLOW'])
+    pool_timeout = float(config['DB_POOL_TIMEOUT'])
+    pool_recycle = int(config['DB_POOL_RECYCLE'])
+    statement_timeout_ms = int(config['DB_STATEMENT_TIMEOUT_MS'])
+    if pool_size < 1:
+        raise ValueError("DB_POOL_SIZE must be >= 1")
+    for name, value in (
+        ('DB_MAX_OVERFLOW', max_overflow),
+        ('DB_POOL_TIMEOUT', pool_timeout),
+        ('DB_STATEMENT_TIMEOUT_MS', statement_timeout_ms),
+    ):
+        if value < 0:
+            raise ValueError(f"{name} must be >= 0")
+
+    options = {
+        'poolclass': TimedQueuePool,
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_timeout': pool_timeout,
+        'pool_recycle': pool_recycle,
+        'pool_pre_ping': True,
+    }
+    if url.get_backend_name() == 'postgresql':
+        connect_args = {}
+        if statement_timeout_ms:
+            connect_args['options'] = f"-c statement_timeout={statement_timeout_ms}"
+        if config.get('DB_APPLICATION_NAME'):
+            connect_args['application_name'] = config['DB_APPLICATION_NAME']
+        if connect_args:
+            options['connect_args'] = connect_args
+    return options
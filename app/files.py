@@ -8,6 +8,7 @@ import numpy as np
 from io import TextIOWrapper, StringIO
 import csv
 from .models import Schedule
+from .data_revision import bump_data_revision
 import platform
 from sqlalchemy import text
 
@@ -150,6 +151,7 @@ def upload(csv_file, user_id):
                 existing.startdate = next_date
                 existing.type = row_type
                 existing.firstdate = first_date
+            bump_data_revision(user_id)
             db.session.commit()
             success_count += 1
 
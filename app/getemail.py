@@ -28,6 +28,7 @@ from datetime import datetime, timedelta, timezone
 from app import db
 from app.models import User, Email, Balance, GlobalEmailSettings
 from app.crypto_utils import decrypt_password
+from app.data_revision import bump_data_revision
 
 logger = logging.getLogger(__name__)
 
@@ -448,6 +449,7 @@ def process_email_balances():
                     # Upsert: same-day row already exists with a different
                     # amount — update it instead of inserting a duplicate.
                     existing_balance.amount = new_balance
+                    bump_data_revision(user_id)
                     db.session.commit()
                     balance_updated = True
                     logger.info("Balance updated successfully for user %s", user_id)
@@ -459,6 +461,7 @@ def process_email_balances():
                         user_id=user_id
                     )
                     db.session.add(balance)
+                    bump_data_revision(user_id)
                     db.session.commit()
                     balance_updated = True
                     logger.info("Balance updated successfully for user %s", user_id)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Schedule housekeeping job for pycashflow.
+
+Advances recurring Schedule/Scenario start dates past occurrences that have
+already happened, backfills missing ``firstdate`` values, and purges past
+one-time schedules and stale skips — for every user at once.  Deletions are
+tombstoned for delta sync clients, tombstones past their retention window are
+pruned, and every affected user's data revision is bumped in the same
+transaction so projection ETags and caches see the change.  This used to
+happen inside ``calc_schedule(commit=True)`` on every projection read, which
+turned dashboard/API reads into database writes; projection reads now run
+with ``commit=False`` and rely on this job instead.
+
+Run it from cron (see crontab.txt), standalone, or via the Flask CLI:
+
+    python app/housekeeping.py
+    flask --app app housekeeping
+"""
+import os
+import sys
+import logging
+
+# When run as standalone script, add parent directory to path for imports
+# This allows 'from app import ...' to work when called from cron
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from datetime import datetime
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import select, update
+
+from app import db
+from app.models import Schedule, Scenario, Skip
+from app.cashflow import _advanced_startdate
+from app.data_revision import bump_data_revision
+from app.recurrence import expand_occurrences
+from app.sync import delete_with_tombstones, prune_tombstones
+
+logger = logging.getLogger(__name__)
+
+
+def _user_ids(model, *criteria):
+    """Return the distinct ``user_id``s of the *model* rows matching *criteria*."""
+    return set(db.session.execute(select(model.user_id).where(*criteria).distinct()).scalars())
+
+
+def _advance_start_dates(model, todaydate):
+    """Advance every recurring row of *model* whose window has a past occurrence.
+
+    Candidates are selected in one query, their next start dates computed in
+    bulk, and the changes written back with a single executemany UPDATE.
+
+    Returns:
+        ``(count, user_ids)`` of the advanced rows.
+    """
+    rows = db.session.execute(
+        select(model.id, model.user_id, model.startdate, model.firstdate, model.frequency, model.type)
+        .where(model.frequency != 'Onetime', model.startdate <= todaydate)
+    ).all()
+    if not rows:
+        return 0, set()
+
+    _counts, _dates, last_past = expand_occurrences(rows, todaydate)
+    changes = []
+    user_ids = set()
+    for row, last in zip(rows, last_past.astype(object)):
+        if last is None:
+            continue
+        advanced = _advanced_startdate(last, row.frequency, row.firstdate.day)
+        if advanced != row.startdate:
+            changes.append({'id': row.id, 'startdate': advanced})
+            user_ids.add(row.user_id)
+    if changes:
+        db.session.execute(update(model), changes)
+    return len(changes), user_ids
+
+
+def run_housekeeping(todaydate=None):
+    """Apply schedule bookkeeping for all users and commit.
+
+    Mirrors the side effects ``calc_schedule(commit=True)`` applies per user:
+    start dates only advance on weekdays, and past one-time *scenarios* are
+    kept (users remove those themselves).
+
+    Returns:
+        Dict of affected row counts per step.
+    """
+    todaydate = todaydate or datetime.today().date()
+    stats = {}
+    affected = set()
+
+    for name, model in (('schedules', Schedule), ('scenarios', Scenario)):
+        criteria = (model.firstdate.is_(None), model.startdate.is_not(None))
+        affected |= _user_ids(model, *criteria)
+        result = db.session.execute(
+            update(model).where(*criteria).values(firstdate=model.startdate)
+        )
+        stats[f'{name}_firstdate_filled'] = result.rowcount
+
+    onetime = (Schedule.frequency == 'Onetime', Schedule.startdate < todaydate)
+    affected |= _user_ids(Schedule, *onetime)
+    stats['onetime_schedules_deleted'] = delete_with_tombstones(Schedule, *onetime)
+    affected |= _user_ids(Skip, Skip.date < todaydate)
+    stats['skips_deleted'] = delete_with_tombstones(Skip, Skip.date < todaydate)
+
+    for name, model in (('schedules', Schedule), ('scenarios', Scenario)):
+        advanced, user_ids = (
+            _advance_start_dates(model, todaydate) if todaydate.weekday() < 5 else (0, set())
+        )
+        stats[f'{name}_advanced'] = advanced
+        affected |= user_ids
+
+    stats['tombstones_pruned'] = prune_tombstones()
+
+    # Projection ETags and caches are keyed on the data revision.
+    for user_id in sorted(affected):
+        bump_data_revision(user_id)
+    stats['revisions_bumped'] = len(affected)
+
+    db.session.commit()
+    # Bulk statements bypass the identity map; make sure no stale rows linger.
+    db.session.expire_all()
+    return stats
+
+
+@click.command('housekeeping')
+@with_appcontext
+def housekeeping_command():
+    """Advance schedule start dates and purge stale skips for all users."""
+    stats = run_housekeeping()
+    click.echo(', '.join(f'{key}={value}' for key, value in stats.items()))
+
+
+if __name__ == "__main__":
+    from app import create_app
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+        force=True,
+    )
+    logger.info("Starting schedule housekeeping...")
+    app = create_app()
+
+    with app.app_context():
+        try:
+            stats = run_housekeeping()
+            logger.info("Schedule housekeeping completed: %s", stats)
+        except Exception:
+            logger.exception("Schedule housekeeping failed")
+            sys.exit(1)
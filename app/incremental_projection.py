@@ -0,0 +1,407 @@
+"""Incremental cash-flow projections.
+
+``update_cash`` re-expands and re-sorts every schedule whenever any row
+changes, so an account with hundreds of schedules pays for all of them after
+every single edit.  ``IncrementalProjection`` keeps, per user, each source
+row's future occurrences together with per-day net amounts and the running
+balance.  On the next read the current rows are diffed against the previous
+ones by content:
+
+- rows that disappeared (deleted, or edited into a new content) have their
+  occurrences removed;
+- rows that appeared (created, or the new content of an edit) are expanded —
+  only those rows go through ``expand_occurrences`` and housekeeping;
+- per-day nets are recomputed for the affected days only and the running
+  balance is re-accumulated from the earliest affected day onward.
+
+Write paths need no hooks: whatever changed in the database shows up in the
+diff.  State is rebuilt from scratch when the date or the business calendar
+changes, and results match ``update_cash`` row for row.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from app import db
+from .business_days import default_business_calendar
+from .cashflow import _TRANSACTION_WINDOW_DAYS, _housekeep_items, _run_frame, _skip_date
+from .money import to_cents
+from .recurrence import expand_occurrences
+
+
+_DEFAULT_MAXSIZE = 256
+
+# Rebuild a state once dead slots outnumber live ones by this factor.
+_COMPACTION_RATIO = 4
+
+_ITEM_FIELDS = ('name', 'amount', 'frequency', 'startdate', 'firstdate', 'type')
+_HOLD_FIELDS = ('name', 'amount', 'type')
+_SKIP_FIELDS = ('name', 'date', 'amount', 'type')
+
+_KIND_FIELDS = {
+    'schedule': _ITEM_FIELDS,
+    'hold': _HOLD_FIELDS,
+    'skip': _SKIP_FIELDS,
+    'scenario': _ITEM_FIELDS,
+}
+
+
+def _source_keys(kind, rows):
+    """Content keys for *rows*; identical rows are told apart by a counter."""
+    fields = _KIND_FIELDS[kind]
+    seen = {}
+    keys = []
+    for row in rows:
+        content = (kind,) + tuple(str(getattr(row, field, None)) for field in fields)
+        seen[content] = seen.get(content, 0) + 1
+        keys.append(content + (seen[content],))
+    return keys
+
+
+def _signed_cents(amount, kind_type):
+    cents = to_cents(amount)
+    return -cents if kind_type == 'Expense' else cents
+
+
+def _net_cents(index, cents, size):
+    """Sum *cents* per *index*; ``bincount`` sums in float64, exact for cents."""
+    return np.rint(np.bincount(index, weights=cents, minlength=size)).astype(np.int64)
+
+
+class IncrementalProjection:
+    """Per-user projection state that is updated by row-level deltas."""
+
+    def __init__(self, todaydate, calendar=None):
+        self.todaydate = todaydate
+        self.calendar = calendar or default_business_calendar()
+        self.lock = threading.Lock()
+        self.balance = None
+        self.last_expanded = 0
+
+        # Slot metadata, one entry per source row ever added (never reused).
+        self._slot_of = {}
+        self._names = []
+        self._types = []
+        self._amounts = []
+        self._kinds = []
+        self._is_scenario = []
+        self._listed = []
+        self._row_counts = []
+        self._base_rows = 0
+        self._all_rows = 0
+
+        # Occurrences strictly after today, as day offsets from today, with
+        # signed amounts in cents.
+        self._occ_day = np.empty(0, dtype=np.int64)
+        self._occ_cents = np.empty(0, dtype=np.int64)
+        self._occ_slot = np.empty(0, dtype=np.int64)
+        self._occ_seq = np.empty(0, dtype=np.int64)
+
+        # Per-day aggregates over every occupied day, plus running balances
+        # (element 0 is the opening balance), all in cents.
+        self._days = np.empty(0, dtype=np.int64)
+        self._base_net = np.empty(0, dtype=np.int64)
+        self._base_count = np.empty(0, dtype=np.int64)
+        self._all_net = np.empty(0, dtype=np.int64)
+        self._all_count = np.empty(0, dtype=np.int64)
+        self._base_run = np.zeros(1, dtype=np.int64)
+        self._all_run = np.zeros(1, dtype=np.int64)
+
+    @property
+    def live_sources(self):
+        return len(self._slot_of)
+
+    def needs_compaction(self):
+        dead = len(self._names) - len(self._slot_of)
+        return dead > _COMPACTION_RATIO * max(len(self._slot_of), 16)
+
+    # -- expansion -----------------------------------------------------------
+
+    def _expand(self, added, commit):
+        """Expand newly seen rows, applying housekeeping when *commit* is set.
+
+        Returns a list of ``(key, kind, row_meta, days, total)`` tuples where
+        ``days`` holds every occurrence's offset from today and ``total`` is
+        the number of rows the source contributes to ``calc_schedule``'s frame.
+        """
+        today = np.datetime64(self.todaydate, 'D')
+        expanded = []
+        for kind, delete_past_onetime in (('schedule', True), ('scenario', False)):
+            group = [(key, row) for key, row_kind, row in added if row_kind == kind]
+            if not group:
+                continue
+            items = [row for _key, row in group]
+            counts, dates, last_past = expand_occurrences(items, self.todaydate, self.calendar)
+            days = (dates - today).astype(np.int64)
+            bounds = np.concatenate(([0], np.cumsum(counts)))
+            metas = [(item.name, item.type, item.amount) for item in items]
+            if commit:
+                _housekeep_items(items, last_past, self.todaydate, delete_past_onetime)
+            for (key, _row), meta, lo, hi in zip(group, metas, bounds[:-1], bounds[1:]):
+                expanded.append((key, kind, meta, days[lo:hi], int(hi - lo)))
+
+        for key, kind, row in added:
+            if kind == 'hold':
+                meta = (row.name, row.type, row.amount)
+                expanded.append((key, kind, meta, np.ones(1, dtype=np.int64), 1))
+            elif kind == 'skip':
+                meta = (row.name, row.type, row.amount)
+                offset = (_skip_date(row) - self.todaydate).days
+                if offset < 0:
+                    if commit:
+                        db.session.delete(row)
+                    expanded.append((key, kind, meta, np.empty(0, dtype=np.int64), 0))
+                else:
+                    expanded.append((key, kind, meta, np.array([offset], dtype=np.int64), 1))
+        return expanded
+
+    # -- state updates -------------------------------------------------------
+
+    def _remove(self, slots):
+        if not slots:
+            return np.empty(0, dtype=np.int64)
+        for slot in slots:
+            rows = self._row_counts[slot]
+            self._all_rows -= rows
+            if not self._is_scenario[slot]:
+                self._base_rows -= rows
+        gone = np.isin(self._occ_slot, np.array(slots, dtype=np.int64))
+        affected = self._occ_day[gone]
+        keep = ~gone
+        self._occ_day = self._occ_day[keep]
+        self._occ_cents = self._occ_cents[keep]
+        self._occ_slot = self._occ_slot[keep]
+        self._occ_seq = self._occ_seq[keep]
+        return affected
+
+    def _insert(self, expanded):
+        days_parts, amount_parts, slot_parts, seq_parts = [], [], [], []
+        for key, kind, (name, kind_type, amount), days, rows in expanded:
+            slot = len(self._names)
+            self._slot_of[key] = slot
+            self._names.append(name)
+            self._types.append(kind_type)
+            self._amounts.append(amount)
+            self._kinds.append(kind)
+            scenario = kind == 'scenario'
+            self._is_scenario.append(scenario)
+            self._listed.append(not scenario and '(SKIP)' not in name)
+            self._row_counts.append(rows)
+            self._all_rows += rows
+            if not scenario:
+                self._base_rows += rows
+
+            future = days > 0
+            if future.any():
+                count = int(future.sum())
+                days_parts.append(days[future])
+                amount_parts.append(np.full(count, _signed_cents(amount, kind_type), dtype=np.int64))
+                slot_parts.append(np.full(count, slot, dtype=np.int64))
+                seq_parts.append(np.flatnonzero(future))
+        if not days_parts:
+            return np.empty(0, dtype=np.int64)
+        new_days = np.concatenate(days_parts)
+        self._occ_day = np.concatenate([self._occ_day, new_days])
+        self._occ_cents = np.concatenate([self._occ_cents] + amount_parts)
+        self._occ_slot = np.concatenate([self._occ_slot] + slot_parts)
+        self._occ_seq = np.concatenate([self._occ_seq] + seq_parts)
+        return new_days
+
+    def _reaggregate(self, affected, balance_changed):
+        """Refresh per-day nets for *affected* days and re-accumulate balances."""
+        affected = np.unique(affected)
+        if affected.size:
+            scenario = np.array(self._is_scenario, dtype=bool)
+            on_day = np.isin(self._occ_day, affected)
+            index = np.searchsorted(affected, self._occ_day[on_day])
+            cents = self._occ_cents[on_day]
+            base = ~scenario[self._occ_slot[on_day]]
+            size = affected.size
+            base_net = _net_cents(index[base], cents[base], size)
+            base_count = np.bincount(index[base], minlength=size)
+            all_net = _net_cents(index, cents, size)
+            all_count = np.bincount(index, minlength=size)
+
+            keep = ~np.isin(self._days, affected)
+            days = np.concatenate([self._days[keep], affected])
+            order = np.argsort(days, kind='stable')
+            occupied = np.concatenate([self._all_count[keep], all_count])[order] > 0
+            pick = order[occupied]
+            self._days = days[pick]
+            self._base_net = np.concatenate([self._base_net[keep], base_net])[pick]
+            self._base_count = np.concatenate([self._base_count[keep], base_count])[pick]
+            self._all_net = np.concatenate([self._all_net[keep], all_net])[pick]
+            self._all_count = np.concatenate([self._all_count[keep], all_count])[pick]
+            start = int(np.searchsorted(self._days, affected[0]))
+        else:
+            start = len(self._days)
+        if balance_changed:
+            start = 0
+
+        # Sequential cumulative sums seeded with the last unaffected balance,
+        # so the result matches a fresh accumulation from the opening balance.
+        self._base_run = self._accumulate(self._base_run, self._base_net, start)
+        self._all_run = self._accumulate(self._all_run, self._all_net, start)
+
+    def _accumulate(self, run, net, start):
+        head = run[:start + 1].copy()
+        if start == 0:
+            head[0] = self.balance
+        tail = np.cumsum(np.concatenate((head[-1:], net[start:])))[1:]
+        return np.concatenate((head, tail))
+
+    def sync(self, balance, schedules, holds, skips, scenarios=None, commit=True):
+        """Bring the state in line with the given rows and return projections.
+
+        Accepts the same arguments as ``update_cash`` and returns the same
+        ``(trans, run, run_scenario)`` triple.
+        """
+        scenarios = scenarios or []
+        sources = []
+        for kind, rows in (('schedule', schedules), ('hold', holds), ('skip', skips),
+                           ('scenario', scenarios)):
+            sources.extend(zip(_source_keys(kind, rows), [kind] * len(rows), rows))
+
+        current = {key for key, _kind, _row in sources}
+        removed = [slot for key, slot in self._slot_of.items() if key not in current]
+        added = [(key, kind, row) for key, kind, row in sources if key not in self._slot_of]
+
+        expanded = self._expand(added, commit)
+        if commit:
+            db.session.commit()
+
+        for key in [key for key in self._slot_of if key not in current]:
+            del self._slot_of[key]
+        affected = np.concatenate([self._remove(removed), self._insert(expanded)])
+        balance = to_cents(balance)
+        balance_changed = self.balance is None or balance != self.balance
+        self.balance = balance
+        self._reaggregate(affected, balance_changed)
+        self.last_expanded = len(added)
+
+        base_order = [self._slot_of[key] for key, kind, _row in sources if kind != 'scenario']
+        trans = self._transactions(base_order)
+        run = self._run(self._base_rows, self._base_count, self._base_run)
+        run_scenario = None
+        if scenarios:
+            run_scenario = self._run(self._all_rows, self._all_count, self._all_run)
+        return trans, run, run_scenario
+
+    # -- output frames -------------------------------------------------------
+
+    def _dates(self, days):
+        origin = np.datetime64(self.todaydate, 'D')
+        return (origin + days).astype(object).tolist()
+
+    def _transactions(self, base_order):
+        if not self._base_rows:
+            return pd.DataFrame(columns=['name', 'type', 'amount', 'date'])
+
+        rank = np.full(len(self._names), -1, dtype=np.int64)
+        rank[np.array(base_order, dtype=np.int64)] = np.arange(len(base_order))
+        listed = np.array(self._listed, dtype=bool)
+        window = (self._occ_day < _TRANSACTION_WINDOW_DAYS) & listed[self._occ_slot]
+        if not window.any():
+            return pd.DataFrame.from_dict({}, orient="index")
+
+        days = self._occ_day[window]
+        slots = self._occ_slot[window]
+        order = np.lexsort((self._occ_seq[window], rank[slots], days))
+        slots = slots[order].tolist()
+
+        # Listed amounts keep the dtype pandas infers for ``calc_schedule``'s
+        # combined frame, where schedule amounts are first coerced as a group.
+        schedules = [s for s in base_order if self._kinds[s] == 'schedule']
+        coerced = pd.Series([self._amounts[s] for s in schedules], dtype=None).tolist()
+        sample = [amount for s, amount in zip(schedules, coerced) if self._row_counts[s]]
+        sample += [self._amounts[s] for s in base_order
+                   if self._kinds[s] != 'schedule' and self._row_counts[s]]
+        dtype = pd.Series(sample, dtype=None).dtype
+        amounts = pd.Series(
+            [self._amounts[s] for s in slots], dtype=None if dtype == object else dtype
+        )
+        return pd.DataFrame({
+            'name': [self._names[s] for s in slots],
+            'type': [self._types[s] for s in slots],
+            'amount': amounts,
+            'date': self._dates(days[order]),
+        })
+
+    def _run(self, rows, counts, run):
+        today = datetime.today().date()
+        if not rows:
+            return _run_frame(np.array([self.balance], dtype=np.int64), [today])
+        occupied = counts > 0
+        return _run_frame(
+            np.concatenate(([self.balance], run[1:][occupied])),
+            [today] + self._dates(self._days[occupied]),
+        )
+
+
+class IncrementalProjectionStore:
+    """Bounded LRU of ``IncrementalProjection`` states keyed by user."""
+
+    def __init__(self, maxsize=_DEFAULT_MAXSIZE):
+        self._lock = threading.Lock()
+        self._states = OrderedDict()
+        self.maxsize = maxsize
+
+    def configure(self, maxsize):
+        """Resize the store (0 disables incremental projections)."""
+        with self._lock:
+            self.maxsize = max(0, int(maxsize))
+            while len(self._states) > self.maxsize:
+                self._states.popitem(last=False)
+
+    @property
+    def enabled(self):
+        return self.maxsize > 0
+
+    def state_for(self, user_id, commit=True):
+        """Return the current state for *user_id*, starting over when stale."""
+        todaydate = datetime.today().date()
+        calendar = default_business_calendar()
+        key = (user_id, bool(commit))
+        with self._lock:
+            state = self._states.get(key)
+            if (state is None or state.todaydate != todaydate
+                    or state.calendar is not calendar or state.needs_compaction()):
+                state = IncrementalProjection(todaydate, calendar)
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.maxsize:
+                self._states.popitem(last=False)
+            return state
+
+    def discard(self, user_id):
+        with self._lock:
+            self._states.pop((user_id, True), None)
+            self._states.pop((user_id, False), None)
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+
+incremental_projections = IncrementalProjectionStore()
+
+
+def incremental_update_cash(user_id, balance, schedules, holds, skips, scenarios=None, commit=True):
+    """``update_cash`` that only re-expands rows changed since the last call.
+
+    States are kept separately for ``commit=True`` and ``commit=False`` so
+    housekeeping is never skipped for a row first seen by a read-only caller.
+    """
+    state = incremental_projections.state_for(user_id, commit)
+    with state.lock:
+        try:
+            return state.sync(balance, schedules, holds, skips, scenarios, commit=commit)
+        except Exception:
+            incremental_projections.discard(user_id)
+            raise
@@ -1,12 +1,13 @@
 from flask import (
-    request, redirect, url_for, send_from_directory, flash, send_file, Response, session, current_app
+    request, redirect, url_for, send_from_directory, flash, send_file, Response, session, current_app,
+    jsonify,
 )
 from flask_login import login_required, current_user, logout_user
 from flask import Blueprint, render_template
 from .models import (
     Schedule, Scenario, Balance, User, Settings, TextSettings, Email, Hold, Skip,
     GlobalEmailSettings, AISettings, PasskeyCredential, UserToken, PasswordSetupToken,
-    Subscription, PlaidConnection,
+    Subscription, PlaidConnection, Tombstone,
 )
 from app import db, limiter
 from datetime import datetime, timezone
@@ -18,7 +19,12 @@ from urllib.parse import urlparse
 from sqlalchemy import desc, extract, asc
 from sqlalchemy.exc import IntegrityError
 from werkzeug.security import generate_password_hash, check_password_hash
-from .cashflow import update_cash, plot_cash, calculate_cash_risk_score
+from .cashflow import plot_cash, calculate_cash_risk_score
+from .projection_cache import cached_update_cash
+from .data_revision import bump_data_revision
+from .sync import delete_with_tombstones
+from .db_pool import pool_metrics
+from .subscription import owner_for_user
 from .auth import admin_required, global_admin_required, account_owner_required
 from .files import export, upload, version
 from .getemail import send_account_activation_notification
@@ -76,10 +82,7 @@ def get_effective_user_id():
 
 def _get_balance_owner_user():
     """Return the User whose balance is the source of truth for the request."""
-    effective_id = get_effective_user_id()
-    if effective_id == current_user.id:
-        return current_user._get_current_object()
-    return User.query.get(effective_id)
+    return owner_for_user(current_user._get_current_object())
 
 
 @main.route('/', methods=('GET', 'POST'))
@@ -100,6 +103,7 @@ def index():
     if balance is None:
         balance = Balance(amount='0', date=datetime.today(), user_id=user_id)
         db.session.add(balance)
+        bump_data_revision(user_id)
         try:
             db.session.commit()
         except IntegrityError:
@@ -114,6 +118,7 @@ def index():
             logger.warning("Invalid balance for user %s (%s), resetting to 0: %s", user_id, type(exc).__name__, exc)
             balance.amount = '0'
             balance.date = datetime.today()
+            bump_data_revision(user_id)
             db.session.commit()
 
     # Pre-filter data by user before passing to cashflow
@@ -122,10 +127,16 @@ def index():
     skips = Skip.query.filter_by(user_id=user_id).all()
     scenarios = Scenario.query.filter_by(user_id=user_id).all()
 
-    trans, run, run_scenario = update_cash(float(balance.amount), schedules, holds, skips, scenarios)
+    trans, run, run_scenario = cached_update_cash(
+        float(balance.amount), schedules, holds, skips, scenarios, commit=False, user_id=user_id
+    )
 
     # plot cash flow results
-    minbalance, min_scenario, graphJSON = plot_cash(run, run_scenario)
+    minbalance, min_scenario, graphJSON = plot_cash(
+        run, run_scenario,
+        max_points=current_app.config["CHART_MAX_POINTS"],
+        method=current_app.config["CHART_DOWNSAMPLE"],
+    )
 
     # calculate cash risk score
     cash_risk = calculate_cash_risk_score(float(balance.amount), run)
@@ -260,6 +271,7 @@ def create():
             flash("Schedule already exists")
             return redirect(url_for('main.schedule'))
         db.session.add(schedule)
+        bump_data_revision(user_id)
         db.session.commit()
         flash("Added Successfully")
 
@@ -313,6 +325,7 @@ def update():
                 datetime.strptime(startdate, format).day):
             my_data.firstdate = datetime.strptime(startdate, format).date()
         my_data.startdate = datetime.strptime(startdate, format).date()
+        bump_data_revision(user_id)
         db.session.commit()
         flash("Updated Successfully")
 
@@ -330,6 +343,7 @@ def addhold(id):
     schedule = Schedule.query.filter_by(id=int(id), user_id=user_id).first()
     hold = Hold(name=schedule.name, type=schedule.type, amount=schedule.amount, user_id=user_id)
     db.session.add(hold)
+    bump_data_revision(user_id)
     db.session.commit()
     flash("Added Hold")
 
@@ -349,7 +363,9 @@ def addskip(id):
     holds = Hold.query.filter_by(user_id=user_id).all()
     skips = Skip.query.filter_by(user_id=user_id).all()
 
-    trans, run, _ = update_cash(float(balance.amount), schedules, holds, skips)
+    trans, run, _ = cached_update_cash(
+        float(balance.amount), schedules, holds, skips, commit=False, user_id=user_id
+    )
     transaction = trans.loc[int(id)]
     trans_type = ""
     if transaction['type'] == "Expense":
@@ -358,6 +374,7 @@ def addskip(id):
         trans_type = "Expense"
     skip = Skip(name=transaction['name'] + " (SKIP)", type=trans_type, amount=transaction['amount'], date=transaction['date'], user_id=user_id)
     db.session.add(skip)
+    bump_data_revision(user_id)
     db.session.commit()
     flash("Added Skip")
 
@@ -374,6 +391,7 @@ def holds_delete(id):
 
     if hold:
         db.session.delete(hold)
+        bump_data_revision(user_id)
         db.session.commit()
         flash("Deleted Successfully")
 
@@ -390,6 +408,7 @@ def skips_delete(id):
 
     if skip:
         db.session.delete(skip)
+        bump_data_revision(user_id)
         db.session.commit()
         flash("Deleted Successfully")
 
@@ -402,7 +421,8 @@ def skips_delete(id):
 def clear_holds():
     # clear holds
     user_id = get_effective_user_id()
-    db.session.query(Hold).filter_by(user_id=user_id).delete()
+    delete_with_tombstones(Hold, Hold.user_id == user_id)
+    bump_data_revision(user_id)
     db.session.commit()
 
     return redirect(url_for('main.holds'))
@@ -414,7 +434,8 @@ def clear_holds():
 def clear_skips():
     # clear skips
     user_id = get_effective_user_id()
-    db.session.query(Skip).filter_by(user_id=user_id).delete()
+    delete_with_tombstones(Skip, Skip.user_id == user_id)
+    bump_data_revision(user_id)
     db.session.commit()
 
     return redirect(url_for('main.holds'))
@@ -430,6 +451,7 @@ def schedule_delete(id):
 
     if schedule:
         db.session.delete(schedule)
+        bump_data_revision(user_id)
         db.session.commit()
         flash("Deleted Successfully")
 
@@ -486,6 +508,7 @@ def create_scenario():
             flash("Scenario already exists")
             return redirect(url_for('main.scenarios'))
         db.session.add(scenario)
+        bump_data_revision(user_id)
         db.session.commit()
         flash("Added Successfully")
 
@@ -539,6 +562,7 @@ def update_scenario():
                 datetime.strptime(startdate, format).day):
             current.firstdate = datetime.strptime(startdate, format).date()
         current.startdate = datetime.strptime(startdate, format).date()
+        bump_data_revision(user_id)
         db.session.commit()
         flash("Updated Successfully")
 
@@ -556,6 +580,7 @@ def scenario_delete(id):
 
     if scenario:
         db.session.delete(scenario)
+        bump_data_revision(user_id)
         db.session.commit()
         flash("Deleted Successfully")
 
@@ -674,10 +699,12 @@ def balance():
         if existing is not None:
             existing.amount = amount
             record_manual_balance_entry(owner)
+            bump_data_revision(user_id)
             db.session.commit()
         else:
             db.session.add(Balance(amount=amount, date=balance_date, user_id=user_id))
             record_manual_balance_entry(owner)
+            bump_data_revision(user_id)
             try:
                 db.session.commit()
             except IntegrityError:
@@ -687,6 +714,7 @@ def balance():
                     raise
                 existing.amount = amount
                 record_manual_balance_entry(owner)
+                bump_data_revision(user_id)
                 db.session.commit()
 
         return redirect(url_for('main.index'))
@@ -807,7 +835,9 @@ def transactions():
     holds = Hold.query.filter_by(user_id=user_id).all()
     skips = Skip.query.filter_by(user_id=user_id).all()
 
-    trans, run, _ = update_cash(float(balance.amount), schedules, holds, skips)
+    trans, run, _ = cached_update_cash(
+        float(balance.amount), schedules, holds, skips, commit=False, user_id=user_id
+    )
 
     return render_template('transactions_table.html', total=trans.to_dict(orient='records'))
 
@@ -973,6 +1003,7 @@ def _delete_user_owned_rows(user_ids):
         return
 
     for model in (
+        Tombstone,
         PasswordSetupToken,
         UserToken,
         PasskeyCredential,
@@ -1398,6 +1429,14 @@ def global_admin_panel():
                          standalone_users=standalone_users)
 
 
+@main.route('/global_admin/db_pool')
+@login_required
+@global_admin_required
+def global_admin_db_pool():
+    """Connection-pool checkout metrics for this worker process (JSON)."""
+    return jsonify(pool_metrics.stats(db.engine.pool))
+
+
 @main.route('/global_email_settings', methods=['GET', 'POST'])
 @login_required
 @global_admin_required
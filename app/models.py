@@ -33,6 +33,14 @@ class User(UserMixin, db.Model):
     # /accounts/get sync compares this against Plaid's cached freshness so a
     # stale cached balance cannot overwrite a newer manually-entered value.
     last_manual_balance_entry_at = db.Column(db.DateTime, nullable=True)
+    # Bumped (app/data_revision.py) by every write to this user's schedules,
+    # scenarios, holds, skips or balance; projection ETags and caches compare
+    # it instead of re-reading the rows.
+    data_revision = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    # Bumped (app/api/auth_utils.py) whenever any of this user's API tokens
+    # is revoked; workers compare it against their bearer-token cache so a
+    # revocation takes effect everywhere on the next request.
+    auth_revision = db.Column(db.Integer, default=0, server_default='0', nullable=False)
 
     # Relationships
     guests = db.relationship(
@@ -75,12 +83,28 @@ class Schedule(db.Model):
     startdate = db.Column(db.Date)
     type = db.Column(db.String(100))
     firstdate = db.Column(db.Date)
+    # Touched on every insert/update (likewise on Scenario, Balance, Hold and
+    # Skip).  ``sync_revision`` is reset to NULL by every write and stamped
+    # with the owner's ``data_revision`` at commit; ``/api/v1/sync`` returns
+    # rows stamped after a client's cursor (app/sync.py).
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    sync_revision = db.Column(db.Integer, onupdate=db.null())
 
     # Relationships
     user = db.relationship('User', backref='schedules')
 
-    # Unique constraint per user
-    __table_args__ = (db.UniqueConstraint('user_id', 'name', name='_user_schedule_uc'),)
+    # The unique constraint doubles as the (user_id, name) lookup index; the
+    # expression index serves the day-of-month ordering of the schedule page.
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'name', name='_user_schedule_uc'),
+        db.Index('ix_schedule_user_id_start_day', user_id, db.extract('day', startdate)),
+        db.Index('ix_schedule_user_id_sync_revision', 'user_id', 'sync_revision'),
+    )
 
 
 class Scenario(db.Model):
@@ -92,12 +116,22 @@ class Scenario(db.Model):
     startdate = db.Column(db.Date)
     type = db.Column(db.String(100))
     firstdate = db.Column(db.Date)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    sync_revision = db.Column(db.Integer, onupdate=db.null())
 
     # Relationships
     user = db.relationship('User', backref='scenarios')
 
-    # Unique constraint per user
-    __table_args__ = (db.UniqueConstraint('user_id', 'name', name='_user_scenario_uc'),)
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'name', name='_user_scenario_uc'),
+        db.Index('ix_scenario_user_id_start_day', user_id, db.extract('day', startdate)),
+        db.Index('ix_scenario_user_id_sync_revision', 'user_id', 'sync_revision'),
+    )
 
 
 class Balance(db.Model):
@@ -105,6 +139,13 @@ class Balance(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     amount = db.Column(db.Numeric(10, 2))
     date = db.Column(db.Date)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    sync_revision = db.Column(db.Integer, onupdate=db.null())
 
     # Relationships
     user = db.relationship('User', backref='balances')
@@ -112,6 +153,7 @@ class Balance(db.Model):
     __table_args__ = (
         db.Index('ix_balance_user_id_date_id', 'user_id', 'date', 'id'),
         db.UniqueConstraint('user_id', 'date', name='uq_balance_user_id_date'),
+        db.Index('ix_balance_user_id_sync_revision', 'user_id', 'sync_revision'),
     )
 
 
@@ -121,22 +163,69 @@ class Hold(db.Model):
     amount = db.Column(db.Numeric(10, 2))
     name = db.Column(db.String(100))
     type = db.Column(db.String(100))
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    sync_revision = db.Column(db.Integer, onupdate=db.null())
 
     # Relationships
     user = db.relationship('User', backref='holds')
 
+    __table_args__ = (
+        db.Index('ix_hold_user_id_sync_revision', 'user_id', 'sync_revision'),
+    )
+
 
 class Skip(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     name = db.Column(db.String(100))
     date = db.Column(db.Date)
     amount = db.Column(db.Numeric(10, 2))
     type = db.Column(db.String(100))
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    sync_revision = db.Column(db.Integer, onupdate=db.null())
 
     # Relationships
     user = db.relationship('User', backref='skips')
 
+    __table_args__ = (
+        db.Index('ix_skip_user_id_date', 'user_id', 'date'),
+        db.Index('ix_skip_user_id_sync_revision', 'user_id', 'sync_revision'),
+    )
+
+
+class Tombstone(db.Model):
+    """Record of a deleted schedule, scenario, hold, skip or balance row.
+
+    Written automatically when such a row is deleted (app/sync.py) so delta
+    sync clients learn about deletions; pruned by housekeeping after
+    ``TOMBSTONE_RETENTION_DAYS``.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)
+    object_id = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    sync_revision = db.Column(db.Integer)
+
+    __table_args__ = (
+        db.Index('ix_tombstone_user_id_deleted_at', 'user_id', 'deleted_at'),
+        db.Index('ix_tombstone_user_id_sync_revision', 'user_id', 'sync_revision'),
+    )
+
 
 class Settings(db.Model):
     id = db.Column(db.Integer, primary_key=True)
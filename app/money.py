@@ -0,0 +1,66 @@
+"""Integer-cent amounts for the projection pipeline.
+
+Amounts are stored as ``Numeric(10, 2)`` and reach Python as ``Decimal``.
+The projection engine converts each source row's amount to ``int64`` cents
+once, keeps every per-day net and running balance in integer cents, and only
+converts back at the edges:
+
+- ``amount_cents`` columns carry the exact value through projection frames,
+- the float ``amount`` column next to it is ``amount_cents / 100`` (the
+  nearest double to the two-decimal value, so it never drifts),
+- API strings are formatted from cents by ``format_cents``.
+
+Integer sums are exact and associative, so long running balances carry no
+float error and the full and incremental projections agree exactly.
+Missing amounts count as zero cents; values with more than two decimals
+round half to even.
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import numpy as np
+import pandas as pd
+
+
+_CENT = Decimal('0.01')
+
+
+def to_cents(value) -> int:
+    """Convert a ``Decimal``, number or numeric string to integer cents."""
+    if value is None:
+        return 0
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    if not value.is_finite():
+        return 0
+    return int(value.quantize(_CENT, rounding=ROUND_HALF_EVEN).scaleb(2))
+
+
+def cents_array(values) -> np.ndarray:
+    """Convert a sequence of amounts to an ``int64`` array of cents.
+
+    Vectorized through float64, which is exact for two-decimal amounts far
+    beyond ``Numeric(10, 2)``'s range.
+    """
+    amounts = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=float)
+    return np.nan_to_num(np.rint(amounts * 100), nan=0.0).astype(np.int64)
+
+
+def frame_cents(df) -> np.ndarray:
+    """Return a frame's amounts as cents, preferring its ``amount_cents`` column."""
+    if 'amount_cents' in df.columns:
+        return df['amount_cents'].to_numpy(dtype=np.int64)
+    return cents_array(df['amount'])
+
+
+def cents_to_amounts(cents) -> np.ndarray:
+    """Return float amounts for *cents* (for charts, templates and scoring)."""
+    return np.asarray(cents, dtype=np.int64) / 100
+
+
+def format_cents(cents) -> str:
+    """Format integer cents as a 2-decimal-place string, e.g. ``"-12.05"``."""
+    cents = int(cents)
+    sign = '-' if cents < 0 else ''
+    whole, frac = divmod(abs(cents), 100)
+    return f"{sign}{whole}.{frac:02d}"
@@ -9,7 +9,8 @@ from datetime import datetime, timedelta, timezone
 from flask import current_app
 
 from app import db
-from app.models import PasswordSetupToken, User, UserToken
+from app.auth_revision import revoke_user_tokens
+from app.models import PasswordSetupToken, User
 
 DEFAULT_PASSWORD_SETUP_TTL_MINUTES = 60
 PASSWORD_SETUP_ROUTE = "/auth/set-password"
@@ -73,6 +74,6 @@ def consume_password_setup_token(raw_token: str) -> User | None:
 
     token_record.used_at = now
     # Revoke active API tokens so password setup starts from clean auth state.
-    UserToken.query.filter_by(user_id=user.id).delete(synchronize_session=False)
+    revoke_user_tokens(user.id)
     db.session.commit()
     return user
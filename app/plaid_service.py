@@ -23,6 +23,7 @@ from sqlalchemy.exc import IntegrityError
 from app import db
 from app.crypto_utils import encrypt_password, decrypt_password
 from app.models import Balance, Email, PlaidConnection, User
+from app.data_revision import bump_data_revision
 
 logger = logging.getLogger(__name__)
 
@@ -715,6 +716,7 @@ def _newest_email_balance_datetime(user_id: int) -> Optional[datetime]:
 
 def _upsert_today_balance(user_id: int, amount: float) -> Balance:
     today = _today_date()
+    bump_data_revision(user_id)
     existing = (
         Balance.query.filter_by(user_id=user_id, date=today)
         .order_by(desc(Balance.id))
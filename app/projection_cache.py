@@ -0,0 +1,153 @@
+"""In-process LRU cache for cash-flow projections.
+
+The dashboard, the transactions page and the mobile API (``/dashboard``,
+``/projections``, ``/risk-score``) all run ``update_cash`` over the same rows
+within seconds of each other.  ``cached_update_cash`` keys each projection on
+a stable content hash of its inputs — the balance, every schedule, hold, skip
+and scenario row, and today's date — and returns the previously computed
+``(trans, run, run_scenario)`` when nothing changed.
+
+Because the key is derived from content rather than from a user id, any write
+that changes a row simply produces a new key; stale entries age out of the
+LRU.  Each process (gunicorn worker) keeps its own cache.
+
+On a miss, callers that pass ``user_id`` are served by
+``app.incremental_projection``, which re-expands only the rows that changed
+since that user's previous projection.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from .cashflow import update_cash
+from .incremental_projection import incremental_projections, incremental_update_cash
+
+
+_DEFAULT_MAXSIZE = 256
+
+
+def _row_key(row, fields):
+    return tuple(str(getattr(row, field, None)) for field in fields)
+
+
+_ITEM_FIELDS = ('name', 'amount', 'frequency', 'startdate', 'firstdate', 'type')
+_HOLD_FIELDS = ('name', 'amount', 'type')
+_SKIP_FIELDS = ('name', 'date', 'amount', 'type')
+
+
+def projection_key(balance, schedules, holds, skips, scenarios=None, commit=True, todaydate=None,
+                   horizon_days=None):
+    """Return a stable hex digest identifying a projection's inputs."""
+    todaydate = todaydate or datetime.today().date()
+    content = (
+        repr(float(balance)),
+        todaydate.isoformat(),
+        bool(commit),
+        horizon_days,
+        tuple(_row_key(s, _ITEM_FIELDS) for s in schedules),
+        tuple(_row_key(h, _HOLD_FIELDS) for h in holds),
+        tuple(_row_key(s, _SKIP_FIELDS) for s in skips),
+        tuple(_row_key(s, _ITEM_FIELDS) for s in (scenarios or [])),
+    )
+    return hashlib.blake2b(repr(content).encode(), digest_size=16).hexdigest()
+
+
+class ProjectionCache:
+    """Bounded, thread-safe LRU of projection results with hit/miss counters."""
+
+    def __init__(self, maxsize=_DEFAULT_MAXSIZE):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, maxsize):
+        """Resize the cache (0 disables it), evicting the oldest entries."""
+        with self._lock:
+            self.maxsize = max(0, int(maxsize))
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+
+projection_cache = ProjectionCache()
+
+
+def _copy_result(result):
+    trans, run, run_scenario = result
+    return (
+        trans.copy(),
+        run.copy(),
+        run_scenario.copy() if run_scenario is not None else None,
+    )
+
+
+def cached_update_cash(balance, schedules, holds, skips, scenarios=None, commit=True, user_id=None,
+                       horizon_days=None):
+    """``update_cash`` backed by the process-wide projection cache.
+
+    When *user_id* is given and incremental projections are enabled, a miss
+    applies only the changed rows to that user's incremental state instead of
+    recomputing everything (fixed-count projections only; a custom
+    *horizon_days* is always computed by ``update_cash``).  Callers receive copies, so mutating a returned
+    frame never corrupts the cached entry.
+    """
+    key = projection_key(
+        balance, schedules, holds, skips, scenarios, commit, horizon_days=horizon_days
+    )
+    cached = projection_cache.get(key)
+    if cached is not None:
+        return _copy_result(cached)
+
+    if user_id is not None and horizon_days is None and incremental_projections.enabled:
+        result = incremental_update_cash(
+            user_id, balance, schedules, holds, skips, scenarios, commit=commit
+        )
+    else:
+        result = update_cash(
+            balance, schedules, holds, skips, scenarios, commit=commit, horizon_days=horizon_days
+        )
+    projection_cache.put(key, result)
+    return _copy_result(result)
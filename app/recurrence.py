@@ -0,0 +1,352 @@
+"""Vectorized recurrence expansion for schedules and scenarios.
+
+``calc_schedule`` used to expand every schedule occurrence by occurrence with
+``datetime.strptime``, ``relativedelta`` and a pandas ``BDay`` offset per row.
+This module builds the occurrences of a whole frequency group at once as
+NumPy ``datetime64[D]`` arrays and reproduces the legacy rules in closed form:
+
+- the ``_fast_forward_start`` catch-up for start dates that have not been
+  advanced in a long time (including the cumulative month-end day loss that
+  repeated ``relativedelta`` additions cause);
+- the month-end clamp that walks a shortened day back towards the day of
+  ``firstdate`` (at most three days, never past the end of the month);
+- the business-day roll: monthly income rolls back to the preceding business
+  day, everything else except one-time items rolls forward (see
+  ``app.business_days`` for the weekend/holiday calendar).
+"""
+
+from __future__ import annotations
+
+import heapq
+from datetime import date
+from functools import partial
+
+import numpy as np
+
+from .business_days import default_business_calendar
+
+
+# Frequencies stepped in calendar months: (months per step, occurrences).
+MONTH_FREQUENCIES = {
+    'Monthly': (1, 13),
+    'Quarterly': (3, 4),
+    'Yearly': (12, 2),
+}
+
+# Frequencies stepped in days: (days per step, occurrences).
+DAY_FREQUENCIES = {
+    'Weekly': (7, 53),
+    'BiWeekly': (14, 27),
+}
+
+# Bounds for caller-supplied projection horizons (``iter_occurrences``).
+MIN_HORIZON_DAYS = 30
+MAX_HORIZON_DAYS = 3653
+
+# Occurrences computed at a time by each lazy per-schedule stream.
+_STREAM_CHUNK = 16
+
+# Frequencies whose shortened month-end days are walked back to ``firstdate``.
+_FIRSTDATE_CLAMPED = {'Monthly', 'Quarterly'}
+
+# Upper bound on fast-forward steps; mirrors the loop guard that
+# ``_fast_forward_start`` has always used (~400 years of monthly steps).
+_MAX_FAST_FORWARD_STEPS = 5000
+
+# Four years of months always include every calendar month of a stepping cycle
+# and at least one non-leap February, so the running minimum of month lengths
+# is stable after this many months.
+_MONTH_LENGTH_CYCLE = 48
+
+_NAT = np.datetime64('NaT', 'D')
+
+
+def _month_index(days):
+    """Return months since the epoch for a ``datetime64[D]`` array."""
+    return days.astype('datetime64[M]').astype(np.int64)
+
+
+def _day_of_month(days):
+    """Return the 1-based day of month for a ``datetime64[D]`` array."""
+    return (days - days.astype('datetime64[M]').astype('datetime64[D]')).astype(np.int64) + 1
+
+
+def _days_in_month(month_index):
+    """Return the number of days in each month of *month_index*."""
+    months = np.asarray(month_index, dtype=np.int64).astype('datetime64[M]')
+    return ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+
+
+def _month_day(month_index, day):
+    """Build ``datetime64[D]`` values from month indexes and days of month."""
+    months = np.asarray(month_index, dtype=np.int64).astype('datetime64[M]')
+    return months.astype('datetime64[D]') + (np.asarray(day, dtype=np.int64) - 1)
+
+
+def _min_month_length(start_month, step, steps):
+    """Shortest month visited by *steps* additions of *step* months.
+
+    ``relativedelta`` clamps the day to the end of each month it lands on, so
+    after repeated additions the day is the minimum of the original day and
+    every month length visited.  Returns 31 where no step was taken.
+    """
+    span = -(-_MONTH_LENGTH_CYCLE // step)
+    offsets = np.arange(1, span + 1, dtype=np.int64) * step
+    lengths = _days_in_month(start_month[:, None] + offsets[None, :])
+    visited = offsets[None, :] <= (steps[:, None] * step)
+    return np.where(visited, lengths, 31).min(axis=1, initial=31)
+
+
+def _month_window(starts, step, count, todaydate):
+    """Return each schedule's fast-forwarded first month and day of month.
+
+    The window is the legacy one: the smallest fast-forward that puts the
+    *count*-th occurrence's month at or past today's month (one more step
+    when it lands on today's month without reaching past today's day).
+    """
+    today = np.datetime64(todaydate, 'D')
+    today_month = int(_month_index(today))
+    today_day = int(_day_of_month(today))
+
+    start_month = _month_index(starts)
+    start_day = _day_of_month(starts)
+
+    behind = today_month - start_month - (count - 1) * step
+    steps = np.maximum(0, -(-behind // step))
+    window_end = start_month + (steps + count - 1) * step
+    day = np.minimum(start_day, _min_month_length(start_month, step, steps))
+    edge_day = np.minimum(day, _days_in_month(today_month))
+    short = (window_end == today_month) & (edge_day <= today_day)
+    steps = np.minimum(np.where(short, steps + 1, steps), _MAX_FAST_FORWARD_STEPS)
+    day = np.minimum(start_day, _min_month_length(start_month, step, steps))
+    return start_month + steps * step, day
+
+
+def _month_occurrences(base_month, day, first_days, step, ks, clamp_to_first):
+    """Occurrences *ks* (0-based) of month-stepped windows, one row per schedule."""
+    months = base_month[:, None] + ks[None, :] * step
+    lengths = _days_in_month(months)
+    days = np.minimum(day[:, None], lengths)
+    if clamp_to_first:
+        walked = np.minimum(np.minimum(first_days[:, None], days + 3), lengths)
+        days = np.where(first_days[:, None] > days, np.maximum(days, walked), days)
+    return _month_day(months, days)
+
+
+def _expand_month_steps(starts, first_days, step, count, todaydate, clamp_to_first):
+    """Expand month-stepped schedules into a ``(len(starts), count)`` array."""
+    base_month, day = _month_window(starts, step, count, todaydate)
+    return _month_occurrences(
+        base_month, day, first_days, step, np.arange(count, dtype=np.int64), clamp_to_first
+    )
+
+
+def _day_window(starts, step, count, todaydate):
+    """Return each day-stepped schedule's fast-forwarded first occurrence."""
+    today = np.datetime64(todaydate, 'D')
+    window = (count - 1) * step
+    behind = (today - starts).astype(np.int64) - window
+    steps = np.where(behind >= 0, behind // step + 1, 0)
+    steps = np.minimum(steps, _MAX_FAST_FORWARD_STEPS)
+    return starts + steps * step
+
+
+def _expand_day_steps(starts, step, count, todaydate):
+    """Expand day-stepped schedules into a ``(len(starts), count)`` array."""
+    base = _day_window(starts, step, count, todaydate)
+    return base[:, None] + np.arange(count, dtype=np.int64)[None, :] * step
+
+
+def _item_arrays(items):
+    """Column arrays (frequency, income flag, start, first, valid) for *items*."""
+    frequencies = np.array([item.frequency for item in items], dtype=object)
+    income = np.array([item.type == 'Income' for item in items], dtype=bool)
+    starts = np.array(
+        [item.startdate if item.startdate else _NAT for item in items], dtype='datetime64[D]'
+    )
+    firsts = np.array(
+        [item.firstdate if item.firstdate else _NAT for item in items], dtype='datetime64[D]'
+    )
+    firsts = np.where(np.isnat(firsts), starts, firsts)
+    return frequencies, income, starts, firsts, ~np.isnat(starts)
+
+
+def expand_occurrences(items, todaydate: date, calendar=None):
+    """Expand schedule-like rows into their projected occurrence dates.
+
+    Args:
+        items: Sequence of objects exposing ``startdate``, ``firstdate``,
+            ``frequency`` and ``type`` (Schedule / Scenario rows).
+        todaydate: The projection's notion of "today".
+        calendar: ``BusinessCalendar`` used for the business-day roll;
+            defaults to the process-wide calendar.
+
+    Returns:
+        Tuple ``(counts, dates, last_past)``:
+            counts: ``int64`` array with the number of occurrences per item.
+            dates: ``datetime64[D]`` array of business-day rolled dates,
+                concatenated in item order.
+            last_past: ``datetime64[D]`` array with each item's latest
+                unrolled occurrence on or before *todaydate* (``NaT`` when
+                none), used for start-date bookkeeping.
+    """
+    size = len(items)
+    counts = np.zeros(size, dtype=np.int64)
+    last_past = np.full(size, _NAT)
+    if not size:
+        return counts, np.array([], dtype='datetime64[D]'), last_past
+
+    today = np.datetime64(todaydate, 'D')
+    frequencies, income, starts, firsts, valid = _item_arrays(items)
+
+    groups = []
+    for frequency, (step, count) in MONTH_FREQUENCIES.items():
+        idx = np.flatnonzero(valid & (frequencies == frequency))
+        if idx.size:
+            raw = _expand_month_steps(
+                starts[idx], _day_of_month(firsts[idx]), step, count, todaydate,
+                frequency in _FIRSTDATE_CLAMPED,
+            )
+            groups.append((frequency, idx, raw))
+    for frequency, (step, count) in DAY_FREQUENCIES.items():
+        idx = np.flatnonzero(valid & (frequencies == frequency))
+        if idx.size:
+            groups.append((frequency, idx, _expand_day_steps(starts[idx], step, count, todaydate)))
+
+    if calendar is None:
+        calendar = default_business_calendar()
+
+    onetime = np.flatnonzero(valid & (frequencies == 'Onetime') & (starts >= today))
+
+    for _frequency, idx, raw in groups:
+        counts[idx] = raw.shape[1]
+        past = raw <= today
+        has_past = past.any(axis=1)
+        last = raw.shape[1] - 1 - np.argmax(past[:, ::-1], axis=1)
+        last_past[idx[has_past]] = raw[has_past, last[has_past]]
+    counts[onetime] = 1
+
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    dates = np.empty(int(counts.sum()), dtype='datetime64[D]')
+    for frequency, idx, raw in groups:
+        positions = offsets[idx][:, None] + np.arange(raw.shape[1], dtype=np.int64)[None, :]
+        rolled = calendar.roll_forward(raw)
+        if frequency == 'Monthly':
+            backward = calendar.roll_backward(raw)
+            rolled = np.where(income[idx][:, None], backward, rolled)
+        dates[positions] = rolled
+    dates[offsets[onetime]] = starts[onetime]
+    return counts, dates, last_past
+
+
+def validate_horizon(horizon_days):
+    """Return *horizon_days* as an int within the supported range.
+
+    Raises:
+        ValueError: if it is not an integer between ``MIN_HORIZON_DAYS`` and
+            ``MAX_HORIZON_DAYS``.
+    """
+    if isinstance(horizon_days, bool) or int(horizon_days) != horizon_days:
+        raise ValueError(f"horizon_days must be an integer, got {horizon_days!r}")
+    horizon_days = int(horizon_days)
+    if not MIN_HORIZON_DAYS <= horizon_days <= MAX_HORIZON_DAYS:
+        raise ValueError(
+            f"horizon_days must be between {MIN_HORIZON_DAYS} and {MAX_HORIZON_DAYS}, "
+            f"got {horizon_days}"
+        )
+    return horizon_days
+
+
+def _single_month_occurrences(base_month, day, first_day, step, clamp_to_first, ks):
+    return _month_occurrences(
+        np.array([base_month]), np.array([day]), np.array([first_day]), step, ks, clamp_to_first
+    )[0]
+
+
+def _single_day_occurrences(base, step, ks):
+    return base + ks * step
+
+
+def _stream(position, occurrences, roll, today, end):
+    """Lazily yield ``(date, position, seq)`` for one schedule's occurrences.
+
+    *occurrences* maps 0-based occurrence numbers to unrolled dates; they are
+    computed ``_STREAM_CHUNK`` at a time.  Rolled dates never overtake the
+    next occurrence (steps are at least a week), so the stream is sorted and
+    stops at the first date past *end*.
+    """
+    k = 0
+    while True:
+        ks = np.arange(k, k + _STREAM_CHUNK, dtype=np.int64)
+        rolled = roll(occurrences(ks))
+        for seq, day in zip(ks.tolist(), rolled):
+            if day > end:
+                return
+            if day > today:
+                yield day, position, seq
+        k += _STREAM_CHUNK
+
+
+def iter_occurrences(items, todaydate: date, horizon_days, calendar=None):
+    """Yield upcoming occurrences of schedule-like rows in date order.
+
+    Each schedule gets a lazy stream that starts from the same fast-forwarded
+    window as ``expand_occurrences`` but runs on until the horizon instead of
+    stopping after a fixed number of occurrences; the streams are heap-merged
+    so only the occurrences that are actually consumed get computed.
+
+    Args:
+        items: Sequence of Schedule / Scenario rows.
+        todaydate: The projection's notion of "today".
+        horizon_days: Days past *todaydate* to project, between
+            ``MIN_HORIZON_DAYS`` and ``MAX_HORIZON_DAYS``.
+        calendar: ``BusinessCalendar`` for the business-day roll; defaults to
+            the process-wide calendar.
+
+    Yields:
+        ``(datetime64[D], position)`` for every occurrence after *todaydate*
+        and on or before ``todaydate + horizon_days``, where *position* is the
+        item's index in *items*.  Ties are ordered by position, then by
+        occurrence number, like the legacy stable sort.
+
+    Raises:
+        ValueError: if *horizon_days* is out of range.
+    """
+    horizon_days = validate_horizon(horizon_days)
+    if not len(items):
+        return
+    today = np.datetime64(todaydate, 'D')
+    end = today + horizon_days
+    frequencies, income, starts, firsts, valid = _item_arrays(items)
+    if calendar is None:
+        calendar = default_business_calendar()
+
+    streams = []
+    for frequency, (step, count) in MONTH_FREQUENCIES.items():
+        idx = np.flatnonzero(valid & (frequencies == frequency))
+        if not idx.size:
+            continue
+        base_month, day = _month_window(starts[idx], step, count, todaydate)
+        first_days = _day_of_month(firsts[idx])
+        clamp = frequency in _FIRSTDATE_CLAMPED
+        for j, position in enumerate(idx.tolist()):
+            roll = calendar.roll_backward if frequency == 'Monthly' and income[position] \
+                else calendar.roll_forward
+            occurrences = partial(
+                _single_month_occurrences, base_month[j], day[j], first_days[j], step, clamp
+            )
+            streams.append(_stream(position, occurrences, roll, today, end))
+    for frequency, (step, count) in DAY_FREQUENCIES.items():
+        idx = np.flatnonzero(valid & (frequencies == frequency))
+        if not idx.size:
+            continue
+        bases = _day_window(starts[idx], step, count, todaydate)
+        for base, position in zip(bases, idx.tolist()):
+            occurrences = partial(_single_day_occurrences, base, step)
+            streams.append(_stream(position, occurrences, calendar.roll_forward, today, end))
+
+    onetime = np.flatnonzero(valid & (frequencies == 'Onetime') & (starts > today) & (starts <= end))
+    streams.extend(iter([(starts[position], position, 0)]) for position in onetime.tolist())
+
+    for day, position, _seq in heapq.merge(*streams):
+        yield day, position
@@ -0,0 +1,112 @@
+"""Opt-in SQLite performance profile.
+
+The Docker image defaults ``DATABASE_URL`` to a SQLite file shared by
+gunicorn's threads and the cron-driven ``getemail``/``housekeeping`` jobs.
+In SQLite's default rollback-journal mode a committing writer locks every
+reader out and long reads hold writers off, so mixed load stalls on
+"database is locked".  With ``SQLITE_PERFORMANCE_PROFILE=true`` every new
+connection runs:
+
+- ``busy_timeout``          wait for a competing writer instead of failing
+- ``journal_mode=WAL``      readers and the writer no longer block each other
+- ``synchronous=NORMAL``    fsync at checkpoints, not every commit (durable
+                            against application crashes, safe in WAL mode)
+- ``cache_size``/``mmap_size``  larger page cache and memory-mapped reads
+- ``temp_store=MEMORY``     sorts and temporary indexes stay off disk
+
+``init_sqlite_profile`` validates the settings, installs the connect hook
+and checks at startup that WAL actually took effect (it cannot on an
+in-memory database or on file systems without shared-memory support).
+tests/test_sqlite_profile.py benchmarks mixed read/write load with and
+without the profile.
+"""
+
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from app import db
+
+
+logger = logging.getLogger(__name__)
+
+
+def profile_pragmas(config) -> list[tuple[str, object]]:
+    """Return the ``(pragma, value)`` pairs for *config*, in execution order.
+
+    Raises ``ValueError`` for negative sizes or timeouts.
+    """
+    busy_timeout = int(config.get("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    cache_size_kb = int(config.get("SQLITE_CACHE_SIZE_KB", 20000))
+    mmap_size_mb = int(config.get("SQLITE_MMAP_SIZE_MB", 256))
+    for name, value in (
+        ("SQLITE_BUSY_TIMEOUT_MS", busy_timeout),
+        ("SQLITE_CACHE_SIZE_KB", cache_size_kb),
+        ("SQLITE_MMAP_SIZE_MB", mmap_size_mb),
+    ):
+        if value < 0:
+            raise ValueError(f"{name} must be >= 0")
+    return [
+        # First, so switching the journal mode waits out a competing writer.
+        ("busy_timeout", busy_timeout),
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        # A negative cache_size is in KiB rather than pages.
+        ("cache_size", -cache_size_kb),
+        ("mmap_size", mmap_size_mb * 1024 * 1024),
+        ("temp_store", "MEMORY"),
+    ]
+
+
+def install_sqlite_profile(engine, pragmas) -> None:
+    """Run *pragmas* on every new DBAPI connection of *engine*."""
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def _is_memory_database(url) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def init_sqlite_profile(app) -> None:
+    """Apply the profile to *app*'s engine when ``SQLITE_PERFORMANCE_PROFILE``."""
+    if not app.config.get("SQLITE_PERFORMANCE_PROFILE"):
+        return
+    pragmas = profile_pragmas(app.config)
+
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != "sqlite":
+        logger.warning(
+            "SQLITE_PERFORMANCE_PROFILE is enabled but DATABASE_URL uses %s; ignoring",
+            engine.dialect.name,
+        )
+        return
+    if _is_memory_database(engine.url):
+        pragmas = [(name, value) for name, value in pragmas if name != "journal_mode"]
+    install_sqlite_profile(engine, pragmas)
+
+    # Startup validation: the pragmas are silently ignored in some setups.
+    try:
+        with engine.connect() as conn:
+            journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+            busy_timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+    except OperationalError as exc:
+        logger.warning("Could not validate the SQLite performance profile: %s", exc)
+        return
+    if busy_timeout != dict(pragmas)["busy_timeout"]:
+        logger.warning("SQLite busy_timeout is %s, not the configured value", busy_timeout)
+    if not _is_memory_database(engine.url) and str(journal_mode).lower() != "wal":
+        logger.warning(
+            "SQLite journal_mode is %r, not WAL; the database file system may not "
+            "support it. Readers will block writers.",
+            journal_mode,
+        )
@@ -2,14 +2,25 @@
 
 This module centralises payment gating so both web sessions and API requests
 apply the same account-owner and guest-user rules.
+
+Request identity
+----------------
+``load_request_identity`` fetches the authenticated user, their account owner
+and the owner's effective subscription in one joined query and stashes the
+result on ``flask.g``.  ``owner_for_user`` and ``get_effective_subscription``
+answer from it when asked about the same user, so authentication, access
+enforcement and the routes share a single query instead of three to five.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
 
-from flask import current_app
+from flask import current_app, g, has_app_context
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import aliased
 
 from app import db
 from app.models import Subscription, User
@@ -37,6 +48,70 @@ VALID_SUBSCRIPTION_STATUSES = {
 ACTIVE_SUBSCRIPTION_STATUSES = {SUB_ACTIVE, SUB_TRIAL, SUB_GRACE_PERIOD}
 
 
+@dataclass(frozen=True)
+class RequestIdentity:
+    user: User
+    owner: User | None
+    subscription: Subscription | None
+
+
+def _owner_id_of(user: User) -> int:
+    return user.owner_user_id or user.account_owner_id or user.id
+
+
+def _effective_subscription_id(owner_id):
+    """Scalar subquery with ``get_effective_subscription``'s ordering: the
+    latest active subscription first, else the latest-updated one."""
+    candidate = aliased(Subscription)
+    is_active = candidate.status.in_(tuple(ACTIVE_SUBSCRIPTION_STATUSES))
+    return (
+        select(candidate.id)
+        .where(candidate.user_id == owner_id)
+        .order_by(
+            case((is_active, 0), else_=1),
+            case((is_active, candidate.expires_at)).desc(),
+            candidate.updated_at.desc(),
+            candidate.id.desc(),
+        )
+        .limit(1)
+        .correlate_except(candidate)
+        .scalar_subquery()
+    )
+
+
+def load_request_identity(user_id: int) -> RequestIdentity | None:
+    """Load *user_id*'s ``RequestIdentity`` in one query and stash it on ``g``."""
+    owner = aliased(User)
+    owner_id = func.coalesce(User.owner_user_id, User.account_owner_id, User.id)
+    row = db.session.execute(
+        select(User, owner, Subscription)
+        .outerjoin(owner, owner.id == owner_id)
+        .outerjoin(Subscription, Subscription.id == _effective_subscription_id(owner_id))
+        .where(User.id == user_id)
+    ).first()
+    if row is None:
+        return None
+    identity = RequestIdentity(*row)
+    if has_app_context():
+        g.request_identity = identity
+    return identity
+
+
+def _identity_for(user: User) -> RequestIdentity | None:
+    """Return the stashed identity if it still describes *user*."""
+    identity = g.get("request_identity") if has_app_context() else None
+    if identity is None or identity.user.id != user.id or identity.owner is None:
+        return None
+    if identity.owner.id != _owner_id_of(user):
+        return None
+    return identity
+
+
+def _forget_request_identity() -> None:
+    if has_app_context():
+        g.pop("request_identity", None)
+
+
 def payments_enabled() -> bool:
     """Return whether payment enforcement is enabled."""
     return bool(current_app.config.get("PAYMENTS_ENABLED", False))
@@ -47,6 +122,10 @@ def owner_for_user(user: User | None) -> User | None:
     if user is None:
         return None
 
+    identity = _identity_for(user)
+    if identity is not None:
+        return identity.owner
+
     owner_id = user.owner_user_id or user.account_owner_id
     if owner_id:
         return db.session.get(User, owner_id)
@@ -76,6 +155,10 @@ def get_effective_subscription(user: User | None) -> Subscription | None:
     if user is None:
         return None
 
+    identity = g.get("request_identity") if has_app_context() else None
+    if identity is not None and identity.owner is not None and identity.owner.id == user.id:
+        return identity.subscription
+
     latest_active = (
         Subscription.query.filter_by(user_id=user.id)
         .filter(Subscription.status.in_(tuple(ACTIVE_SUBSCRIPTION_STATUSES)))
@@ -116,6 +199,7 @@ def upsert_subscription(
     """Create or update a provider subscription for a user."""
     canonical_source = _canonical_source(source)
     now = datetime.now(timezone.utc).replace(tzinfo=None)
+    _forget_request_identity()
     raw_last_verified_at = raw_last_verified_at or now
     if status not in VALID_SUBSCRIPTION_STATUSES:
         raise ValueError(f"Invalid subscription status: {status}")
@@ -184,6 +268,7 @@ def apply_subscription_status(
     if status not in VALID_SUBSCRIPTION_STATUSES:
         raise ValueError(f"Invalid subscription status: {status}")
 
+    _forget_request_identity()
     user.is_account_owner = True
     user.owner_user_id = None
     user.account_owner_id = None
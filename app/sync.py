@@ -0,0 +1,236 @@
+"""Delta sync for mobile clients: change cursors and deletion tombstones.
+
+Schedules, scenarios, holds, skips and balances carry a ``sync_revision``,
+and every deletion leaves a ``Tombstone`` row carrying one too.
+``changes_since`` returns only the rows and deletions stamped after a
+client's cursor, so a client that keeps a local store syncs in O(changes)
+instead of re-downloading every collection.
+
+Every write resets a row's ``sync_revision`` to NULL, and a ``before_commit``
+hook stamps the NULL rows of each user the transaction touched with that
+user's ``data_revision``, bumping it first unless the transaction already
+did.  The bump locks the owner's row until commit, so the stamped rows and
+the new revision become visible together, and no other transaction can
+commit rows with that revision or a lower one afterwards.  A cursor is the
+revision a sync read, which means a write is never skipped however long its
+transaction ran before committing.  Timestamps cannot give that guarantee:
+``updated_at`` is set when a row is written, not when it commits.
+
+ORM writes and deletes are tracked by flush hooks (deletes are tombstoned
+in ``before_flush``); bulk deletes must go through ``delete_with_tombstones``
+and other bulk writes must ``bump_data_revision`` for every user they touch.
+A row a write path failed to register stays NULL and is returned by every
+sync until that user's next commit stamps it, so a missed path repeats rows
+rather than losing them.
+
+Cursors are opaque to clients.  A cursor older than
+``TOMBSTONE_RETENTION_DAYS`` (tombstones that old are pruned by
+housekeeping), and a timestamp cursor from before revision cursors existed,
+gets a full snapshot back instead.
+"""
+
+import base64
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+from sqlalchemy import delete, event, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app import db
+from app.data_revision import BUMPED_USERS_KEY, bump_data_revision, get_data_revision
+from app.models import Balance, Hold, Scenario, Schedule, Skip, Tombstone
+
+
+TOMBSTONE_RETENTION_DAYS = 90
+_CURSOR_VERSION = "v2"
+_LEGACY_CURSOR_VERSION = "v1"
+_EPOCH = datetime(1970, 1, 1)
+# Session.info key holding the user ids whose synced rows the current
+# transaction wrote.
+_TOUCHED_USERS_KEY = "sync_touched_users"
+
+SYNC_MODELS = {
+    "schedules": Schedule,
+    "scenarios": Scenario,
+    "holds": Hold,
+    "skips": Skip,
+    "balances": Balance,
+}
+_KIND_BY_MODEL = {model: kind for kind, model in SYNC_MODELS.items()}
+_STAMPED_MODELS = (*SYNC_MODELS.values(), Tombstone)
+
+
+class SyncCursor(NamedTuple):
+    """A decoded cursor: the data revision a sync read and when it ran.
+
+    ``revision`` is ``None`` for a legacy timestamp cursor.
+    """
+    revision: Optional[int]
+    issued_at: datetime
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _micros(moment: datetime) -> int:
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+def encode_cursor(revision: int, issued_at: datetime) -> str:
+    """Encode *revision* and its naive-UTC *issued_at* as an opaque, URL-safe cursor."""
+    raw = f"{_CURSOR_VERSION}:{int(revision)}:{_micros(issued_at)}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SyncCursor:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` for a malformed cursor.
+
+    Legacy ``v1`` timestamp cursors decode with ``revision=None``.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+        version, _, rest = raw.partition(":")
+        if version == _LEGACY_CURSOR_VERSION:
+            revision, micros = None, int(rest)
+        elif version == _CURSOR_VERSION:
+            revision, micros = (int(part) for part in rest.split(":"))
+            if revision < 0:
+                raise ValueError("negative cursor revision")
+        else:
+            raise ValueError(f"unsupported cursor version {version!r}")
+        return SyncCursor(revision, _EPOCH + timedelta(microseconds=micros))
+    except (ValueError, OverflowError) as exc:
+        raise ValueError("invalid sync cursor") from exc
+
+
+@event.listens_for(Session, "before_flush")
+def _tombstone_deleted_rows(session, _flush_context, _instances):
+    for obj in session.deleted:
+        kind = _KIND_BY_MODEL.get(type(obj))
+        if kind is not None:
+            session.add(Tombstone(user_id=obj.user_id, kind=kind, object_id=obj.id))
+
+
+def _touch(session, user_ids) -> None:
+    session.info.setdefault(_TOUCHED_USERS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_written_rows(session, _flush_context):
+    # ``new`` and ``dirty`` still hold the pre-flush state here.
+    _touch(session, {
+        obj.user_id
+        for obj in (*session.new, *session.dirty)
+        if type(obj) in _STAMPED_MODELS and session.is_modified(obj)
+    })
+
+
+@event.listens_for(Session, "before_commit")
+def _stamp_sync_revisions(session):
+    session.flush()
+    touched = session.info.get(_TOUCHED_USERS_KEY, set()) | session.info.get(BUMPED_USERS_KEY, set())
+    # Lock owners' rows in id order so concurrent multi-user commits
+    # (housekeeping) cannot deadlock each other.
+    for user_id in sorted(touched):
+        if user_id not in session.info.get(BUMPED_USERS_KEY, set()):
+            bump_data_revision(user_id, session)
+        revision = get_data_revision(user_id, session)
+        for model in _STAMPED_MODELS:
+            session.execute(
+                update(model)
+                .where(model.user_id == user_id, model.sync_revision.is_(None))
+                .values(sync_revision=revision)
+                .execution_options(synchronize_session=False)
+            )
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_touched_users(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_TOUCHED_USERS_KEY, None)
+        session.info.pop(BUMPED_USERS_KEY, None)
+
+
+def delete_with_tombstones(model, *criteria) -> int:
+    """Bulk-delete the *model* rows matching *criteria*, tombstoning each one.
+
+    Use instead of ``Query.delete()`` for synced models; the caller commits.
+    Returns the number of rows deleted.
+    """
+    kind = _KIND_BY_MODEL[model]
+    rows = db.session.execute(select(model.id, model.user_id).where(*criteria)).all()
+    if not rows:
+        return 0
+    now = _utcnow()
+    db.session.execute(
+        insert(Tombstone),
+        [{"user_id": row.user_id, "kind": kind, "object_id": row.id, "deleted_at": now} for row in rows],
+    )
+    _touch(db.session, {row.user_id for row in rows})
+    result = db.session.execute(delete(model).where(model.id.in_([row.id for row in rows])))
+    return result.rowcount
+
+
+def prune_tombstones(now=None) -> int:
+    """Delete tombstones older than the retention window; the caller commits."""
+    cutoff = (now or _utcnow()) - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+    return db.session.execute(delete(Tombstone).where(Tombstone.deleted_at < cutoff)).rowcount
+
+
+def changes_since(user_id: int, since: Optional[SyncCursor] = None) -> dict:
+    """Collect *user_id*'s changes after the *since* cursor (or ``None``).
+
+    Returns ``{"cursor", "full", "changes", "deleted"}`` where ``changes``
+    maps each kind in ``SYNC_MODELS`` to its changed ORM rows (id order) and
+    ``deleted`` to the ids deleted since the cursor.  ``full`` is true when
+    *since* is missing, a legacy timestamp cursor, or predates the tombstone
+    retention window; the rows are then the complete collections and the
+    client should replace its local store.
+    """
+    now = _utcnow()
+    # Read before the rows: anything committed in between comes back again
+    # next time rather than being skipped.
+    revision = get_data_revision(user_id)
+    full = (
+        since is None
+        or since.revision is None
+        or since.issued_at < now - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+    )
+
+    def changed(model):
+        return or_(model.sync_revision > since.revision, model.sync_revision.is_(None))
+
+    changes = {}
+    deleted = {kind: [] for kind in SYNC_MODELS}
+    for kind, model in SYNC_MODELS.items():
+        query = model.query.filter_by(user_id=user_id)
+        if not full:
+            query = query.filter(changed(model))
+        changes[kind] = query.order_by(model.id.asc()).all()
+
+    if not full:
+        tombstones = db.session.execute(
+            select(Tombstone.kind, Tombstone.object_id)
+            .where(Tombstone.user_id == user_id, changed(Tombstone))
+        ).all()
+        for kind, object_id in tombstones:
+            if kind in deleted:
+                deleted[kind].append(object_id)
+        for kind, ids in deleted.items():
+            if not ids:
+                continue
+            # SQLite may hand a deleted row's id to a new row; a live row wins.
+            model = SYNC_MODELS[kind]
+            live = set(db.session.scalars(
+                select(model.id).where(model.user_id == user_id, model.id.in_(ids))
+            ))
+            deleted[kind] = sorted(set(ids) - live)
+
+    return {
+        "cursor": encode_cursor(revision, now),
+        "full": full,
+        "changes": changes,
+        "deleted": deleted,
+    }
@@ -63,7 +63,7 @@ export TZ="${TZ_VALUE}"
 # appuser can read/write them, regardless of host directory ownership.
 chown -R appuser:appgroup /app/app/data
 chown -R appuser:appgroup /app/migrations
-chown appuser:appgroup /app/getemail.log
+chown appuser:appgroup /app/getemail.log /app/housekeeping.log
 # crond.log is written by root crond — leave as root:root
 
 ENABLE_CRON_RESOLVED="$(get_env_or_dotenv "ENABLE_CRON" "true")"
@@ -83,11 +83,18 @@ if [ "${START_CRON}" = "true" ]; then
     # unreachable daemon; & sends it to the background so this script continues.
     # Daemon log goes to /app/crond.log (separate from job output in getemail.log).
     /usr/sbin/crond -f -l 8 -L /app/crond.log -c /app/crontabs/ &
+else
+    echo "WARNING: cron is disabled; schedule 'flask --app app housekeeping' hourly (and app/getemail.py if used) externally, or recurring start dates will fall behind and projections will thin out."
 fi
 
 # Apply checked-in migrations as appuser (never generate migrations at startup)
 su-exec appuser /usr/local/bin/flask --app app db upgrade
 
+# Catch up on schedule housekeeping missed while the container was down
+# (cron repeats it hourly; projection reads never write).
+su-exec appuser /usr/local/bin/flask --app app housekeeping || \
+    echo "WARNING: schedule housekeeping failed at startup; cron will retry"
+
 # Derive safe Gunicorn defaults (override with env vars as needed).
 CPU_COUNT="$(getconf _NPROCESSORS_ONLN 2>/dev/null || nproc 2>/dev/null || echo 1)"
 case "${CPU_COUNT}" in
@@ -112,7 +119,8 @@ fi
 
 GUNICORN_WORKERS="${RESOLVED_GUNICORN_WORKERS}"
 GUNICORN_TIMEOUT="${GUNICORN_TIMEOUT:-240}"
-GUNICORN_THREADS="${GUNICORN_THREADS:-8}"
+# Exported so create_app sizes the database connection pool to match.
+export GUNICORN_THREADS="${GUNICORN_THREADS:-8}"
 
 echo "Starting Gunicorn: workers=${GUNICORN_WORKERS}, threads=${GUNICORN_THREADS}, timeout=${GUNICORN_TIMEOUT}, bind=0.0.0.0:5000"
 
@@ -0,0 +1,32 @@
+"""add data_revision to user
+
+Per-user counter bumped by every write to the user's schedules, scenarios,
+holds, skips or balance. Projection ETags and caches compare it with a
+single primary-key read instead of re-reading and hashing the rows.
+
+Revision ID: a1c3e5f7b9d2
+Revises: f8b1c2d3e4a5
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c3e5f7b9d2'
+down_revision = 'f8b1c2d3e4a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('data_revision', sa.Integer(), nullable=False, server_default='0')
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_column('data_revision')
@@ -0,0 +1,63 @@
+"""add updated_at and tombstones for delta sync
+
+Schedules, scenarios, balances, holds and skips gain an ``updated_at``
+timestamp (backfilled to the migration time), and a ``tombstone`` table
+records deletions so ``/api/v1/sync`` can return only what changed since a
+client's cursor.
+
+Revision ID: b2d4f6a8c0e1
+Revises: a1c3e5f7b9d2
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2d4f6a8c0e1'
+down_revision = 'a1c3e5f7b9d2'
+branch_labels = None
+depends_on = None
+
+
+_SYNCED_TABLES = ('schedule', 'scenario', 'balance', 'hold', 'skip')
+
+
+def upgrade():
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    for table in _SYNCED_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(
+            sa.table(table, sa.column('updated_at', sa.DateTime()))
+            .update()
+            .values(updated_at=now)
+        )
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+
+    op.create_table(
+        'tombstone',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('object_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    with op.batch_alter_table('tombstone', schema=None) as batch_op:
+        batch_op.create_index('ix_tombstone_user_id_deleted_at', ['user_id', 'deleted_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tombstone', schema=None) as batch_op:
+        batch_op.drop_index('ix_tombstone_user_id_deleted_at')
+    op.drop_table('tombstone')
+
+    for table in reversed(_SYNCED_TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column('updated_at')
@@ -0,0 +1,41 @@
+"""add composite per-user indexes for schedule, scenario and skip lookups
+
+Schedules and scenarios get a ``(user_id, day-of-month(startdate))``
+expression index so the schedule pages read rows already in display order
+instead of sorting them, and skips get ``(user_id, date)`` in place of the
+single-column ``user_id`` index it supersedes.  ``(user_id, name)``
+duplicate checks are already served by the per-user unique constraints.
+
+Revision ID: d4f6b8c0e2a4
+Revises: c3e5a7b9d1f2
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f6b8c0e2a4'
+down_revision = 'c3e5a7b9d1f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ('schedule', 'scenario'):
+        op.create_index(
+            f'ix_{table}_user_id_start_day',
+            table,
+            [sa.column('user_id'), sa.extract('day', sa.column('startdate'))],
+            unique=False,
+        )
+    op.create_index('ix_skip_user_id_date', 'skip', ['user_id', 'date'], unique=False)
+    op.drop_index(op.f('ix_skip_user_id'), table_name='skip')
+
+
+def downgrade():
+    op.create_index(op.f('ix_skip_user_id'), 'skip', ['user_id'], unique=False)
+    op.drop_index('ix_skip_user_id_date', table_name='skip')
+    for table in ('scenario', 'schedule'):
+        op.drop_index(f'ix_{table}_user_id_start_day', table_name=table)
@@ -0,0 +1,46 @@
+"""add sync_revision to synced tables and tombstones
+
+Delta sync cursors move from ``updated_at`` timestamps to the owner's
+``data_revision`` counter: every synced row and tombstone carries the
+revision of the transaction that last wrote it.  Existing rows are
+backfilled to 0; clients holding a timestamp cursor get one full snapshot
+and a revision cursor after it.
+
+Revision ID: e6a8c0d2f4b7
+Revises: d4f6b8c0e2a4
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a8c0d2f4b7'
+down_revision = 'd4f6b8c0e2a4'
+branch_labels = None
+depends_on = None
+
+
+_SYNCED_TABLES = ('schedule', 'scenario', 'balance', 'hold', 'skip', 'tombstone')
+
+
+def upgrade():
+    for table in _SYNCED_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('sync_revision', sa.Integer(), nullable=True))
+        op.execute(
+            sa.table(table, sa.column('sync_revision', sa.Integer()))
+            .update()
+            .values(sync_revision=0)
+        )
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(f'ix_{table}_user_id_sync_revision', ['user_id', 'sync_revision'], unique=False)
+
+
+def downgrade():
+    # Plain DROP COLUMN (SQLite 3.35+): a batch table rebuild would lose the
+    # expression indexes on schedule and scenario.
+    for table in reversed(_SYNCED_TABLES):
+        op.drop_index(f'ix_{table}_user_id_sync_revision', table_name=table)
+        op.drop_column(table, 'sync_revision')
@@ -11,7 +11,36 @@ work under all pytest --import-mode settings (prepend, append, importlib).
 """
 
 from app.cashflow import (
+    calc_scenario_overlay,
     calc_transactions,
     calc_schedule,
+    iter_balances,
     update_cash,
 )
+from app.projection_cache import (  # noqa: E402
+    ProjectionCache,
+    cached_update_cash,
+    projection_cache,
+    projection_key,
+)
+from app.incremental_projection import (  # noqa: E402
+    IncrementalProjection,
+    incremental_projections,
+)
+from app.housekeeping import run_housekeeping  # noqa: E402
+from app.models import Hold, Schedule, Scenario, Skip  # noqa: E402
+from app.data_revision import bump_data_revision, get_data_revision  # noqa: E402
+from app.models import Balance, Tombstone  # noqa: E402
+from app.sync import (  # noqa: E402
+    SyncCursor,
+    changes_since,
+    decode_cursor,
+    delete_with_tombstones,
+    encode_cursor,
+    prune_tombstones,
+)
+from app.compression import static_cache  # noqa: E402
+from app.sqlite_profile import init_sqlite_profile, install_sqlite_profile, profile_pragmas  # noqa: E402
+from app.db_pool import TimedQueuePool, engine_options, pool_metrics  # noqa: E402
+from app.money import cents_array, format_cents, frame_cents, to_cents  # noqa: E402
+from app.api.serializers import serialize_series, serialize_series_columnar  # noqa: E402
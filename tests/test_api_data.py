@@ -10,17 +10,28 @@ Covers:
   - Transactions list endpoint
   - Risk-score detailed assessment endpoint
   - Balance snapshot endpoint
+  - ETag / If-None-Match on projection-backed endpoints
   - Response shapes follow API conventions (data key, meta key for lists)
 """
 
+import csv
+import io
+import json
+import pandas as pd
 import pytest
 from datetime import date, timedelta, datetime, timezone
+from unittest import mock
 
+from sqlalchemy.exc import IntegrityError
 from werkzeug.security import generate_password_hash
 
 # Module-level imports: captured before test stubs can replace sys.modules.
 from app import db as _db
 from app.models import User, Schedule, Scenario, Balance, Hold, Skip
+from app.api.routes import data as _data_routes
+from app.api.pagination import encode_page_cursor
+from app.api.serializers import serialize_series_columnar
+from conftest import _ADMIN_USER_ID
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -62,6 +73,7 @@ class TestDataEndpointsRequireAuth:
         "/api/v1/transactions",
         "/api/v1/risk-score",
         "/api/v1/balance",
+        "/api/v1/bootstrap",
     ])
     def test_unauthenticated_returns_401(self, client, path):
         resp = client.get(path)
@@ -258,6 +270,33 @@ class TestProjections:
         assert "date" in point
         assert "amount" in point
 
+    def test_projections_horizon_days(self, flask_app, client):
+        with flask_app.app_context():
+            user = User.query.filter_by(email="admin@test.local").first()
+            start = date.today() + timedelta(days=3)
+            _db.session.add(Schedule(
+                user_id=user.id, name="_test_api_horizon", amount="10.00",
+                frequency="Weekly", startdate=start, firstdate=start, type="Expense",
+            ))
+            _db.session.commit()
+
+        token = _login(client)
+        try:
+            short = _json(client.get("/api/v1/projections?horizon_days=30", headers=_bearer(token)))
+            long = _json(client.get("/api/v1/projections?horizon_days=1825", headers=_bearer(token)))
+            assert len(short["data"]["schedule"]) < 10
+            assert len(long["data"]["schedule"]) > 250
+        finally:
+            with flask_app.app_context():
+                Schedule.query.filter_by(name="_test_api_horizon").delete()
+                _db.session.commit()
+
+    def test_projections_horizon_days_validated(self, client):
+        token = _login(client)
+        resp = client.get("/api/v1/projections?horizon_days=5000", headers=_bearer(token))
+        assert resp.status_code == 422
+        assert "horizon_days" in _json(resp)["fields"]
+
     def test_projections_with_scenario(self, flask_app, client):
         """When scenarios exist, the scenario series should be returned."""
         with flask_app.app_context():
@@ -286,6 +325,137 @@ class TestProjections:
             _db.session.commit()
 
 
+class TestColumnarProjections:
+    """?encoding=columnar returns the same points as parallel arrays."""
+
+    @staticmethod
+    def _decode(columns):
+        if columns is None:
+            return None
+        start = date.fromisoformat(columns["start_date"]) if columns["start_date"] else None
+        return [
+            {"date": (start + timedelta(days=offset)).isoformat(), "amount": f"{cents / 100:.2f}"}
+            for offset, cents in zip(columns["day_offsets"], columns["amounts_cents"])
+        ]
+
+    @pytest.fixture()
+    def weekly_bills(self, flask_app):
+        with flask_app.app_context():
+            for name, amount, kind in (("_columnar_pay", "812.40", "Income"), ("_columnar_bill", "97.13", "Expense")):
+                _db.session.add(Schedule(user_id=_ADMIN_USER_ID, name=name, amount=amount, type=kind,
+                                         frequency="Weekly", startdate=date.today() + timedelta(days=1)))
+            _db.session.commit()
+        yield
+        with flask_app.app_context():
+            Schedule.query.filter(Schedule.name.like("_columnar_%")).delete(synchronize_session=False)
+            _db.session.commit()
+
+    def test_decodes_to_object_payload(self, client, weekly_bills):
+        token = _login(client)
+        objects = client.get("/api/v1/projections?horizon_days=730", headers=_bearer(token))
+        resp = client.get("/api/v1/projections?horizon_days=730&encoding=columnar", headers=_bearer(token))
+        columnar = _json(resp)["data"]
+        assert columnar["encoding"] == "columnar"
+        assert len(columnar["schedule"]["amounts_cents"]) > 100
+        assert all(isinstance(c, int) for c in columnar["schedule"]["amounts_cents"])
+        assert self._decode(columnar["schedule"]) == _json(objects)["data"]["schedule"]
+        assert self._decode(columnar["scenario"]) == _json(objects)["data"]["scenario"]
+        assert len(resp.data) * 2 < len(objects.data)
+
+    def test_serializer_vectorizes_frame(self):
+        frame = pd.DataFrame({
+            "date": [date(2026, 1, 1), date(2026, 1, 3), date(2026, 2, 1)],
+            "amount": [1200.1, -35.07, 0.3 - 0.1],
+        })
+        assert serialize_series_columnar(frame) == {
+            "start_date": "2026-01-01",
+            "day_offsets": [0, 2, 31],
+            "amounts_cents": [120010, -3507, 20],
+        }
+        assert serialize_series_columnar(frame.iloc[:0]) is None
+        assert serialize_series_columnar(None) is None
+
+    def test_encoding_is_validated_and_part_of_etag(self, client):
+        token = _login(client)
+        assert client.get("/api/v1/projections?encoding=xml", headers=_bearer(token)).status_code == 422
+        objects = client.get("/api/v1/projections", headers=_bearer(token)).headers["ETag"]
+        columnar = client.get("/api/v1/projections?encoding=columnar", headers=_bearer(token)).headers["ETag"]
+        assert objects != columnar
+
+
+class TestProjectionExport:
+    """GET /api/v1/projections/export streams the projection series."""
+
+    def _expected(self, client, token, query=""):
+        data = _json(client.get(f"/api/v1/projections{query}", headers=_bearer(token)))["data"]
+        rows = [("schedule", p["date"], p["amount"]) for p in data["schedule"]]
+        rows += [("scenario", p["date"], p["amount"]) for p in data["scenario"] or []]
+        return rows
+
+    def test_ndjson_matches_projections(self, client):
+        token = _login(client)
+        resp = client.get("/api/v1/projections/export?horizon_days=730", headers=_bearer(token))
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/x-ndjson"
+        lines = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+        assert lines[0]["meta"]["horizon_days"] == 730
+        rows = [(r["series"], r["date"], r["amount"]) for r in lines[1:]]
+        assert rows == self._expected(client, token, "?horizon_days=730")
+
+    def test_csv_matches_projections(self, client):
+        token = _login(client)
+        resp = client.get("/api/v1/projections/export?format=csv", headers=_bearer(token))
+        assert resp.status_code == 200
+        assert resp.mimetype == "text/csv"
+        assert "attachment" in resp.headers["Content-Disposition"]
+        reader = csv.reader(io.StringIO(resp.get_data(as_text=True)))
+        assert next(reader) == ["series", "date", "amount"]
+        assert [tuple(row) for row in reader] == self._expected(client, token)
+
+    def test_rows_stream_as_they_are_projected(self, flask_app, client):
+        token = _login(client)
+        start = (date.today() + timedelta(days=1)).isoformat()
+        created = client.post("/api/v1/schedules", headers=_bearer(token), json={
+            "name": "_test_export_daily", "amount": "1.00", "type": "Expense",
+            "frequency": "Weekly", "start_date": start,
+        })
+        assert created.status_code == 201
+        produced = []
+        iter_balances = _data_routes.iter_balances
+
+        def counting(*args, **kwargs):
+            for point in iter_balances(*args, **kwargs):
+                produced.append(point)
+                yield point
+
+        try:
+            with mock.patch.object(_data_routes, "iter_balances", counting), \
+                    mock.patch.object(_data_routes, "_EXPORT_CHUNK_ROWS", 2):
+                resp = client.get("/api/v1/projections/export?format=csv&horizon_days=3650",
+                                  headers=_bearer(token), buffered=False)
+                assert resp.is_streamed
+                chunks = iter(resp.response)
+                assert next(chunks) == b"series,date,amount\n"
+                assert produced == []
+                assert next(chunks).count(b"\n") == 2
+                # Only the first chunk's points have been computed so far.
+                assert len(produced) <= 3
+                rest = list(chunks)
+                resp.close()
+            assert len(produced) > 500
+            assert all(chunk.count(b"\n") <= 2 for chunk in rest)
+        finally:
+            with flask_app.app_context():
+                Schedule.query.filter_by(name="_test_export_daily").delete()
+                _db.session.commit()
+
+    def test_rejects_unknown_format(self, client):
+        token = _login(client)
+        resp = client.get("/api/v1/projections/export?format=xml", headers=_bearer(token))
+        assert resp.status_code == 422
+        assert "format" in _json(resp)["fields"]
+
+
 # ── Scenarios endpoint ───────────────────────────────────────────────────────
 
 
@@ -912,3 +1082,382 @@ class TestWriteEndpoints:
         insights = client.get("/api/v1/insights", headers=_bearer(token))
         assert insights.status_code == 200
         assert "configured" in _json(insights)["data"]
+
+
+# ── Conditional GET (ETag / If-None-Match) ───────────────────────────────────
+
+
+class TestScheduleBatch:
+    """POST /schedules/batch validates everything, then commits once."""
+
+    @pytest.fixture(autouse=True)
+    def _cleanup(self, flask_app):
+        yield
+        with flask_app.app_context():
+            Schedule.query.filter(Schedule.name.like("_batch_%")).delete(synchronize_session=False)
+            _db.session.commit()
+
+    def _item(self, name, amount="10.00"):
+        return {"name": name, "amount": amount, "type": "Expense", "frequency": "Monthly",
+                "start_date": (date.today() + timedelta(days=3)).isoformat()}
+
+    def _post(self, client, token, operations):
+        return client.post("/api/v1/schedules/batch", headers=_bearer(token),
+                           json={"operations": operations})
+
+    def _names(self, flask_app):
+        with flask_app.app_context():
+            return {s.name: s for s in Schedule.query.filter(Schedule.name.like("_batch_%"))}
+
+    def test_mixed_operations_apply_in_one_commit(self, flask_app, client):
+        token = _login(client)
+        seeded = _json(self._post(client, token, [
+            {"op": "create", "data": self._item("_batch_a")},
+            {"op": "create", "data": self._item("_batch_b")},
+        ]))["data"]["results"]
+        a_id, b_id = (r["id"] for r in seeded)
+
+        with mock.patch.object(_db.session, "commit", wraps=_db.session.commit) as commit:
+            resp = self._post(client, token, [
+                {"op": "create", "data": self._item("_batch_c")},
+                {"op": "update", "id": a_id, "data": self._item("_batch_a2", amount="99.00")},
+                {"op": "delete", "id": b_id},
+            ])
+        assert resp.status_code == 200
+        assert commit.call_count == 1
+        results = _json(resp)["data"]["results"]
+        assert [r["op"] for r in results] == ["create", "update", "delete"]
+        assert results[0]["data"]["name"] == "_batch_c"
+        assert results[1] == {"op": "update", "id": a_id, "data": {**results[1]["data"], "amount": "99.00"}}
+        assert results[2] == {"op": "delete", "id": b_id}
+        assert set(self._names(flask_app)) == {"_batch_a2", "_batch_c"}
+
+    def test_any_invalid_operation_rejects_the_batch(self, flask_app, client):
+        token = _login(client)
+        resp = self._post(client, token, [
+            {"op": "create", "data": self._item("_batch_ok")},
+            {"op": "create", "data": {**self._item("_batch_bad"), "amount": "abc"}},
+            {"op": "update", "id": 987654, "data": self._item("_batch_missing")},
+            {"op": "explode"},
+        ])
+        assert resp.status_code == 422
+        fields = _json(resp)["fields"]
+        assert set(fields) == {"operations[1].amount", "operations[3].op"}
+        assert self._names(flask_app) == {}
+
+    def test_unknown_id_and_duplicate_names_rejected(self, flask_app, client):
+        token = _login(client)
+        resp = self._post(client, token, [
+            {"op": "create", "data": self._item("_batch_dup")},
+            {"op": "create", "data": self._item("_batch_dup")},
+            {"op": "delete", "id": 987654},
+        ])
+        assert resp.status_code == 422
+        assert set(_json(resp)["fields"]) == {"operations[1].name", "operations[2].id"}
+        assert self._names(flask_app) == {}
+
+    def test_names_freed_earlier_in_the_batch_can_be_reused(self, flask_app, client):
+        token = _login(client)
+        seeded = _json(self._post(client, token, [
+            {"op": "create", "data": self._item("_batch_x")},
+            {"op": "create", "data": self._item("_batch_y")},
+        ]))["data"]["results"]
+        x_id, y_id = (r["id"] for r in seeded)
+
+        resp = self._post(client, token, [
+            {"op": "update", "id": x_id, "data": self._item("_batch_z")},
+            {"op": "update", "id": y_id, "data": self._item("_batch_x")},
+            {"op": "delete", "id": x_id},
+            {"op": "create", "data": self._item("_batch_z", amount="5.00")},
+        ])
+        assert resp.status_code == 200, _json(resp)
+        rows = self._names(flask_app)
+        assert set(rows) == {"_batch_x", "_batch_z"}
+        assert rows["_batch_x"].id == y_id
+        assert str(rows["_batch_z"].amount) == "5.00"
+
+    def test_concurrent_take_of_a_freed_name_returns_422(self, flask_app, client):
+        token = _login(client)
+        seeded = _json(self._post(client, token, [
+            {"op": "create", "data": self._item("_batch_p")},
+        ]))["data"]["results"]
+        p_id = seeded[0]["id"]
+
+        # Another request grabs "_batch_p" between our rename and the reuse.
+        clash = IntegrityError("INSERT INTO schedule", {}, Exception("UNIQUE constraint failed"))
+        with mock.patch.object(_db.session, "flush", side_effect=clash) as flush:
+            resp = self._post(client, token, [
+                {"op": "update", "id": p_id, "data": self._item("_batch_q")},
+                {"op": "create", "data": self._item("_batch_p")},
+            ])
+        assert flush.call_count == 1
+        assert resp.status_code == 422
+        assert "retry the batch" in _json(resp)["fields"]["operations"]
+        assert set(self._names(flask_app)) == {"_batch_p"}
+
+    def test_request_shape_errors(self, client):
+        token = _login(client)
+        assert client.post("/api/v1/schedules/batch", headers=_bearer(token), json={}).status_code == 422
+        too_many = [{"op": "delete", "id": 1}] * 501
+        assert self._post(client, token, too_many).status_code == 422
+
+
+class TestKeysetPagination:
+    """List endpoints page by opaque cursor without counting or offsetting."""
+
+    @pytest.fixture()
+    def balances(self, flask_app):
+        start = date(2001, 1, 1)
+        with flask_app.app_context():
+            for i in range(5):
+                _db.session.add(Balance(user_id=_ADMIN_USER_ID, amount=f"{100 + i}.00",
+                                        date=start + timedelta(days=i)))
+            _db.session.commit()
+        yield
+        with flask_app.app_context():
+            Balance.query.filter(Balance.user_id == _ADMIN_USER_ID,
+                                 Balance.date < date(2002, 1, 1)).delete()
+            _db.session.commit()
+
+    def _walk(self, client, token, path, limit):
+        items, url = [], f"{path}?limit={limit}"
+        while True:
+            body = _json(client.get(url, headers=_bearer(token)))
+            assert len(body["data"]) <= limit
+            items.extend(body["data"])
+            cursor = body["meta"].get("next_cursor")
+            if cursor is None:
+                return items
+            url = f"{path}?limit={limit}&cursor={cursor}"
+
+    def test_balance_history_walk_matches_full_list(self, client, balances):
+        token = _login(client)
+        full = _json(client.get("/api/v1/balance/history", headers=_bearer(token)))["data"]
+        assert self._walk(client, token, "/api/v1/balance/history", 2) == full
+        dates = [b["date"] for b in full]
+        assert dates == sorted(dates, reverse=True)
+
+    def test_cursor_pages_skip_count_unless_asked(self, client, balances):
+        token = _login(client)
+        first = _json(client.get("/api/v1/balance/history?limit=2", headers=_bearer(token)))
+        assert first["meta"]["total"] >= 5
+        cursor = first["meta"]["next_cursor"]
+
+        second = _json(client.get(f"/api/v1/balance/history?limit=2&cursor={cursor}",
+                                  headers=_bearer(token)))
+        assert set(second["meta"]) == {"limit", "next_cursor"}
+        assert second["data"][0]["date"] < first["data"][-1]["date"]
+
+        counted = _json(client.get(f"/api/v1/balance/history?limit=2&cursor={cursor}&include_total=true",
+                                   headers=_bearer(token)))
+        assert counted["meta"]["total"] == first["meta"]["total"]
+        assert counted["data"] == second["data"]
+
+    def test_offset_pages_can_skip_count(self, client, balances):
+        token = _login(client)
+        body = _json(client.get("/api/v1/balance/history?limit=2&offset=1&include_total=false",
+                                headers=_bearer(token)))
+        assert "total" not in body["meta"]
+        assert body["meta"]["offset"] == 1
+
+    def test_schedule_cursor_walk(self, flask_app, client):
+        with flask_app.app_context():
+            for i in range(3):
+                _db.session.add(Schedule(user_id=_ADMIN_USER_ID, name=f"_keyset_{i}", amount="1.00",
+                                         type="Expense", frequency="Monthly", startdate=date.today()))
+            _db.session.commit()
+        try:
+            token = _login(client)
+            full = _json(client.get("/api/v1/schedules", headers=_bearer(token)))["data"]
+            assert self._walk(client, token, "/api/v1/schedules", 1) == full
+        finally:
+            with flask_app.app_context():
+                Schedule.query.filter(Schedule.name.like("_keyset_%")).delete(synchronize_session=False)
+                _db.session.commit()
+
+    @pytest.mark.parametrize("query", [
+        "cursor=garbage",
+        "cursor={schedules_cursor}",
+        "cursor={balances_cursor}&offset=2",
+        "limit=2&include_total=maybe",
+    ])
+    def test_invalid_cursor_params_are_422(self, client, balances, query):
+        token = _login(client)
+        query = query.format(
+            schedules_cursor=encode_page_cursor("schedules", (1,)),
+            balances_cursor=encode_page_cursor("balances", (date(2001, 1, 3), 1)),
+        )
+        resp = client.get(f"/api/v1/balance/history?{query}", headers=_bearer(token))
+        assert resp.status_code == 422
+
+
+_PROJECTION_PATHS = [
+    "/api/v1/dashboard",
+    "/api/v1/projections",
+    "/api/v1/transactions",
+    "/api/v1/risk-score",
+    "/api/v1/bootstrap",
+]
+
+
+class TestConditionalGet:
+    """Projection-backed endpoints answer a matching If-None-Match with 304."""
+
+    @pytest.mark.parametrize("path", _PROJECTION_PATHS)
+    def test_matching_etag_returns_304(self, client, path):
+        token = _login(client)
+        first = client.get(path, headers=_bearer(token))
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert etag.startswith('"') and not etag.startswith('W/')
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        second = client.get(path, headers={**_bearer(token), "If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == etag
+
+    @pytest.mark.parametrize("path", _PROJECTION_PATHS)
+    def test_304_skips_projection(self, client, path):
+        token = _login(client)
+        etag = client.get(path, headers=_bearer(token)).headers["ETag"]
+        with mock.patch.object(_data_routes, "cached_update_cash") as projection, \
+                mock.patch.object(_data_routes, "calculate_cash_risk_score") as risk:
+            resp = client.get(path, headers={**_bearer(token), "If-None-Match": etag})
+        assert resp.status_code == 304
+        projection.assert_not_called()
+        risk.assert_not_called()
+
+    def test_stale_etag_returns_full_body(self, client):
+        token = _login(client)
+        resp = client.get("/api/v1/projections", headers={**_bearer(token), "If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert "schedule" in _json(resp)["data"]
+
+    def test_etag_differs_per_endpoint_and_query(self, client):
+        token = _login(client)
+        tags = {
+            client.get(path, headers=_bearer(token)).headers["ETag"]
+            for path in (
+                *_PROJECTION_PATHS,
+                "/api/v1/projections?horizon_days=365",
+                "/api/v1/transactions?limit=5",
+            )
+        }
+        assert len(tags) == len(_PROJECTION_PATHS) + 2
+
+    @pytest.fixture()
+    def other_account(self, flask_app):
+        with flask_app.app_context():
+            other = User(
+                email="_etag_other@test.local",
+                password=generate_password_hash("otherpass", method="scrypt"),
+                name="Other Account", admin=True, is_active=True,
+            )
+            _db.session.add(other)
+            _db.session.commit()
+            _db.session.add(Balance(user_id=other.id, amount="12.34", date=date.today()))
+            _db.session.commit()
+            other_id = other.id
+        yield other_id
+        with flask_app.app_context():
+            Balance.query.filter_by(user_id=other_id).delete()
+            User.query.filter_by(id=other_id).delete()
+            _db.session.commit()
+
+    @pytest.mark.parametrize("path", ["/api/v1/dashboard", "/api/v1/projections", "/api/v1/bootstrap"])
+    def test_etag_is_not_shared_across_accounts(self, flask_app, client, other_account, path):
+        token_a = _login(client)
+        token_b = _login(client, email="_etag_other@test.local", password="otherpass")
+        with flask_app.app_context():
+            revision = _db.session.get(User, _ADMIN_USER_ID).data_revision
+            _db.session.get(User, other_account).data_revision = revision
+            _db.session.commit()
+
+        etag_a = client.get(path, headers=_bearer(token_a)).headers["ETag"]
+        expected_b = client.get(path, headers=_bearer(token_b))
+        resp = client.get(path, headers={**_bearer(token_b), "If-None-Match": etag_a})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag_a
+        assert _json(resp)["data"] == _json(expected_b)["data"]
+
+    def test_bootstrap_etag_is_not_shared_with_guests(self, flask_app, client):
+        with flask_app.app_context():
+            guest = User(
+                email="_etag_guest@test.local",
+                password=generate_password_hash("guestpass", method="scrypt"),
+                name="ETag Guest", admin=False, is_active=True, account_owner_id=_ADMIN_USER_ID,
+            )
+            _db.session.add(guest)
+            _db.session.commit()
+        try:
+            owner_etag = client.get("/api/v1/bootstrap", headers=_bearer(_login(client))).headers["ETag"]
+            token = _login(client, email="_etag_guest@test.local", password="guestpass")
+            resp = client.get("/api/v1/bootstrap", headers={**_bearer(token), "If-None-Match": owner_etag})
+            assert resp.status_code == 200
+            assert _json(resp)["data"]["settings"]["user"]["email"] == "_etag_guest@test.local"
+        finally:
+            with flask_app.app_context():
+                User.query.filter_by(email="_etag_guest@test.local").delete()
+                _db.session.commit()
+
+    def test_write_changes_etag(self, flask_app, client):
+        token = _login(client)
+        etag = client.get("/api/v1/projections", headers=_bearer(token)).headers["ETag"]
+        start = (date.today() + timedelta(days=4)).isoformat()
+        created = client.post(
+            "/api/v1/schedules",
+            headers=_bearer(token),
+            json={"name": "_test_api_etag", "amount": "25.00", "type": "Expense",
+                  "frequency": "Monthly", "start_date": start},
+        )
+        assert created.status_code == 201
+        try:
+            resp = client.get("/api/v1/projections", headers={**_bearer(token), "If-None-Match": etag})
+            assert resp.status_code == 200
+            assert resp.headers["ETag"] != etag
+        finally:
+            with flask_app.app_context():
+                Schedule.query.filter_by(name="_test_api_etag").delete()
+                _db.session.commit()
+
+
+# ── Bootstrap endpoint ───────────────────────────────────────────────────────
+
+
+class TestBootstrap:
+    """/bootstrap bundles the launch endpoints from one load and one projection."""
+
+    _SECTIONS = {
+        "dashboard": "/api/v1/dashboard",
+        "projections": "/api/v1/projections",
+        "balance": "/api/v1/balance",
+        "settings": "/api/v1/settings",
+    }
+    _LISTS = {
+        "schedules": "/api/v1/schedules",
+        "scenarios": "/api/v1/scenarios",
+        "holds": "/api/v1/holds",
+        "skips": "/api/v1/skips",
+    }
+
+    def test_sections_match_individual_endpoints(self, client):
+        token = _login(client)
+        data = _json(client.get("/api/v1/bootstrap", headers=_bearer(token)))["data"]
+        assert set(data) == set(self._SECTIONS) | set(self._LISTS)
+        for key, path in self._SECTIONS.items():
+            assert data[key] == _json(client.get(path, headers=_bearer(token)))["data"], key
+        for key, path in self._LISTS.items():
+            assert data[key] == _json(client.get(path, headers=_bearer(token)))["data"], key
+
+    def test_single_projection_run_and_row_load(self, client):
+        token = _login(client)
+        with mock.patch.object(
+            _data_routes, "cached_update_cash", wraps=_data_routes.cached_update_cash
+        ) as projection, mock.patch.object(
+            _data_routes, "_latest_balance", wraps=_data_routes._latest_balance
+        ) as latest_balance:
+            resp = client.get("/api/v1/bootstrap", headers=_bearer(token))
+        assert resp.status_code == 200
+        assert projection.call_count == 1
+        assert latest_balance.call_count == 1
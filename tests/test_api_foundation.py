@@ -29,6 +29,7 @@ from app import db as _db
 from app.models import UserToken, User
 from app.api.serializers import serialize_balance, serialize_user, _amount, _date, _datetime
 from app.api.auth_utils import hash_token
+from app.auth_revision import bump_auth_revision, token_cache
 import app.api.routes.auth as api_auth_routes
 
 
@@ -315,6 +316,49 @@ class TestAuthLifecycle:
         assert resp.status_code == 401
 
 
+class TestTokenCache:
+    """Verified bearer tokens are cached per process; revocation is honoured."""
+
+    def test_cached_token_skips_token_lookup(self, flask_app, client):
+        raw_token = _json(_login(client))["data"]["token"]
+        assert client.get("/api/v1/auth/me", headers=_bearer(raw_token)).status_code == 200
+        assert token_cache.get(hash_token(raw_token)) is not None
+
+        # Remove the row behind the cache's back: the cached entry still serves.
+        with flask_app.app_context():
+            UserToken.query.filter_by(token_hash=hash_token(raw_token)).delete()
+            _db.session.commit()
+        assert client.get("/api/v1/auth/me", headers=_bearer(raw_token)).status_code == 200
+
+        # A revision bump (as another worker's revocation does) invalidates it.
+        with flask_app.app_context():
+            bump_auth_revision(User.query.filter_by(email="admin@test.local").one().id)
+            _db.session.commit()
+        assert client.get("/api/v1/auth/me", headers=_bearer(raw_token)).status_code == 401
+        assert token_cache.get(hash_token(raw_token)) is None
+
+    def test_logout_evicts_cached_token(self, client):
+        raw_token = _json(_login(client))["data"]["token"]
+        client.get("/api/v1/auth/me", headers=_bearer(raw_token))
+        client.post("/api/v1/auth/logout", headers=_bearer(raw_token))
+        assert token_cache.get(hash_token(raw_token)) is None
+        assert client.get("/api/v1/auth/me", headers=_bearer(raw_token)).status_code == 401
+
+    def test_other_tokens_survive_logout(self, client):
+        token_a = _json(_login(client))["data"]["token"]
+        token_b = _json(_login(client))["data"]["token"]
+        client.get("/api/v1/auth/me", headers=_bearer(token_b))
+        client.post("/api/v1/auth/logout", headers=_bearer(token_a))
+        assert client.get("/api/v1/auth/me", headers=_bearer(token_b)).status_code == 200
+        client.post("/api/v1/auth/logout", headers=_bearer(token_b))
+
+    def test_ttl_expiry(self, client, monkeypatch):
+        raw_token = _json(_login(client))["data"]["token"]
+        client.get("/api/v1/auth/me", headers=_bearer(raw_token))
+        monkeypatch.setattr(token_cache, "ttl", -1)
+        assert token_cache.get(hash_token(raw_token)) is None
+
+
 # ── Serializer unit tests ─────────────────────────────────────────────────────
 
 
@@ -481,6 +525,7 @@ class TestAuthEnhancements:
     def test_change_password_revokes_all_existing_tokens(self, client):
         token_a = _json(_login(client))["data"]["token"]
         token_b = _json(_login(client))["data"]["token"]
+        assert client.get("/api/v1/auth/me", headers=_bearer(token_b)).status_code == 200
 
         change = client.put(
             "/api/v1/auth/password",
@@ -5,11 +5,19 @@ import hmac
 import json
 from datetime import datetime, timedelta, timezone
 
+from flask import g
+from sqlalchemy import event
 from werkzeug.security import generate_password_hash
 
 from app import db
 from app.models import PasswordSetupToken, Subscription, User
 from app.api.auth_utils import create_token_for_user
+from app.subscription import (
+    enforce_user_access,
+    get_effective_subscription,
+    load_request_identity,
+    owner_for_user,
+)
 
 
 def _sign(payload: str, secret: str, timestamp: int = 1712700000) -> str:
@@ -1230,3 +1238,93 @@ def test_appstore_same_original_transaction_id_different_environment_allowed(
             ).count()
             == 1
         )
+
+
+
+def _owner_with_guest(prefix):
+    owner = User(
+        email=f"{prefix}-owner@test.local",
+        password=generate_password_hash("pass12345", method="scrypt"),
+        name="Owner",
+        admin=True,
+        is_active=True,
+    )
+    db.session.add(owner)
+    db.session.commit()
+    guest = User(
+        email=f"{prefix}-guest@test.local",
+        password=generate_password_hash("pass12345", method="scrypt"),
+        name="Guest",
+        admin=False,
+        is_active=True,
+        account_owner_id=owner.id,
+        owner_user_id=owner.id,
+        is_account_owner=False,
+    )
+    db.session.add(guest)
+    db.session.commit()
+    return owner, guest
+
+
+def test_request_identity_matches_effective_subscription(flask_app):
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with flask_app.test_request_context():
+        owner, guest = _owner_with_guest("identity")
+        db.session.add_all([
+            Subscription(user_id=owner.id, source="stripe", status="active",
+                         external_subscription_id="sub_identity_1", expires_at=now + timedelta(days=5)),
+            Subscription(user_id=owner.id, source="stripe", status="trial",
+                         external_subscription_id="sub_identity_2", expires_at=now + timedelta(days=20)),
+            Subscription(user_id=owner.id, source="stripe", status="canceled",
+                         external_subscription_id="sub_identity_3", updated_at=now + timedelta(days=1)),
+        ])
+        db.session.commit()
+
+        identity = load_request_identity(guest.id)
+        assert identity.user is guest
+        assert identity.owner is owner
+        g.pop("request_identity")
+        assert identity.subscription is get_effective_subscription(owner)
+        assert identity.subscription.external_subscription_id == "sub_identity_2"
+
+        Subscription.query.filter_by(user_id=owner.id).filter(
+            Subscription.status != "canceled"
+        ).delete()
+        db.session.commit()
+        identity = load_request_identity(owner.id)
+        assert identity.owner is owner
+        assert identity.subscription.external_subscription_id == "sub_identity_3"
+
+        assert load_request_identity(10**9) is None
+
+
+def test_request_identity_serves_access_checks_in_one_query(flask_app):
+    original_toggle = flask_app.config["PAYMENTS_ENABLED"]
+    flask_app.config["PAYMENTS_ENABLED"] = True
+    statements = []
+
+    def _count(*_args):
+        statements.append(1)
+
+    try:
+        with flask_app.test_request_context():
+            owner, guest = _owner_with_guest("identity-queries")
+            db.session.add(Subscription(
+                user_id=owner.id, source="stripe", status="active",
+                external_subscription_id="sub_identity_queries_1",
+                expires_at=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=30),
+            ))
+            db.session.commit()
+            guest_id = guest.id
+            db.session.expunge_all()
+
+            event.listen(db.engine, "before_cursor_execute", _count)
+            try:
+                guest = load_request_identity(guest_id).user
+                assert enforce_user_access(guest) is True
+                assert owner_for_user(guest).email == "identity-queries-owner@test.local"
+            finally:
+                event.remove(db.engine, "before_cursor_execute", _count)
+            assert len(statements) == 1
+    finally:
+        flask_app.config["PAYMENTS_ENABLED"] = original_toggle
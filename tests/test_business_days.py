@@ -0,0 +1,121 @@
+"""
+Tests for the business-day calendar in app/business_days.py.
+
+The calendar's lookup tables must agree with numpy's own busday rolling, the
+US Federal Reserve rule set must produce the published holiday dates, and the
+projection engine must land paydays on the configured calendar.
+"""
+
+import os
+import types
+from contextlib import contextmanager
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.business_days import (
+    BusinessCalendar,
+    configure_business_calendar,
+    default_business_calendar,
+    get_business_calendar,
+    parse_holiday_dates,
+    us_federal_reserve_holidays,
+)
+from app.recurrence import expand_occurrences
+
+
+@contextmanager
+def _env(**overrides):
+    """Temporarily set environment variables, restoring prior values after."""
+    sentinel = object()
+    previous = {k: os.environ.get(k, sentinel) for k in overrides}
+    try:
+        os.environ.update(overrides)
+        yield
+    finally:
+        for k, prev in previous.items():
+            if prev is sentinel:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = prev
+
+
+class TestFederalReserveHolidays:
+    def test_2026_holidays(self):
+        assert sorted(str(d) for d in us_federal_reserve_holidays(2026)) == [
+            "2026-01-01", "2026-01-19", "2026-02-16", "2026-05-25", "2026-06-19",
+            "2026-07-04", "2026-09-07", "2026-10-12", "2026-11-11", "2026-11-26",
+            "2026-12-25",
+        ]
+
+    def test_sunday_holiday_observed_monday(self):
+        # 2023-01-01 was a Sunday.
+        assert "2023-01-02" in {str(d) for d in us_federal_reserve_holidays(2023)}
+
+    def test_juneteenth_only_from_2021(self):
+        assert "2020-06-19" not in {str(d) for d in us_federal_reserve_holidays(2020)}
+
+
+class TestBusinessCalendar:
+    def test_weekend_only_matches_numpy(self):
+        days = np.arange(np.datetime64("2019-01-01"), np.datetime64("2031-01-01"))
+        cal = BusinessCalendar()
+        assert (cal.roll_forward(days) == np.busday_offset(days, 0, roll="forward")).all()
+        assert (cal.roll_backward(days) == np.busday_offset(days, 0, roll="backward")).all()
+
+    def test_holiday_rolls_match_numpy(self):
+        days = np.arange(np.datetime64("2024-01-01"), np.datetime64("2028-01-01"))
+        holidays = [d for y in range(2023, 2029) for d in us_federal_reserve_holidays(y)]
+        cal = get_business_calendar("us_federal_reserve")
+        expected = np.busday_offset(days, 0, roll="forward", holidays=holidays)
+        assert (cal.roll_forward(days) == expected).all()
+
+    def test_tables_extend_to_new_years(self):
+        cal = BusinessCalendar()
+        cal.roll_forward(np.array(["2026-03-07"], dtype="datetime64[D]"))
+        rolled = cal.roll_forward(np.array(["2040-03-03", "NaT"], dtype="datetime64[D]"))
+        assert str(rolled[0]) == "2040-03-05"
+        assert np.isnat(rolled[1])
+
+    def test_extra_holidays(self):
+        cal = BusinessCalendar(extra_holidays=[date(2026, 12, 24)])
+        assert not cal.is_business_day(np.array(["2026-12-24"], dtype="datetime64[D]"))[0]
+        assert str(cal.roll_backward(np.array(["2026-12-24"], dtype="datetime64[D]"))[0]) == "2026-12-23"
+
+    def test_calendars_are_shared(self):
+        assert get_business_calendar("us_federal_reserve") is get_business_calendar("us_federal_reserve")
+
+    def test_unknown_calendar_rejected(self):
+        with pytest.raises(ValueError):
+            get_business_calendar("mars")
+
+    def test_parse_holiday_dates(self):
+        assert parse_holiday_dates(" 2026-12-24, 2026-12-31 ,") == (date(2026, 12, 24), date(2026, 12, 31))
+        with pytest.raises(ValueError):
+            parse_holiday_dates("12/24/2026")
+
+
+class TestProjectionCalendar:
+    def test_payday_on_holiday_rolls_back(self):
+        """A monthly paycheck due on MLK Day lands on the preceding Friday."""
+        pay = types.SimpleNamespace(
+            startdate=date(2026, 1, 19), firstdate=date(2026, 1, 19),
+            frequency="Monthly", type="Income",
+        )
+        fed = get_business_calendar("us_federal_reserve")
+        _, dates, _ = expand_occurrences([pay], date(2026, 1, 1), calendar=fed)
+        assert str(dates[0]) == "2026-01-16"
+        _, dates, _ = expand_occurrences([pay], date(2026, 1, 1), calendar=BusinessCalendar())
+        assert str(dates[0]) == "2026-01-19"
+
+    def test_create_app_configures_default_calendar(self, create_app):
+        try:
+            with _env(HOLIDAY_CALENDAR="us_federal_reserve", HOLIDAY_DATES="2026-12-24"):
+                app = create_app()
+            assert app.config["HOLIDAY_CALENDAR"] == "us_federal_reserve"
+            assert default_business_calendar() is get_business_calendar(
+                "us_federal_reserve", (date(2026, 12, 24),)
+            )
+        finally:
+            configure_business_calendar()
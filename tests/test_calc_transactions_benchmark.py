@@ -0,0 +1,94 @@
+"""
+Benchmark for the columnar calc_transactions.
+
+Times calc_transactions against the previous row-by-row implementation
+(natsort ordering, itertuples into dicts, a Python running-balance loop —
+kept below as the reference) on a 12k-occurrence projection, asserting that
+both produce the same frames.  The timing comparison depends on machine load,
+so it only runs with ``RUN_BENCHMARKS=1``.
+"""
+
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from natsort import index_natsorted
+
+from _helpers import calc_transactions
+
+
+_ROWS = 12_000
+
+
+def reference_calc_transactions(balance, total):
+    """The row-by-row calc_transactions this module benchmarks against."""
+    if total.empty:
+        trans = pd.DataFrame(columns=['name', 'type', 'amount', 'date'])
+        run_dict = {0: {'amount': float(balance), 'date': datetime.today().date()}}
+        return trans, pd.DataFrame.from_dict(run_dict, orient="index")
+
+    df = total.sort_values(by="date", key=lambda x: np.argsort(index_natsorted(total["date"]))).reset_index(drop=True)
+    trans_dict = {}
+    todaydate = datetime.today().date()
+    todaydateplus = todaydate + timedelta(days=90)
+    for i in df.itertuples(index=False):
+        if todaydateplus > i.date > todaydate and "(SKIP)" not in i.name:
+            trans_dict[len(trans_dict)] = {'name': i.name, 'type': i.type, 'amount': i.amount, 'date': i.date}
+    trans = pd.DataFrame.from_dict(trans_dict, orient="index")
+
+    df = df.copy()
+    df['amount'] = df['amount'].astype(float)
+    df['amount'] = np.where(df['type'] == 'Expense', -df['amount'], df['amount'])
+    df = df.groupby("date")['amount'].sum().reset_index()
+
+    runbalance = float(balance)
+    run_dict = {0: {'amount': runbalance, 'date': datetime.today().date()}}
+    for i in df.itertuples(index=False):
+        if i.date > todaydate:
+            runbalance += i.amount
+            run_dict[len(run_dict)] = {'amount': runbalance, 'date': i.date}
+    return trans, pd.DataFrame.from_dict(run_dict, orient="index")
+
+
+def make_large_total(rows=_ROWS, seed=7):
+    rng = random.Random(seed)
+    today = date.today()
+    return pd.DataFrame({
+        'type': [rng.choice(['Income', 'Expense']) for _ in range(rows)],
+        'name': [rng.choice(['Rent', 'Payroll', 'Coffee', 'Refund (SKIP)']) for _ in range(rows)],
+        'amount': [rng.choice([12.5, 100, 2400, 0.99]) for _ in range(rows)],
+        'date': [today + timedelta(days=rng.randint(-30, 730)) for _ in range(rows)],
+    })
+
+
+def best_of(fn, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestCalcTransactionsBenchmark:
+    def test_matches_reference_on_large_projection(self):
+        total = make_large_total()
+        trans, run = calc_transactions(5000.0, total)
+        ref_trans, ref_run = reference_calc_transactions(5000.0, total)
+
+        pd.testing.assert_frame_equal(trans, ref_trans, check_index_type=False)
+        pd.testing.assert_frame_equal(run[['amount', 'date']], ref_run, check_index_type=False, rtol=1e-9)
+        assert run['amount_cents'].tolist() == np.rint(ref_run['amount'].to_numpy() * 100).astype(np.int64).tolist()
+
+    @pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="RUN_BENCHMARKS not set")
+    def test_columnar_path_is_faster_at_10k_rows(self):
+        total = make_large_total()
+        columnar = best_of(lambda: calc_transactions(5000.0, total))
+        reference = best_of(lambda: reference_calc_transactions(5000.0, total))
+        print(f"\ncalc_transactions @ {_ROWS} rows: columnar {columnar * 1000:.1f} ms, "
+              f"row-by-row {reference * 1000:.1f} ms ({reference / columnar:.0f}x)")
+        assert reference / columnar > 3
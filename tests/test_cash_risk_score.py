@@ -49,6 +49,7 @@ sys.modules['app.cashflow'] = _cashflow_mod
 _spec.loader.exec_module(_cashflow_mod)
 
 calculate_cash_risk_score = _cashflow_mod.calculate_cash_risk_score
+calculate_cash_risk_scores = _cashflow_mod.calculate_cash_risk_scores
 
 
 # ---------------------------------------------------------------------------
@@ -428,3 +429,50 @@ class TestScoreBanding:
             result = calculate_cash_risk_score(-1000, run)
             assert result['status'] == 'Critical'
             assert result['score'] == 0
+
+
+# ---------------------------------------------------------------------------
+# Batch scoring
+# ---------------------------------------------------------------------------
+
+class TestBatchScoring:
+    """calculate_cash_risk_scores must match per-path scoring, in input order."""
+
+    def _series(self):
+        return [
+            (5000, make_run([(1, 5000), (30, 4000), (60, 3000), (90, 2000)])),
+            (0, make_run([(1, 100)])),
+            (10000, pd.DataFrame()),
+            (5000, make_run([(5, -200)])),
+            (500, make_run(daily_expense_series(1, 20, 500, 60))),
+            (8000, make_run([(3, 7000), (10, 1500), (25, 9000), (120, 9500)])),
+            (3000, make_run([(100, 2500), (130, 2000)])),
+            (50000, make_run([(1, 50000), (30, 48000), (60, 46000), (90, 44000)])),
+        ]
+
+    def test_matches_single_scoring(self):
+        series = self._series()
+        batch = calculate_cash_risk_scores(series)
+        assert batch == [calculate_cash_risk_score(b, r) for b, r in series]
+
+    def test_empty_batch(self):
+        assert calculate_cash_risk_scores([]) == []
+
+    def test_paths_are_scored_independently(self):
+        """A neighbouring path in the batch must not leak into another's factors."""
+        series = self._series()
+        for i in range(len(series)):
+            assert calculate_cash_risk_scores(series[i:i + 1])[0] == calculate_cash_risk_scores(series)[i]
+
+    def test_unsorted_string_dates(self):
+        """Rows may arrive unsorted and with ISO string dates."""
+        run = make_run([(3, 7000), (10, 1500), (25, 9000), (60, 8000)])
+        shuffled = run.iloc[[2, 0, 3, 1]].copy()
+        shuffled['date'] = shuffled['date'].map(lambda d: d.strftime('%Y-%m-%d'))
+        assert calculate_cash_risk_score(8000, shuffled) == calculate_cash_risk_score(8000, run)
+
+    def test_recovery_after_lowest_point(self):
+        run = make_run([(3, 7000), (10, 1500), (25, 9000), (60, 8000)])
+        result = calculate_cash_risk_score(8000, run)
+        assert result['days_to_lowest'] == 10
+        assert result['recovery_days'] == 15
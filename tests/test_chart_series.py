@@ -0,0 +1,134 @@
+"""
+Tests for the dashboard chart payloads in app/chart_series.py.
+
+The dict-built figure must be exactly what plotly itself would serialize,
+the headline minimums and axis ranges must come from the full series, and
+both downsamplers must stay within the point budget while keeping the
+series' endpoints (and, for min/max bucketing, its extremes).
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.graph_objs as go
+import pytest
+
+from app.chart_series import (
+    chart_payload,
+    downsample_indices,
+    lttb_indices,
+    minmax_indices,
+)
+
+
+@contextmanager
+def _env(**overrides):
+    """Temporarily set environment variables, restoring prior values after."""
+    sentinel = object()
+    previous = {k: os.environ.get(k, sentinel) for k in overrides}
+    try:
+        os.environ.update(overrides)
+        yield
+    finally:
+        for k, prev in previous.items():
+            if prev is sentinel:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = prev
+
+
+def make_run(amounts, step=1):
+    today = date.today()
+    return pd.DataFrame({
+        "amount": [float(a) for a in amounts],
+        "date": [today + timedelta(days=i * step) for i in range(len(amounts))],
+    })
+
+
+def wave(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.round(5000 + np.cumsum(rng.normal(0, 300, n)), 2)
+
+
+class TestChartPayload:
+    def test_matches_plotly_serialization(self):
+        run = make_run(wave(120), step=3)
+        scenario = make_run(wave(120, seed=1), step=3)
+        _, _, figure = chart_payload(run, scenario)
+        expected = json.dumps(go.Figure(figure), cls=plotly.utils.PlotlyJSONEncoder)
+        assert json.loads(json.dumps(figure)) == json.loads(expected)
+
+    def test_series_are_newest_first(self):
+        run = make_run([100, 50, 80])
+        _, _, figure = chart_payload(run)
+        (trace,) = figure["data"]
+        assert trace["name"] == "Schedule"
+        assert trace["x"] == sorted(trace["x"], reverse=True)
+        assert trace["y"] == [80.0, 50.0, 100.0]
+
+    def test_minimums_and_ranges(self):
+        today = date.today()
+        run = pd.DataFrame({
+            "amount": [500.0, -200.0, 900.0, -5000.0],
+            "date": [today, today + timedelta(days=10), today + timedelta(days=20), today + timedelta(days=120)],
+        })
+        scenario = run.assign(amount=[500.0, -400.0, 1200.0, 0.0])
+        minbalance, min_scenario, figure = chart_payload(run, scenario)
+        # Rows past the 90-day window don't count towards the minimum.
+        assert str(minbalance) == "-200.00"
+        assert str(min_scenario) == "-400.00"
+        assert figure["layout"]["yaxis"]["range"] == pytest.approx([-440.0, 1320.0])
+        assert figure["layout"]["showlegend"] is True
+
+    def test_ranges_use_full_series_when_downsampled(self):
+        amounts = wave(2000)
+        run = make_run(amounts, step=1)
+        full = chart_payload(run)
+        thinned = chart_payload(run, max_points=100)
+        assert full[0] == thinned[0]
+        assert full[2]["layout"] == thinned[2]["layout"]
+        assert len(thinned[2]["data"][0]["x"]) <= 100
+
+
+class TestDownsampling:
+    def test_short_series_untouched(self):
+        assert downsample_indices(np.arange(10), np.arange(10.0), 50).tolist() == list(range(10))
+        assert downsample_indices(np.arange(10), np.arange(10.0), 0).tolist() == list(range(10))
+
+    @pytest.mark.parametrize("max_points", [4, 10, 99, 500])
+    def test_minmax_keeps_extremes_and_endpoints(self, max_points):
+        amounts = wave(3000, seed=2)
+        keep = minmax_indices(amounts, max_points)
+        assert len(keep) <= max_points
+        assert keep[0] == 0 and keep[-1] == len(amounts) - 1
+        assert np.all(np.diff(keep) > 0)
+        assert amounts[keep].min() == amounts.min()
+        assert amounts[keep].max() == amounts.max()
+
+    @pytest.mark.parametrize("max_points", [3, 10, 99, 500])
+    def test_lttb_point_budget(self, max_points):
+        amounts = wave(3000, seed=3)
+        keep = lttb_indices(np.arange(len(amounts)), amounts, max_points)
+        assert len(keep) == max_points
+        assert keep[0] == 0 and keep[-1] == len(amounts) - 1
+        assert np.all(np.diff(keep) > 0)
+
+    def test_lttb_keeps_isolated_spike(self):
+        amounts = np.full(1000, 100.0)
+        amounts[537] = -5000.0
+        keep = lttb_indices(np.arange(1000), amounts, 50)
+        assert 537 in keep
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            downsample_indices(np.arange(10), np.arange(10.0), 5, method="nope")
+
+    def test_create_app_rejects_unknown_method(self, create_app):
+        with _env(CHART_DOWNSAMPLE="nope"):
+            with pytest.raises(ValueError):
+                create_app()
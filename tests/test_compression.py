@@ -0,0 +1,93 @@
+"""
+Tests for response compression (app/compression.py).
+
+Text responses above the size threshold are gzip-encoded when the client
+accepts it; images, streamed exports and small bodies pass through untouched,
+and ETag revalidation keeps working on compressed responses.
+"""
+
+import gzip
+
+import pytest
+
+from _helpers import static_cache
+
+
+_GZIP = {"Accept-Encoding": "gzip"}
+
+
+def _bearer(client):
+    resp = client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.local", "password": "testpass123"},
+    )
+    return {"Authorization": f"Bearer {resp.get_json()['data']['token']}"}
+
+
+@pytest.fixture()
+def min_size(flask_app):
+    original = flask_app.config["COMPRESSION_MIN_SIZE"]
+    yield lambda size: flask_app.config.__setitem__("COMPRESSION_MIN_SIZE", size)
+    flask_app.config["COMPRESSION_MIN_SIZE"] = original
+
+
+class TestCompression:
+    def test_gzip_when_accepted(self, client):
+        plain = client.get("/sw.js")
+        resp = client.get("/sw.js", headers=_GZIP)
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert int(resp.headers["Content-Length"]) == len(resp.data) < len(plain.data)
+        assert gzip.decompress(resp.data) == plain.data
+
+    def test_identity_without_accept_encoding(self, client):
+        resp = client.get("/sw.js", headers={"Accept-Encoding": "identity"})
+        assert "Content-Encoding" not in resp.headers
+        assert "Accept-Encoding" in resp.headers["Vary"]
+
+    def test_below_threshold_not_compressed(self, client, min_size):
+        min_size(1_000_000)
+        resp = client.get("/sw.js", headers=_GZIP)
+        assert "Content-Encoding" not in resp.headers
+
+    def test_csrf_form_page_not_compressed(self, client, min_size):
+        min_size(0)
+        resp = client.get("/login", headers=_GZIP)
+        assert resp.status_code == 200
+        assert b'name="csrf_token"' in resp.data
+        assert "Content-Encoding" not in resp.headers
+
+    def test_images_not_compressed(self, client):
+        resp = client.get("/static/apple-touch-icon.png", headers=_GZIP)
+        assert resp.status_code == 200
+        assert "Content-Encoding" not in resp.headers
+
+    def test_streamed_export_not_compressed(self, client):
+        resp = client.get(
+            "/api/v1/projections/export?format=ndjson",
+            headers={**_bearer(client), **_GZIP},
+        )
+        assert resp.status_code == 200
+        assert "Content-Encoding" not in resp.headers
+
+    def test_etag_weakened_and_revalidates(self, client, min_size):
+        min_size(0)
+        headers = {**_bearer(client), **_GZIP}
+        resp = client.get("/api/v1/bootstrap", headers=headers)
+        assert resp.headers["Content-Encoding"] == "gzip"
+        etag = resp.headers["ETag"]
+        assert etag.startswith("W/")
+
+        again = client.get("/api/v1/bootstrap", headers={**headers, "If-None-Match": etag})
+        assert again.status_code == 304
+        strong = client.get("/api/v1/bootstrap", headers={**headers, "If-None-Match": etag[2:]})
+        assert strong.status_code == 304
+
+    def test_static_bodies_cached(self, client):
+        static_cache.clear()
+        first = client.get("/manifest.json", headers=_GZIP)
+        assert first.headers["Content-Encoding"] == "gzip"
+        assert len(static_cache._entries) == 1
+        second = client.get("/manifest.json", headers=_GZIP)
+        assert second.data == first.data
+        assert len(static_cache._entries) == 1
@@ -0,0 +1,161 @@
+"""
+Tests for the per-user data revision counter (app/data_revision.py).
+
+Every write to a user's schedules, scenarios, holds, skips or balance — web
+routes, API mutations, CSV import, email and Plaid balance updates — must
+bump the owner's ``data_revision`` so projection ETags can be validated with
+a single read.
+"""
+
+import io
+from datetime import date, timedelta
+from unittest import mock
+
+import pytest
+
+from conftest import _ADMIN_USER_ID, _db
+from _helpers import Hold, Schedule, Scenario, Skip, bump_data_revision, get_data_revision
+from app.plaid_service import _upsert_today_balance
+from app.api.routes import data as _data_routes
+
+
+def _revision(flask_app):
+    with flask_app.app_context():
+        return get_data_revision(_ADMIN_USER_ID)
+
+
+def _login(client):
+    resp = client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.local", "password": "testpass123"},
+    )
+    return {"Authorization": f"Bearer {resp.get_json()['data']['token']}"}
+
+
+@pytest.fixture()
+def cleanup(flask_app):
+    yield
+    with flask_app.app_context():
+        for model in (Schedule, Scenario, Hold, Skip):
+            model.query.filter(model.name.like("_test_rev%")).delete(synchronize_session=False)
+        _db.session.commit()
+
+
+class TestCounter:
+    def test_bump_increments(self, app_ctx):
+        before = get_data_revision(_ADMIN_USER_ID)
+        bump_data_revision(_ADMIN_USER_ID)
+        bump_data_revision(_ADMIN_USER_ID)
+        _db.session.commit()
+        assert get_data_revision(_ADMIN_USER_ID) == before + 2
+
+    def test_rollback_discards_bump(self, app_ctx):
+        before = get_data_revision(_ADMIN_USER_ID)
+        bump_data_revision(_ADMIN_USER_ID)
+        _db.session.rollback()
+        assert get_data_revision(_ADMIN_USER_ID) == before
+
+    def test_unknown_user(self, app_ctx):
+        assert get_data_revision(999999) == 0
+
+
+class TestWebRoutesBump:
+    def test_schedule_create_update_delete(self, flask_app, auth_client, cleanup):
+        start = (date.today() + timedelta(days=5)).isoformat()
+        form = {"name": "_test_rev_web", "amount": "10", "type": "Expense",
+                "frequency": "Monthly", "startdate": start}
+
+        before = _revision(flask_app)
+        auth_client.post("/create", data=form)
+        assert _revision(flask_app) == before + 1
+
+        with flask_app.app_context():
+            schedule_id = Schedule.query.filter_by(name="_test_rev_web").one().id
+        auth_client.post("/update", data={**form, "id": schedule_id, "amount": "12"})
+        assert _revision(flask_app) == before + 2
+
+        auth_client.post(f"/addhold/{schedule_id}")
+        assert _revision(flask_app) == before + 3
+
+        auth_client.post("/clearholds")
+        auth_client.post(f"/delete/{schedule_id}")
+        assert _revision(flask_app) == before + 5
+
+    def test_balance_entry(self, flask_app, auth_client):
+        before = _revision(flask_app)
+        auth_client.post("/balance", data={"amount": "1234", "date": date.today().isoformat()})
+        assert _revision(flask_app) == before + 1
+
+
+class TestApiMutationsBump:
+    def test_schedule_and_scenario_mutations(self, flask_app, client, cleanup):
+        headers = _login(client)
+        body = {"name": "_test_rev_api", "amount": "20.00", "type": "Income",
+                "frequency": "Weekly", "start_date": (date.today() + timedelta(days=2)).isoformat()}
+
+        before = _revision(flask_app)
+        schedule_id = client.post("/api/v1/schedules", headers=headers, json=body).get_json()["data"]["id"]
+        client.put(f"/api/v1/schedules/{schedule_id}", headers=headers, json={**body, "amount": "21.00"})
+        client.delete(f"/api/v1/schedules/{schedule_id}", headers=headers)
+        assert _revision(flask_app) == before + 3
+
+        scenario_id = client.post("/api/v1/scenarios", headers=headers, json=body).get_json()["data"]["id"]
+        client.delete(f"/api/v1/scenarios/{scenario_id}", headers=headers)
+        client.delete("/api/v1/skips", headers=headers)
+        assert _revision(flask_app) == before + 6
+
+    def test_rejected_write_does_not_bump(self, flask_app, client):
+        headers = _login(client)
+        before = _revision(flask_app)
+        resp = client.post("/api/v1/schedules", headers=headers, json={"name": ""})
+        assert resp.status_code == 422
+        assert _revision(flask_app) == before
+
+    def test_balance_post(self, flask_app, client):
+        headers = _login(client)
+        before = _revision(flask_app)
+        client.post("/api/v1/balance", headers=headers,
+                    json={"amount": "2500.00", "date": date.today().isoformat()})
+        assert _revision(flask_app) == before + 1
+
+
+class TestBackgroundWritersBump:
+    def test_csv_import(self, flask_app, auth_client, cleanup):
+        csv_text = (
+            "Name,Amount,Type,Frequency,Next Date,First Date\n"
+            f"_test_rev_csv,15.00,Expense,Monthly,{date.today() + timedelta(days=9)},{date.today()}\n"
+        )
+        before = _revision(flask_app)
+        auth_client.post(
+            "/import",
+            data={"file": (io.BytesIO(csv_text.encode()), "schedules.csv", "text/csv")},
+            content_type="multipart/form-data",
+        )
+        assert _revision(flask_app) == before + 1
+
+    def test_plaid_balance_upsert(self, flask_app):
+        with flask_app.app_context():
+            before = get_data_revision(_ADMIN_USER_ID)
+            _upsert_today_balance(_ADMIN_USER_ID, 4321.0)
+            _db.session.commit()
+            assert get_data_revision(_ADMIN_USER_ID) == before + 1
+
+
+class TestRevisionDrivesEtag:
+    def test_304_only_reads_revision(self, client):
+        headers = _login(client)
+        etag = client.get("/api/v1/projections", headers=headers).headers["ETag"]
+        with mock.patch.object(_data_routes, "_project_data") as project:
+            resp = client.get("/api/v1/projections", headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+        project.assert_not_called()
+
+    def test_bump_invalidates_etag(self, flask_app, client):
+        headers = _login(client)
+        etag = client.get("/api/v1/risk-score", headers=headers).headers["ETag"]
+        with flask_app.app_context():
+            bump_data_revision(_ADMIN_USER_ID)
+            _db.session.commit()
+        resp = client.get("/api/v1/risk-score", headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
@@ -0,0 +1,149 @@
+"""
+Tests for server-database connection pooling (app/db_pool.py).
+
+Engine options are derived from config, SQLite keeps SQLAlchemy's defaults,
+and ``TimedQueuePool`` records checkout waits, slow checkouts and pool
+timeouts so starvation is visible.
+"""
+
+import threading
+import time
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from conftest import _db
+from _helpers import TimedQueuePool, engine_options, pool_metrics
+
+
+_BASE_CONFIG = {
+    "DB_POOL_SIZE": 8,
+    "DB_MAX_OVERFLOW": 2,
+    "DB_POOL_TIMEOUT": 10.0,
+    "DB_POOL_RECYCLE": 1800,
+    "DB_STATEMENT_TIMEOUT_MS": 30000,
+    "DB_APPLICATION_NAME": "pycashflow",
+}
+
+
+def _config(uri, **overrides):
+    return {**_BASE_CONFIG, "SQLALCHEMY_DATABASE_URI": uri, **overrides}
+
+
+@pytest.fixture()
+def metrics():
+    pool_metrics.clear()
+    yield pool_metrics
+    pool_metrics.clear()
+
+
+class TestEngineOptions:
+    def test_sqlite_keeps_defaults(self):
+        assert engine_options(_config("sqlite:///data/db.sqlite")) == {}
+
+    def test_postgresql(self):
+        options = engine_options(_config("postgresql://app@db/cashflow"))
+        assert options == {
+            "poolclass": TimedQueuePool,
+            "pool_size": 8,
+            "max_overflow": 2,
+            "pool_timeout": 10.0,
+            "pool_recycle": 1800,
+            "pool_pre_ping": True,
+            "connect_args": {
+                "options": "-c statement_timeout=30000",
+                "application_name": "pycashflow",
+            },
+        }
+
+    def test_statement_timeout_can_be_disabled(self):
+        options = engine_options(_config(
+            "postgresql+psycopg2://app@db/cashflow", DB_STATEMENT_TIMEOUT_MS=0, DB_APPLICATION_NAME=""
+        ))
+        assert "connect_args" not in options
+
+    @pytest.mark.parametrize("key, value", [
+        ("DB_POOL_SIZE", 0),
+        ("DB_MAX_OVERFLOW", -1),
+        ("DB_POOL_TIMEOUT", -1),
+        ("DB_STATEMENT_TIMEOUT_MS", -5),
+    ])
+    def test_invalid_values_rejected(self, key, value):
+        with pytest.raises(ValueError, match=key):
+            engine_options(_config("postgresql://app@db/cashflow", **{key: value}))
+
+
+class TestCheckoutMetrics:
+    def _engine(self, tmp_path, pool_timeout=5.0):
+        return sa.create_engine(
+            f"sqlite:///{tmp_path / 'pool.sqlite'}",
+            poolclass=TimedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=pool_timeout,
+        )
+
+    def test_uncontended_checkouts_are_recorded(self, tmp_path, metrics):
+        engine = self._engine(tmp_path)
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.exec_driver_sql("SELECT 1")
+        stats = metrics.stats(engine.pool)
+        assert stats["checkouts"] == 3
+        assert stats["timeouts"] == 0
+        assert stats["slow_checkouts"] == 0
+        assert stats["pool_size"] == 1
+        assert stats["checked_out"] == 0
+        engine.dispose()
+
+    def test_starved_checkout_is_slow(self, tmp_path, metrics):
+        engine = self._engine(tmp_path)
+        held = engine.connect()
+        released = threading.Timer(0.2, held.close)
+        released.start()
+        with engine.connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
+        released.join()
+
+        stats = metrics.stats()
+        assert stats["slow_checkouts"] == 1
+        assert stats["wait_max_ms"] >= 150
+        engine.dispose()
+
+    def test_pool_timeout_is_counted(self, tmp_path, metrics):
+        engine = self._engine(tmp_path, pool_timeout=0.05)
+        held = engine.connect()
+        start = time.perf_counter()
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        assert time.perf_counter() - start < 1
+        held.close()
+
+        stats = metrics.stats(engine.pool)
+        assert stats["timeouts"] == 1
+        assert stats["slow_checkouts"] == 0
+        engine.dispose()
+
+
+class TestPoolMetricsRoute:
+    def test_requires_global_admin(self, auth_client):
+        resp = auth_client.get("/global_admin/db_pool")
+        assert resp.status_code in (302, 403)
+
+    def test_global_admin_sees_metrics(self, flask_app, app_ctx, user_model, metrics):
+        admin = user_model(email="pool-admin@test.local", name="Pool", admin=True,
+                           is_global_admin=True, is_active=True)
+        _db.session.add(admin)
+        _db.session.commit()
+        try:
+            client = flask_app.test_client()
+            with client.session_transaction() as sess:
+                sess["_user_id"] = str(admin.id)
+                sess["_fresh"] = True
+            resp = client.get("/global_admin/db_pool")
+            assert resp.status_code == 200
+            assert set(resp.get_json()) >= {"checkouts", "timeouts", "slow_checkouts", "wait_max_ms"}
+        finally:
+            _db.session.delete(admin)
+            _db.session.commit()
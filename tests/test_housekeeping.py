@@ -0,0 +1,136 @@
+"""
+Tests for the batch schedule housekeeping job in app/housekeeping.py.
+
+run_housekeeping must apply the same bookkeeping calc_schedule(commit=True)
+used to apply on every read — for all users at once — and projection reads
+must no longer write.
+"""
+
+import types
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import pytest
+
+from conftest import _ADMIN_USER_ID, _db as db
+from _helpers import Scenario, Schedule, Skip, calc_schedule, run_housekeeping
+
+
+def last_weekday():
+    today = date.today()
+    return today - timedelta(days=max(0, today.weekday() - 4))
+
+
+def add_schedule(name, startdate, frequency="Monthly", firstdate=None, model=Schedule):
+    row = model(
+        user_id=_ADMIN_USER_ID, name=name, amount="10.00", frequency=frequency,
+        startdate=startdate, firstdate=firstdate, type="Expense",
+    )
+    db.session.add(row)
+    db.session.commit()
+    return row.id
+
+
+@pytest.fixture()
+def hk_ctx(flask_app):
+    with flask_app.app_context():
+        yield
+        Schedule.query.filter(Schedule.name.like("_hk_%")).delete(synchronize_session=False)
+        Scenario.query.filter(Scenario.name.like("_hk_%")).delete(synchronize_session=False)
+        Skip.query.filter(Skip.name.like("_hk_%")).delete(synchronize_session=False)
+        db.session.commit()
+
+
+def legacy_bookkeeping(rows, todaydate):
+    """Run calc_schedule(commit=True) on detached copies with a pinned today."""
+    class FixedDateTime(datetime):
+        @classmethod
+        def today(cls):
+            return cls(todaydate.year, todaydate.month, todaydate.day, 12, 0)
+
+    copies = [types.SimpleNamespace(
+        name=r.name, amount=r.amount, frequency=r.frequency, startdate=r.startdate,
+        firstdate=r.firstdate, type=r.type,
+    ) for r in rows]
+    with mock.patch.dict(calc_schedule.__globals__, {"datetime": FixedDateTime, "db": mock.MagicMock()}):
+        calc_schedule(copies, [], [], [], commit=True)
+    return [(c.startdate, c.firstdate) for c in copies]
+
+
+class TestRunHousekeeping:
+    def test_matches_legacy_read_path_bookkeeping(self, hk_ctx):
+        today = last_weekday()
+        specs = [
+            ("_hk_monthly", today - timedelta(days=70), "Monthly", None),
+            ("_hk_month_end", date(today.year - 1, 1, 31), "Monthly", date(today.year - 1, 1, 31)),
+            ("_hk_quarterly", today - timedelta(days=200), "Quarterly", None),
+            ("_hk_weekly", today - timedelta(days=30), "Weekly", None),
+            ("_hk_biweekly", today - timedelta(days=3000), "BiWeekly", None),
+            ("_hk_yearly", today - timedelta(days=400), "Yearly", None),
+            ("_hk_future", today + timedelta(days=10), "Monthly", None),
+        ]
+        ids = [add_schedule(*spec) for spec in specs]
+        expected = legacy_bookkeeping([db.session.get(Schedule, i) for i in ids], today)
+
+        run_housekeeping(today)
+        actual = [(db.session.get(Schedule, i).startdate, db.session.get(Schedule, i).firstdate) for i in ids]
+        assert actual == expected
+        assert all(start > today for start, _first in actual)
+
+    def test_purges_past_onetime_schedules_and_skips(self, hk_ctx):
+        today = last_weekday()
+        past = add_schedule("_hk_once_past", today - timedelta(days=1), "Onetime")
+        future = add_schedule("_hk_once_future", today + timedelta(days=1), "Onetime")
+        scenario = add_schedule("_hk_scenario_past", today - timedelta(days=1), "Onetime", model=Scenario)
+        for name, offset in (("_hk_skip_past", -1), ("_hk_skip_today", 0)):
+            db.session.add(Skip(user_id=_ADMIN_USER_ID, name=name, amount="1.00", type="Income",
+                                date=today + timedelta(days=offset)))
+        db.session.commit()
+
+        stats = run_housekeeping(today)
+        assert stats["onetime_schedules_deleted"] >= 1
+        assert db.session.get(Schedule, past) is None
+        assert db.session.get(Schedule, future) is not None
+        assert db.session.get(Scenario, scenario) is not None
+        assert {s.name for s in Skip.query.filter(Skip.name.like("_hk_%"))} == {"_hk_skip_today"}
+
+    def test_weekend_leaves_start_dates_alone(self, hk_ctx):
+        saturday = last_weekday() + timedelta(days=(5 - last_weekday().weekday()))
+        start = saturday - timedelta(days=40)
+        row_id = add_schedule("_hk_weekend", start)
+        run_housekeeping(saturday)
+        row = db.session.get(Schedule, row_id)
+        assert row.startdate == start
+        assert row.firstdate == start
+
+    def test_cli_command(self, flask_app, hk_ctx):
+        result = flask_app.test_cli_runner().invoke(args=["housekeeping"])
+        assert result.exit_code == 0
+        assert "skips_deleted=" in result.output
+
+
+class TestReadsDoNotWrite:
+    def test_dashboard_leaves_stale_start_date(self, flask_app, client, hk_ctx):
+        start = date.today() - timedelta(days=70)
+        row_id = add_schedule("_hk_read_only", start)
+        resp = client.post("/api/v1/auth/login", json={"email": "admin@test.local", "password": "testpass123"})
+        token = resp.get_json()["data"]["token"]
+        assert client.get("/api/v1/dashboard", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+        db.session.expire_all()
+        assert db.session.get(Schedule, row_id).startdate == start
+
+
+class TestRevisionBump:
+    def test_conditional_get_after_housekeeping_returns_200(self, flask_app, client, hk_ctx):
+        start = date.today() - timedelta(days=70)
+        # On weekends start dates stay put; the firstdate backfill still applies.
+        add_schedule("_hk_etag", start)
+        resp = client.post("/api/v1/auth/login", json={"email": "admin@test.local", "password": "testpass123"})
+        headers = {"Authorization": f"Bearer {resp.get_json()['data']['token']}"}
+        etag = client.get("/api/v1/projections", headers=headers).headers["ETag"]
+
+        stats = run_housekeeping()
+        assert stats["revisions_bumped"] >= 1
+        resp = client.get("/api/v1/projections", headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
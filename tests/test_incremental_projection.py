@@ -0,0 +1,134 @@
+"""
+Tests for the incremental projection state in app/incremental_projection.py.
+
+After an edit only the changed rows may be re-expanded, and the result must
+match a full update_cash over the same rows.
+"""
+
+import types
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from _helpers import (
+    IncrementalProjection,
+    cached_update_cash,
+    incremental_projections,
+    projection_cache,
+    update_cash,
+)
+
+
+def make_schedule(name, amount=100, frequency="Monthly", days_offset=5, type="Expense"):
+    start = date.today() + timedelta(days=days_offset)
+    return types.SimpleNamespace(
+        name=name, amount=amount, frequency=frequency,
+        startdate=start, firstdate=start, type=type,
+    )
+
+
+def make_rows():
+    schedules = [
+        make_schedule("Rent", 1500, days_offset=3),
+        make_schedule("Paycheck", 2500, "BiWeekly", days_offset=-4, type="Income"),
+        make_schedule("Groceries", 120, "Weekly", days_offset=1),
+        make_schedule("Insurance", 600, "Quarterly", days_offset=20),
+    ]
+    holds = [types.SimpleNamespace(name="Pending", amount=40, type="Expense")]
+    skips = [types.SimpleNamespace(
+        name="Rent (SKIP)", amount=1500, type="Income", date=date.today() + timedelta(days=3),
+    )]
+    return schedules, holds, skips
+
+
+def assert_same_projection(actual, expected):
+    for got, want in zip(actual, expected):
+        if want is None:
+            assert got is None
+            continue
+        pd.testing.assert_frame_equal(got, want, check_index_type=False)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state():
+    incremental_projections.clear()
+    projection_cache.clear()
+    yield
+    incremental_projections.clear()
+    projection_cache.clear()
+
+
+class TestIncrementalProjection:
+    def test_first_sync_matches_update_cash(self):
+        schedules, holds, skips = make_rows()
+        state = IncrementalProjection(date.today())
+        assert_same_projection(
+            state.sync(5000.0, schedules, holds, skips, commit=False),
+            update_cash(5000.0, schedules, holds, skips, commit=False),
+        )
+        assert state.last_expanded == 6
+
+    def test_edit_expands_only_changed_row(self):
+        schedules, holds, skips = make_rows()
+        state = IncrementalProjection(date.today())
+        state.sync(5000.0, schedules, holds, skips, commit=False)
+
+        schedules[2].amount = 95
+        result = state.sync(5000.0, schedules, holds, skips, commit=False)
+        assert state.last_expanded == 1
+        assert_same_projection(result, update_cash(5000.0, schedules, holds, skips, commit=False))
+
+    def test_create_and_delete(self):
+        schedules, holds, skips = make_rows()
+        state = IncrementalProjection(date.today())
+        state.sync(5000.0, schedules, holds, skips, commit=False)
+
+        schedules.append(make_schedule("Gym", 45, days_offset=10))
+        del schedules[0]
+        skips = []
+        result = state.sync(5000.0, schedules, holds, skips, commit=False)
+        assert state.last_expanded == 1
+        assert state.live_sources == 5
+        assert_same_projection(result, update_cash(5000.0, schedules, holds, skips, commit=False))
+
+    def test_balance_change_reaccumulates_everything(self):
+        schedules, holds, skips = make_rows()
+        state = IncrementalProjection(date.today())
+        state.sync(5000.0, schedules, holds, skips, commit=False)
+        result = state.sync(7500.0, schedules, holds, skips, commit=False)
+        assert state.last_expanded == 0
+        assert_same_projection(result, update_cash(7500.0, schedules, holds, skips, commit=False))
+
+    def test_scenarios_overlay(self):
+        schedules, holds, skips = make_rows()
+        scenarios = [make_schedule("New car", 450, days_offset=7)]
+        state = IncrementalProjection(date.today())
+        result = state.sync(5000.0, schedules, holds, skips, scenarios, commit=False)
+        assert_same_projection(result, update_cash(5000.0, schedules, holds, skips, scenarios, commit=False))
+
+    def test_empty_inputs(self):
+        state = IncrementalProjection(date.today())
+        assert_same_projection(
+            state.sync(100.0, [], [], [], commit=False), update_cash(100.0, [], [], [], commit=False)
+        )
+
+
+class TestCachedIncremental:
+    def test_user_id_routes_misses_through_incremental_state(self):
+        schedules, holds, skips = make_rows()
+        cached_update_cash(5000.0, schedules, holds, skips, commit=False, user_id=42)
+        schedules[0].amount = 1600
+        result = cached_update_cash(5000.0, schedules, holds, skips, commit=False, user_id=42)
+        assert incremental_projections.state_for(42, commit=False).last_expanded == 1
+        assert_same_projection(result, update_cash(5000.0, schedules, holds, skips, commit=False))
+
+    def test_disabled_store_falls_back_to_full_recompute(self):
+        maxsize = incremental_projections.maxsize
+        incremental_projections.configure(0)
+        try:
+            schedules, holds, skips = make_rows()
+            result = cached_update_cash(5000.0, schedules, holds, skips, commit=False, user_id=42)
+            assert_same_projection(result, update_cash(5000.0, schedules, holds, skips, commit=False))
+        finally:
+            incremental_projections.configure(maxsize)
@@ -0,0 +1,75 @@
+"""
+Tests for the integer-cent amount helpers (app/money.py) and the API
+serializers built on them.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from _helpers import cents_array, format_cents, frame_cents, serialize_series, serialize_series_columnar, to_cents
+
+
+class TestToCents:
+    @pytest.mark.parametrize("value, cents", [
+        (Decimal("1234.56"), 123456),
+        ("-0.07", -7),
+        (0.1, 10),
+        (12, 1200),
+        (None, 0),
+        (Decimal("0.125"), 12),
+        (Decimal("0.135"), 14),
+    ])
+    def test_conversion(self, value, cents):
+        assert to_cents(value) == cents
+
+    def test_array_matches_scalar(self):
+        values = [Decimal("19.99"), 0.29, "7.10", None, -3.3]
+        assert cents_array(values).tolist() == [to_cents(v) for v in values]
+        assert cents_array(values).dtype == np.int64
+
+    def test_frame_prefers_cents_column(self):
+        df = pd.DataFrame({"amount": [1.0, 2.0], "amount_cents": [101, 202]})
+        assert frame_cents(df).tolist() == [101, 202]
+        assert frame_cents(df[["amount"]]).tolist() == [100, 200]
+
+
+class TestFormatCents:
+    @pytest.mark.parametrize("cents, text", [
+        (123456, "1234.56"),
+        (5, "0.05"),
+        (-5, "-0.05"),
+        (-120, "-1.20"),
+        (0, "0.00"),
+    ])
+    def test_format(self, cents, text):
+        assert format_cents(cents) == text
+
+
+class TestSeriesSerializers:
+    def _run(self):
+        return pd.DataFrame({
+            "amount": [10.05, -0.3],
+            "date": [date(2026, 1, 1), date(2026, 1, 3)],
+            "amount_cents": np.array([1005, -30], dtype=np.int64),
+        })
+
+    def test_points(self):
+        assert serialize_series(self._run()) == [
+            {"date": "2026-01-01", "amount": "10.05"},
+            {"date": "2026-01-03", "amount": "-0.30"},
+        ]
+
+    def test_columnar(self):
+        assert serialize_series_columnar(self._run()) == {
+            "start_date": "2026-01-01",
+            "day_offsets": [0, 2],
+            "amounts_cents": [1005, -30],
+        }
+
+    def test_empty(self):
+        assert serialize_series(None) is None
+        assert serialize_series(pd.DataFrame(columns=["amount", "date"])) is None
@@ -0,0 +1,86 @@
+"""
+Tests for the content-hashed projection cache in app/projection_cache.py.
+
+cached_update_cash must return the stored projection only when every input
+(balance, schedule/hold/skip/scenario rows, today's date) is unchanged, and
+the LRU must report hits, misses and evictions.
+"""
+
+import types
+from datetime import date, timedelta
+
+import pytest
+
+from _helpers import ProjectionCache, cached_update_cash, projection_cache, projection_key
+
+
+def make_schedule(name="Rent", amount=1000, days_offset=5):
+    start = date.today() + timedelta(days=days_offset)
+    return types.SimpleNamespace(
+        name=name, amount=amount, frequency="Monthly",
+        startdate=start, firstdate=start, type="Expense",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    maxsize = projection_cache.maxsize
+    projection_cache.clear()
+    yield
+    projection_cache.configure(maxsize)
+    projection_cache.clear()
+
+
+class TestProjectionKey:
+    def test_identical_inputs_share_key(self):
+        assert projection_key(100, [make_schedule()], [], []) == projection_key(100, [make_schedule()], [], [])
+
+    def test_row_change_changes_key(self):
+        assert projection_key(100, [make_schedule()], [], []) != projection_key(
+            100, [make_schedule(amount=1001)], [], []
+        )
+
+    def test_balance_and_date_change_key(self):
+        base = projection_key(100, [], [], [], todaydate=date(2030, 1, 1))
+        assert base != projection_key(101, [], [], [], todaydate=date(2030, 1, 1))
+        assert base != projection_key(100, [], [], [], todaydate=date(2030, 1, 2))
+
+
+class TestCachedUpdateCash:
+    def test_second_identical_call_is_a_hit(self):
+        first = cached_update_cash(5000.0, [make_schedule()], [], [], [], commit=False)
+        second = cached_update_cash(5000.0, [make_schedule()], [], [], [], commit=False)
+        assert projection_cache.stats()["misses"] == 1
+        assert projection_cache.stats()["hits"] == 1
+        assert first[1].equals(second[1])
+
+    def test_changed_schedule_recomputes(self):
+        cached_update_cash(5000.0, [make_schedule()], [], [], [], commit=False)
+        _, run, _ = cached_update_cash(5000.0, [make_schedule(amount=500)], [], [], [], commit=False)
+        assert projection_cache.stats()["misses"] == 2
+        assert float(run["amount"].iloc[-1]) == pytest.approx(5000.0 - 13 * 500)
+
+    def test_returned_frames_are_copies(self):
+        _, run, _ = cached_update_cash(5000.0, [make_schedule()], [], [], [], commit=False)
+        run["amount"] = 0.0
+        _, again, _ = cached_update_cash(5000.0, [make_schedule()], [], [], [], commit=False)
+        assert float(again["amount"].iloc[0]) == pytest.approx(5000.0)
+
+    def test_disabled_cache_never_stores(self):
+        projection_cache.configure(0)
+        cached_update_cash(5000.0, [], [], [], [], commit=False)
+        cached_update_cash(5000.0, [], [], [], [], commit=False)
+        assert projection_cache.stats()["hits"] == 0
+        assert projection_cache.stats()["size"] == 0
+
+
+class TestProjectionCacheLru:
+    def test_least_recently_used_entry_evicted(self):
+        cache = ProjectionCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2, "maxsize": 2}
@@ -23,7 +23,8 @@ import pytest
 # conftest.py imports _helpers before any test module is collected, so the names
 # below are always bound to the real implementations even if test_cash_risk_score.py
 # later replaces sys.modules['app.cashflow'] with a stub.
-from _helpers import calc_transactions, calc_schedule, update_cash
+from _helpers import calc_transactions, calc_schedule, iter_balances, update_cash
+from app.recurrence import expand_occurrences, iter_occurrences
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -361,6 +362,113 @@ class TestCalcScheduleFrequencies:
         )
 
 
+# ── Tests: vectorized recurrence expansion ──────────────────────────────────
+# expand_occurrences takes an explicit "today", so these tests pin dates far in
+# the future and assert exact business-day-rolled occurrences.
+
+
+def make_recurring(startdate, frequency, type_="Expense", firstdate=None):
+    return types.SimpleNamespace(
+        startdate=startdate, firstdate=firstdate, frequency=frequency, type=type_,
+    )
+
+
+class TestRecurrenceExpansion:
+    def test_month_end_day_clamped_then_restored_from_firstdate(self):
+        s = make_recurring(date(2030, 1, 31), "Monthly", firstdate=date(2030, 1, 31))
+        counts, dates, _ = expand_occurrences([s], date(2030, 1, 1))
+        assert counts.tolist() == [13]
+        # Feb is clamped to the 28th; March returns to the 31st (a Sunday,
+        # rolled forward to Monday).
+        assert [str(d) for d in dates[:4]] == [
+            "2030-01-31", "2030-02-28", "2030-04-01", "2030-04-30",
+        ]
+
+    def test_shortened_startdate_walks_back_to_firstdate_day(self):
+        s = make_recurring(date(2030, 2, 28), "Monthly", firstdate=date(2030, 1, 31))
+        _, dates, _ = expand_occurrences([s], date(2030, 1, 1))
+        assert [str(d) for d in dates[:3]] == ["2030-02-28", "2030-04-01", "2030-04-30"]
+
+    def test_monthly_income_rolls_back_to_friday(self):
+        s = make_recurring(date(2030, 6, 15), "Monthly", type_="Income",
+                           firstdate=date(2030, 6, 15))
+        _, dates, _ = expand_occurrences([s], date(2030, 1, 1))
+        assert str(dates[0]) == "2030-06-14"
+
+    def test_stale_weekly_start_fast_forwarded(self):
+        s = make_recurring(date(2028, 6, 15), "Weekly")
+        counts, dates, last_past = expand_occurrences([s], date(2030, 1, 1))
+        assert counts.tolist() == [53]
+        assert str(dates[-1]) == "2030-01-03"
+        assert str(last_past[0]) == "2029-12-27"
+
+    def test_past_onetime_has_no_occurrence(self):
+        items = [
+            make_recurring(date(2029, 6, 15), "Onetime"),
+            make_recurring(date(2030, 6, 15), "Onetime"),
+        ]
+        counts, dates, _ = expand_occurrences(items, date(2030, 1, 1))
+        assert counts.tolist() == [0, 1]
+        assert [str(d) for d in dates] == ["2030-06-15"]
+
+    def test_occurrences_concatenated_in_input_order(self):
+        items = [
+            make_recurring(date(2030, 3, 4), "Yearly"),
+            make_recurring(date(2030, 3, 5), "Quarterly"),
+            make_recurring(date(2030, 3, 6), "Onetime"),
+        ]
+        counts, dates, _ = expand_occurrences(items, date(2030, 1, 1))
+        assert counts.tolist() == [2, 4, 1]
+        assert [str(d) for d in dates] == [
+            "2030-03-04", "2031-03-04",
+            "2030-03-05", "2030-06-05", "2030-09-05", "2030-12-05",
+            "2030-03-06",
+        ]
+
+
+class TestOccurrenceStream:
+    def test_heap_merge_yields_date_order(self):
+        items = [
+            make_recurring(date(2030, 1, 15), "Monthly"),
+            make_recurring(date(2030, 1, 3), "Weekly"),
+            make_recurring(date(2030, 1, 20), "Onetime"),
+        ]
+        stream = list(iter_occurrences(items, date(2030, 1, 1), 30))
+        assert [(str(d), p) for d, p in stream] == [
+            ("2030-01-03", 1), ("2030-01-10", 1), ("2030-01-15", 0),
+            ("2030-01-17", 1), ("2030-01-20", 2), ("2030-01-24", 1), ("2030-01-31", 1),
+        ]
+
+    def test_matches_fixed_window_inside_it(self):
+        s = make_recurring(date(2030, 1, 31), "Monthly", firstdate=date(2030, 1, 31))
+        _, dates, _ = expand_occurrences([s], date(2030, 1, 1))
+        stream = [d for d, _p in iter_occurrences([s], date(2030, 1, 1), 365)]
+        assert stream == [d for d in dates if d <= pd.Timestamp("2031-01-01")]
+
+    def test_long_horizon_runs_past_fixed_counts(self):
+        s = make_recurring(date(2030, 1, 7), "Weekly")
+        stream = list(iter_occurrences([s], date(2030, 1, 1), 3653))
+        assert len(stream) == 522
+        assert str(stream[-1][0]) == "2040-01-02"
+
+    def test_stream_is_lazy(self):
+        s = make_recurring(date(2030, 1, 7), "Weekly")
+        stream = iter_occurrences([s], date(2030, 1, 1), 3653)
+        assert str(next(stream)[0]) == "2030-01-07"
+
+    @pytest.mark.parametrize("horizon", [29, 3654, 45.5, True])
+    def test_horizon_out_of_range_rejected(self, horizon):
+        with pytest.raises(ValueError):
+            list(iter_occurrences([], date(2030, 1, 1), horizon))
+
+    def test_update_cash_horizon(self, app_ctx):
+        s = make_schedule_obj("MonthlyExpense", 1000, "Monthly", days_offset=5, type_="Expense")
+        _, run, _ = update_cash(5000.0, [s], [], [], commit=False, horizon_days=60)
+        assert len(run) == 3
+        _, run, _ = update_cash(5000.0, [s], [], [], commit=False, horizon_days=3653)
+        assert float(run["amount"].iloc[-1]) == pytest.approx(5000.0 - 120 * 1000.0)
+
+
 # ── Tests: 90-day projection end-to-end ─────────────────────────────────────
 
 
@@ -394,3 +502,79 @@ class TestEndToEndProjection:
         lowest = float(run_90["amount"].min())
 
         assert lowest == pytest.approx(2000.0)
+
+
+# ── Tests: integer-cent balances ─────────────────────────────────────────────
+
+
+class TestIntegerCents:
+    def test_long_running_balance_has_no_float_drift(self):
+        """A thousand 10-cent deposits add up to exactly $100."""
+        total = make_total(*[
+            {"type": "Income", "name": f"Dime {i}", "amount": 0.1, "date": future(i + 1)}
+            for i in range(1000)
+        ])
+        _, run = calc_transactions(0, total)
+
+        assert run["amount_cents"].iloc[-1] == 10_000
+        assert run["amount"].iloc[-1] == 100.0
+        assert run["amount_cents"].dtype == "int64"
+
+    def test_amount_is_cents_over_100(self):
+        total = make_total(
+            {"type": "Expense", "name": "Coffee", "amount": 3.35, "date": future(1)},
+            {"type": "Income", "name": "Refund", "amount": 0.2, "date": future(2)},
+        )
+        _, run = calc_transactions("10.05", total)
+
+        assert run["amount_cents"].tolist() == [1005, 670, 690]
+        assert run["amount"].tolist() == [10.05, 6.7, 6.9]
+
+    def test_calc_schedule_carries_cents_for_decimal_amounts(self, app_ctx):
+        from decimal import Decimal
+
+        s = make_schedule_obj("Rent", Decimal("1234.56"), "Monthly", days_offset=5, type_="Expense")
+        total, _ = calc_schedule([s], [], [], [])
+
+        assert set(total["amount_cents"]) == {123456}
+        _, run = calc_transactions(Decimal("5000.00"), total)
+        assert run["amount_cents"].iloc[1] == 500000 - 123456
+
+
+# ── Tests: lazy running balance ──────────────────────────────────────────────
+
+
+class TestIterBalances:
+    def _rows(self):
+        schedules = [
+            make_schedule_obj("Rent", 1200, "Monthly", days_offset=3, type_="Expense"),
+            make_schedule_obj("Pay", 2500.5, "BiWeekly", days_offset=1),
+            make_schedule_obj("Coffee", 3.35, "Weekly", days_offset=2, type_="Expense"),
+        ]
+        holds = [types.SimpleNamespace(name="Hold", amount=40, type="Expense")]
+        skips = [
+            types.SimpleNamespace(name="Pay (SKIP)", amount=2500.5, type="Expense", date=future(15)),
+            types.SimpleNamespace(name="Old (SKIP)", amount=9, type="Expense", date=future(-3)),
+        ]
+        scenarios = [make_schedule_obj("Bonus", 700, "Quarterly", days_offset=20)]
+        return schedules, holds, skips, scenarios
+
+    @pytest.mark.parametrize("horizon_days", [None, 1825])
+    def test_matches_update_cash(self, app_ctx, horizon_days):
+        schedules, holds, skips, scenarios = self._rows()
+        _, run, run_scenario = update_cash(
+            "1000.00", schedules, holds, skips, scenarios, commit=False, horizon_days=horizon_days
+        )
+
+        base = list(iter_balances("1000.00", schedules, holds, skips, horizon_days=horizon_days))
+        with_scenarios = list(
+            iter_balances("1000.00", schedules, holds, skips, scenarios, horizon_days=horizon_days)
+        )
+        assert base == list(zip(run["date"], run["amount_cents"]))
+        assert with_scenarios == list(zip(run_scenario["date"], run_scenario["amount_cents"]))
+
+    def test_is_lazy(self):
+        schedules, _, _, _ = self._rows()
+        points = iter_balances(0, schedules, [], [], horizon_days=3650)
+        assert next(points) == (date.today(), 0)
+        assert next(points)[0] > date.today()
@@ -0,0 +1,160 @@
+"""
+Query-plan regression tests for the hot per-user lookups.
+
+Each query below is one the app runs on every page or API call; the test
+asserts the database answers it from the expected index (and, where the
+query is ordered, without a separate sort), so lookups stay index range
+scans as the tables grow.
+
+The SQLite plans run against the in-memory test database.  The PostgreSQL
+plans run only when ``TEST_POSTGRES_URL`` points at a scratch database; the
+tables are created in a throwaway schema inside a transaction that is rolled
+back.
+"""
+
+import json
+import os
+from datetime import date, datetime
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import asc, extract, select, tuple_
+
+from conftest import _db
+from _helpers import Balance, Scenario, Schedule, Skip, Tombstone
+
+
+def _hot_queries():
+    """``(label, statement, index, ordered)`` for each hot query."""
+    return [
+        (
+            "schedule duplicate-name check",
+            select(Schedule).where(Schedule.user_id == 1, Schedule.name == "Rent").limit(1),
+            "_user_schedule_uc",
+            False,
+        ),
+        (
+            "scenario duplicate-name check",
+            select(Scenario).where(Scenario.user_id == 1, Scenario.name == "Rent").limit(1),
+            "_user_scenario_uc",
+            False,
+        ),
+        (
+            "schedule page ordered by day of month",
+            select(Schedule).where(Schedule.user_id == 1).order_by(asc(extract("day", Schedule.startdate))),
+            "ix_schedule_user_id_start_day",
+            True,
+        ),
+        (
+            "scenario page ordered by day of month",
+            select(Scenario).where(Scenario.user_id == 1).order_by(asc(extract("day", Scenario.startdate))),
+            "ix_scenario_user_id_start_day",
+            True,
+        ),
+        (
+            "skips on a date",
+            select(Skip).where(Skip.user_id == 1, Skip.date == date(2026, 1, 1)),
+            "ix_skip_user_id_date",
+            False,
+        ),
+        (
+            "balance history keyset page",
+            select(Balance)
+            .where(Balance.user_id == 1, tuple_(Balance.date, Balance.id) < tuple_(date(2026, 1, 1), 10))
+            .order_by(Balance.date.desc(), Balance.id.desc())
+            .limit(50),
+            "ix_balance_user_id_date_id",
+            True,
+        ),
+        (
+            "sync tombstones since cursor",
+            select(Tombstone.kind, Tombstone.object_id)
+            .where(Tombstone.user_id == 1, Tombstone.deleted_at >= datetime(2026, 1, 1)),
+            "ix_tombstone_user_id_deleted_at",
+            False,
+        ),
+    ]
+
+
+_IDS = [label for label, *_ in _hot_queries()]
+
+
+# ── SQLite ────────────────────────────────────────────────────────────────────
+
+
+def _sqlite_index_names(table):
+    """Map index names to SQLite's own names (unique constraints get
+    ``sqlite_autoindex_*`` names) for *table*."""
+    conn = _db.session.connection()
+    names = {}
+    for _seq, name, _unique, origin, _partial in conn.exec_driver_sql(f"PRAGMA index_list('{table}')"):
+        names[name] = name
+        if origin == "u":
+            columns = [row[2] for row in conn.exec_driver_sql(f"PRAGMA index_info('{name}')")]
+            for constraint in _db.metadata.tables[table].constraints:
+                if isinstance(constraint, sa.UniqueConstraint) and [c.name for c in constraint.columns] == columns:
+                    names[constraint.name] = name
+    return names
+
+
+def _sqlite_plan(statement):
+    conn = _db.session.connection()
+    compiled = statement.compile(dialect=conn.dialect)
+    # Plans are made before parameters are bound, so their values don't matter.
+    params = (None,) * len(compiled.positiontup)
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+    return [row[3] for row in rows]
+
+
+@pytest.mark.parametrize("label, statement, index, ordered", _hot_queries(), ids=_IDS)
+def test_sqlite_plan_uses_index(app_ctx, label, statement, index, ordered):
+    table = statement.get_final_froms()[0].name
+    sqlite_name = _sqlite_index_names(table)[index]
+    plan = _sqlite_plan(statement)
+
+    assert any(f"INDEX {sqlite_name} " in step for step in plan), (label, plan)
+    assert not any(step.startswith("SCAN") for step in plan), (label, plan)
+    if ordered:
+        assert not any("TEMP B-TREE" in step for step in plan), (label, plan)
+
+
+# ── PostgreSQL ────────────────────────────────────────────────────────────────
+
+
+_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def _plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+@pytest.fixture(scope="module")
+def postgres_conn():
+    engine = sa.create_engine(_POSTGRES_URL)
+    with engine.connect() as conn:
+        trans = conn.begin()
+        conn.exec_driver_sql("CREATE SCHEMA pycashflow_plan_test")
+        conn.exec_driver_sql("SET LOCAL search_path TO pycashflow_plan_test")
+        _db.metadata.create_all(conn)
+        # Empty tables are cheapest to scan; make the planner show its index choice.
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        try:
+            yield conn
+        finally:
+            trans.rollback()
+    engine.dispose()
+
+
+@pytest.mark.skipif(not _POSTGRES_URL, reason="TEST_POSTGRES_URL not set")
+@pytest.mark.parametrize("label, statement, index, ordered", _hot_queries(), ids=_IDS)
+def test_postgres_plan_uses_index(postgres_conn, label, statement, index, ordered):
+    compiled = statement.compile(dialect=postgres_conn.dialect)
+    raw = postgres_conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    plan = (raw if isinstance(raw, list) else json.loads(raw))[0]["Plan"]
+    nodes = list(_plan_nodes(plan))
+
+    assert index in {node.get("Index Name") for node in nodes}, (label, plan)
+    if ordered:
+        assert not any(node["Node Type"] == "Sort" for node in nodes), (label, plan)
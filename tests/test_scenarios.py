@@ -26,7 +26,7 @@ import pytest
 # conftest.py imports _helpers before any test module is collected, so the names
 # below are always bound to the real implementations even if test_cash_risk_score.py
 # later replaces sys.modules['app.cashflow'] with a stub.
-from _helpers import calc_transactions, calc_schedule, update_cash
+from _helpers import calc_scenario_overlay, calc_transactions, calc_schedule, update_cash
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -272,3 +272,67 @@ class TestScenarioComparison:
 
         assert run_scenario is None
         assert end_balance(run) < 5000.0  # expenses reduced the balance
+
+
+# ── Tests: scenario overlay on the base projection ────────────────────────────
+
+
+class TestScenarioOverlay:
+    """
+    calc_scenario_overlay layers scenario rows over the base running balance;
+    it must agree with calc_transactions over the combined rows.
+    """
+
+    BASE = (
+        {"type": "Expense", "name": "Rent", "amount": 1000.0, "date": future(10)},
+        {"type": "Income", "name": "Salary", "amount": 2500.0, "date": future(14)},
+        {"type": "Expense", "name": "Bills", "amount": 300.0, "date": future(40)},
+    )
+
+    def assert_matches_combined(self, overlay_rows, base_rows=BASE):
+        _, run_base = calc_transactions(5000.0, make_total(*base_rows))
+        _, expected = calc_transactions(5000.0, make_total(*base_rows, *overlay_rows))
+        got = calc_scenario_overlay(run_base, make_total(*overlay_rows))
+        assert list(got["date"]) == list(expected["date"])
+        assert got["amount"].tolist() == pytest.approx(expected["amount"].tolist())
+
+    def test_overlay_on_shared_and_new_dates(self):
+        self.assert_matches_combined((
+            {"type": "Income", "name": "Contract", "amount": 800.0, "date": future(10)},
+            {"type": "Expense", "name": "Lease", "amount": 450.0, "date": future(20)},
+            {"type": "Expense", "name": "Lease", "amount": 450.0, "date": future(50)},
+        ))
+
+    def test_overlay_before_first_base_date(self):
+        self.assert_matches_combined((
+            {"type": "Income", "name": "Bonus", "amount": 900.0, "date": future(2)},
+        ))
+
+    def test_overlay_on_empty_base(self):
+        self.assert_matches_combined(
+            ({"type": "Expense", "name": "Lease", "amount": 450.0, "date": future(3)},),
+            base_rows=(),
+        )
+
+    def test_past_overlay_rows_leave_base_unchanged(self):
+        _, run_base = calc_transactions(5000.0, make_total(*self.BASE))
+        past = make_total(
+            {"type": "Income", "name": "Old", "amount": 900.0, "date": date.today() - timedelta(days=3)},
+        )
+        got = calc_scenario_overlay(run_base, past)
+        assert got["amount"].tolist() == run_base["amount"].tolist()
+
+    def test_update_cash_matches_combined_schedule(self, app_ctx):
+        schedules = [
+            make_schedule_obj("Salary", 3000, "BiWeekly", days_offset=4, type_="Income"),
+            make_schedule_obj("Rent", 1800, "Monthly", days_offset=9, type_="Expense"),
+        ]
+        scenarios = [
+            make_schedule_obj("Contract", 1200, "Monthly", days_offset=9, type_="Income"),
+            make_schedule_obj("Car", 350, "Weekly", days_offset=2, type_="Expense"),
+        ]
+        _, total_scenario = calc_schedule(schedules, [], [], scenarios, commit=False)
+        _, expected = calc_transactions(5000.0, total_scenario)
+        _, _, run_scenario = update_cash(5000.0, schedules, [], [], scenarios, commit=False)
+        assert list(run_scenario["date"]) == list(expected["date"])
+        assert run_scenario["amount"].tolist() == pytest.approx(expected["amount"].tolist())
@@ -0,0 +1,211 @@
+"""
+Tests for the opt-in SQLite performance profile (app/sqlite_profile.py).
+
+Covers pragma validation, the connect hook and create_app wiring.  The
+mixed read/write benchmark against SQLite's default rollback-journal mode
+depends on thread scheduling, so it only runs with ``RUN_BENCHMARKS=1``.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.exc import OperationalError
+
+from _helpers import install_sqlite_profile, profile_pragmas
+
+
+@contextmanager
+def _env(**overrides):
+    previous = {k: os.environ.get(k) for k in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for k, prev in previous.items():
+            if prev is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = prev
+
+
+def _pragma(conn, name):
+    return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+class TestProfilePragmas:
+    def test_defaults(self):
+        pragmas = dict(profile_pragmas({}))
+        assert pragmas == {
+            "busy_timeout": 5000,
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -20000,
+            "mmap_size": 256 * 1024 * 1024,
+            "temp_store": "MEMORY",
+        }
+
+    @pytest.mark.parametrize("key", ["SQLITE_BUSY_TIMEOUT_MS", "SQLITE_CACHE_SIZE_KB", "SQLITE_MMAP_SIZE_MB"])
+    def test_negative_values_rejected(self, key):
+        with pytest.raises(ValueError, match=key):
+            profile_pragmas({key: -1})
+
+    def test_applied_on_connect(self, tmp_path):
+        engine = sa.create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+        install_sqlite_profile(engine, profile_pragmas({"SQLITE_BUSY_TIMEOUT_MS": 1234}))
+        with engine.connect() as conn:
+            assert _pragma(conn, "journal_mode") == "wal"
+            assert _pragma(conn, "synchronous") == 1
+            assert _pragma(conn, "busy_timeout") == 1234
+            assert _pragma(conn, "cache_size") == -20000
+            assert _pragma(conn, "temp_store") == 2
+        engine.dispose()
+
+    @pytest.mark.parametrize("profile", [False, True])
+    def test_writer_commits_past_open_reader_only_with_wal(self, tmp_path, profile):
+        engine = sa.create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", connect_args={"timeout": 0})
+        if profile:
+            install_sqlite_profile(engine, profile_pragmas({"SQLITE_BUSY_TIMEOUT_MS": 0}))
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE ledger (id INTEGER PRIMARY KEY, amount REAL)")
+            conn.exec_driver_sql("INSERT INTO ledger (amount) VALUES (1.0)")
+
+        reader = engine.raw_connection()
+        writer = engine.raw_connection()
+        try:
+            reader.execute("BEGIN")
+            assert reader.execute("SELECT count(*) FROM ledger").fetchone() == (1,)
+            writer.execute("INSERT INTO ledger (amount) VALUES (2.0)")
+            if profile:
+                writer.commit()
+                # The reader keeps its snapshot until its transaction ends.
+                assert reader.execute("SELECT count(*) FROM ledger").fetchone() == (1,)
+            else:
+                with pytest.raises(sqlite3.OperationalError, match="locked"):
+                    writer.commit()
+        finally:
+            writer.close()
+            reader.close()
+        engine.dispose()
+
+
+class TestCreateAppWiring:
+    def test_profile_enabled_from_environment(self, create_app, tmp_path):
+        with _env(DATABASE_URL=f"sqlite:///{tmp_path / 'app.sqlite'}", SQLITE_PERFORMANCE_PROFILE="true"):
+            app = create_app()
+        db = app.extensions["sqlalchemy"]
+        with app.app_context():
+            with db.engine.connect() as conn:
+                assert _pragma(conn, "journal_mode") == "wal"
+                assert _pragma(conn, "busy_timeout") == 5000
+            db.engine.dispose()
+
+    def test_profile_off_by_default(self, create_app, tmp_path):
+        with _env(DATABASE_URL=f"sqlite:///{tmp_path / 'app.sqlite'}"):
+            app = create_app()
+        db = app.extensions["sqlalchemy"]
+        with app.app_context():
+            with db.engine.connect() as conn:
+                assert _pragma(conn, "journal_mode") == "delete"
+            db.engine.dispose()
+
+    def test_invalid_setting_fails_startup(self, create_app, tmp_path):
+        with _env(
+            DATABASE_URL=f"sqlite:///{tmp_path / 'app.sqlite'}",
+            SQLITE_PERFORMANCE_PROFILE="true",
+            SQLITE_BUSY_TIMEOUT_MS="-5",
+        ):
+            with pytest.raises(ValueError, match="SQLITE_BUSY_TIMEOUT_MS"):
+                create_app()
+
+
+# ── Benchmark ─────────────────────────────────────────────────────────────────
+
+_READERS = 4
+_WRITERS = 2
+_DURATION = 1.0
+_BUSY_TIMEOUT_MS = 50
+
+
+def _mixed_load(engine):
+    """Run readers and writers against *engine* for ``_DURATION`` seconds.
+
+    Returns counts of completed reads/writes and "database is locked" errors.
+    """
+    stats = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + _DURATION
+
+    def _count(key):
+        with lock:
+            stats[key] += 1
+
+    def reader():
+        with engine.connect() as conn:
+            while time.monotonic() < deadline:
+                try:
+                    conn.exec_driver_sql("SELECT sum(amount) FROM ledger WHERE user_id = 3").scalar()
+                    conn.rollback()
+                except OperationalError:
+                    conn.rollback()
+                    _count("locked")
+                    continue
+                _count("reads")
+
+    def writer():
+        with engine.connect() as conn:
+            while time.monotonic() < deadline:
+                try:
+                    conn.exec_driver_sql("INSERT INTO ledger (user_id, amount) VALUES (1, 1.0)")
+                    conn.commit()
+                except OperationalError:
+                    conn.rollback()
+                    _count("locked")
+                    continue
+                _count("writes")
+
+    threads = [threading.Thread(target=reader) for _ in range(_READERS)]
+    threads += [threading.Thread(target=writer) for _ in range(_WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats
+
+
+def _ledger_engine(path, profile):
+    engine = sa.create_engine(
+        f"sqlite:///{path}",
+        connect_args={"timeout": _BUSY_TIMEOUT_MS / 1000, "check_same_thread": False},
+        pool_size=_READERS + _WRITERS,
+    )
+    if profile:
+        install_sqlite_profile(engine, profile_pragmas({"SQLITE_BUSY_TIMEOUT_MS": _BUSY_TIMEOUT_MS}))
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE ledger (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL)")
+        conn.exec_driver_sql(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 50000) "
+            "INSERT INTO ledger (user_id, amount) SELECT i % 50, i FROM n"
+        )
+    return engine
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="RUN_BENCHMARKS not set")
+class TestMixedLoadBenchmark:
+    def test_profile_reduces_lock_stalls(self, tmp_path):
+        results = {}
+        for label, profile in (("default", False), ("profile", True)):
+            engine = _ledger_engine(tmp_path / f"{label}.sqlite", profile)
+            results[label] = _mixed_load(engine)
+            engine.dispose()
+
+        default, profile = results["default"], results["profile"]
+        print(f"\nmixed load {_READERS}r/{_WRITERS}w for {_DURATION:.0f}s, "
+              f"busy_timeout {_BUSY_TIMEOUT_MS} ms: default {default}, profile {profile}")
+        assert profile["locked"] < default["locked"]
+        assert profile["reads"] > default["reads"]
+        assert profile["writes"] > default["writes"]
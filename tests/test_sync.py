@@ -0,0 +1,254 @@
+"""
+Tests for delta sync (app/sync.py and GET /api/v1/sync).
+
+Synced rows carry ``updated_at`` and a ``sync_revision`` stamped at commit,
+every deletion — ORM or bulk — leaves a tombstone, and a cursor returns only
+what was committed after it.
+"""
+
+import base64
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from conftest import _ADMIN_USER_ID, _db
+from _helpers import (
+    Hold,
+    Schedule,
+    Skip,
+    SyncCursor,
+    Tombstone,
+    bump_data_revision,
+    changes_since,
+    decode_cursor,
+    delete_with_tombstones,
+    encode_cursor,
+    get_data_revision,
+    prune_tombstones,
+    run_housekeeping,
+)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _login(client):
+    resp = client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@test.local", "password": "testpass123"},
+    )
+    return {"Authorization": f"Bearer {resp.get_json()['data']['token']}"}
+
+
+def _cursor():
+    return decode_cursor(changes_since(_ADMIN_USER_ID)["cursor"])
+
+
+def _add_schedule(name, **overrides):
+    fields = {"frequency": "Monthly", "startdate": date.today() + timedelta(days=3), **overrides}
+    row = Schedule(user_id=_ADMIN_USER_ID, name=name, amount="10.00", type="Expense", **fields)
+    _db.session.add(row)
+    _db.session.commit()
+    return row
+
+
+@pytest.fixture()
+def sync_ctx(app_ctx):
+    yield
+    _db.session.rollback()
+    for model in (Schedule, Hold, Skip):
+        model.query.filter(model.name.like("_test_sync%")).delete(synchronize_session=False)
+    Tombstone.query.filter_by(user_id=_ADMIN_USER_ID).delete()
+    _db.session.commit()
+
+
+class TestCursor:
+    def test_round_trip(self):
+        moment = datetime(2026, 5, 4, 3, 2, 1, 123456)
+        cursor = encode_cursor(42, moment)
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == SyncCursor(42, moment)
+
+    def test_legacy_timestamp_cursor_has_no_revision(self):
+        cursor = base64.urlsafe_b64encode(b"v1:1760786000000000").decode().rstrip("=")
+        assert decode_cursor(cursor).revision is None
+
+    @pytest.mark.parametrize("cursor", [
+        "",
+        "not-a-cursor",
+        encode_cursor(3, datetime(2026, 1, 1))[:-3] + "@@@",
+        base64.urlsafe_b64encode(b"v2:-1:0").decode(),
+        base64.urlsafe_b64encode(b"v3:1:0").decode(),
+    ])
+    def test_malformed_cursor_rejected(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestChangeTracking:
+    def test_insert_and_update_touch_updated_at(self, sync_ctx):
+        row = _add_schedule("_test_sync_touch")
+        created = row.updated_at
+        assert created is not None
+        row.amount = "11.00"
+        _db.session.commit()
+        assert row.updated_at >= created
+
+    def test_commit_stamps_rows_with_data_revision(self, sync_ctx):
+        before = get_data_revision(_ADMIN_USER_ID)
+        row = _add_schedule("_test_sync_stamp")
+        assert row.sync_revision == get_data_revision(_ADMIN_USER_ID) == before + 1
+        row.amount = "12.00"
+        bump_data_revision(_ADMIN_USER_ID)
+        _db.session.commit()
+        assert row.sync_revision == get_data_revision(_ADMIN_USER_ID) == before + 2
+
+    def test_bulk_update_is_restamped(self, sync_ctx):
+        row = _add_schedule("_test_sync_bulk")
+        stamped = row.sync_revision
+        _db.session.execute(update(Schedule).where(Schedule.id == row.id).values(amount="13.00"))
+        bump_data_revision(_ADMIN_USER_ID)
+        _db.session.commit()
+        assert row.sync_revision > stamped
+
+    def test_orm_delete_leaves_tombstone(self, sync_ctx):
+        row = _add_schedule("_test_sync_orm_delete")
+        row_id = row.id
+        _db.session.delete(row)
+        _db.session.commit()
+        tomb = Tombstone.query.filter_by(kind="schedules", object_id=row_id).one()
+        assert tomb.user_id == _ADMIN_USER_ID
+
+    def test_bulk_delete_leaves_tombstones(self, sync_ctx):
+        holds = [Hold(user_id=_ADMIN_USER_ID, name=f"_test_sync_hold{i}", amount="5.00", type="Expense")
+                 for i in range(3)]
+        _db.session.add_all(holds)
+        _db.session.commit()
+        ids = {h.id for h in holds}
+
+        deleted = delete_with_tombstones(Hold, Hold.name.like("_test_sync_hold%"))
+        _db.session.commit()
+        assert deleted == 3
+        assert {t.object_id for t in Tombstone.query.filter_by(kind="holds")} >= ids
+
+    def test_housekeeping_tombstones_and_prunes(self, sync_ctx):
+        row = _add_schedule("_test_sync_past_once", frequency="Onetime",
+                            startdate=date.today() - timedelta(days=2))
+        row_id = row.id
+        stale = Tombstone(user_id=_ADMIN_USER_ID, kind="holds", object_id=1,
+                          deleted_at=_utcnow() - timedelta(days=400))
+        _db.session.add(stale)
+        _db.session.commit()
+
+        stats = run_housekeeping()
+        assert Tombstone.query.filter_by(kind="schedules", object_id=row_id).count() == 1
+        assert stats["tombstones_pruned"] >= 1
+        assert prune_tombstones() == 0
+
+
+class TestChangesSince:
+    def test_without_cursor_is_full_snapshot(self, sync_ctx):
+        _add_schedule("_test_sync_full")
+        result = changes_since(_ADMIN_USER_ID)
+        assert result["full"] is True
+        assert "_test_sync_full" in {s.name for s in result["changes"]["schedules"]}
+        assert all(ids == [] for ids in result["deleted"].values())
+
+    def test_only_rows_changed_after_cursor(self, sync_ctx):
+        old = _add_schedule("_test_sync_old")
+        cursor = _cursor()
+        new = _add_schedule("_test_sync_new")
+
+        result = changes_since(_ADMIN_USER_ID, cursor)
+        assert result["full"] is False
+        names = {s.name for s in result["changes"]["schedules"]}
+        assert new.name in names
+        assert old.name not in names
+
+    def test_deleted_ids_since_cursor(self, sync_ctx):
+        row = _add_schedule("_test_sync_gone")
+        row_id = row.id
+        cursor = _cursor()
+        _db.session.delete(row)
+        _db.session.commit()
+        result = changes_since(_ADMIN_USER_ID, cursor)
+        assert row_id in result["deleted"]["schedules"]
+        assert changes_since(_ADMIN_USER_ID, decode_cursor(result["cursor"]))["deleted"]["schedules"] == []
+
+    def test_bulk_deleted_ids_since_cursor(self, sync_ctx):
+        hold = Hold(user_id=_ADMIN_USER_ID, name="_test_sync_bulk_gone", amount="5.00", type="Expense")
+        _db.session.add(hold)
+        _db.session.commit()
+        cursor = _cursor()
+        delete_with_tombstones(Hold, Hold.id == hold.id)
+        _db.session.commit()
+        assert hold.id in changes_since(_ADMIN_USER_ID, cursor)["deleted"]["holds"]
+
+    def test_reused_id_is_not_reported_deleted(self, sync_ctx):
+        cursor = _cursor()
+        row = _add_schedule("_test_sync_reused")
+        _db.session.add(Tombstone(user_id=_ADMIN_USER_ID, kind="schedules", object_id=row.id))
+        _db.session.commit()
+        result = changes_since(_ADMIN_USER_ID, cursor)
+        assert row.id not in result["deleted"]["schedules"]
+
+    def test_expired_cursor_falls_back_to_full(self, sync_ctx):
+        cursor = SyncCursor(get_data_revision(_ADMIN_USER_ID), _utcnow() - timedelta(days=365))
+        assert changes_since(_ADMIN_USER_ID, cursor)["full"] is True
+
+    def test_legacy_cursor_falls_back_to_full(self, sync_ctx):
+        assert changes_since(_ADMIN_USER_ID, SyncCursor(None, _utcnow()))["full"] is True
+
+    def test_late_commit_is_returned(self, sync_ctx):
+        # A transaction that wrote its row long before committing (lock wait,
+        # slow request) must still reach clients that synced in between.
+        cursor = _cursor()
+        row = Schedule(user_id=_ADMIN_USER_ID, name="_test_sync_late", amount="10.00", type="Expense",
+                       frequency="Monthly", startdate=date.today() + timedelta(days=3),
+                       updated_at=_utcnow() - timedelta(hours=1))
+        _db.session.add(row)
+        _db.session.commit()
+        later = changes_since(_ADMIN_USER_ID, cursor)
+        assert row.name in {s.name for s in later["changes"]["schedules"]}
+
+    def test_unstamped_rows_are_always_returned(self, sync_ctx):
+        row = _add_schedule("_test_sync_unstamped")
+        # A bulk write that neither bumps nor tombstones registers no user.
+        _db.session.execute(update(Schedule).where(Schedule.id == row.id).values(amount="14.00"))
+        _db.session.commit()
+        assert row.sync_revision is None
+        cursor = _cursor()
+        assert row.name in {s.name for s in changes_since(_ADMIN_USER_ID, cursor)["changes"]["schedules"]}
+
+
+class TestSyncEndpoint:
+    def test_requires_auth(self, client):
+        assert client.get("/api/v1/sync").status_code == 401
+
+    def test_invalid_cursor_is_422(self, client):
+        resp = client.get("/api/v1/sync?cursor=garbage", headers=_login(client))
+        assert resp.status_code == 422
+        assert "cursor" in resp.get_json()["fields"]
+
+    def test_full_then_delta(self, client, sync_ctx):
+        headers = _login(client)
+        first = client.get("/api/v1/sync", headers=headers).get_json()["data"]
+        assert first["full"] is True
+        assert set(first["changes"]) == {"schedules", "scenarios", "holds", "skips", "balances"}
+
+        body = {"name": "_test_sync_api", "amount": "30.00", "type": "Expense",
+                "frequency": "Monthly", "start_date": (date.today() + timedelta(days=6)).isoformat()}
+        schedule_id = client.post("/api/v1/schedules", headers=headers, json=body).get_json()["data"]["id"]
+        client.post("/api/v1/holds", headers=headers, json={"schedule_id": schedule_id})
+        client.delete("/api/v1/holds", headers=headers)
+
+        delta = client.get(f"/api/v1/sync?cursor={first['cursor']}", headers=headers).get_json()["data"]
+        assert delta["full"] is False
+        assert schedule_id in [s["id"] for s in delta["changes"]["schedules"]]
+        assert delta["changes"]["schedules"][0].keys() == {
+            "id", "name", "amount", "type", "frequency", "start_date", "first_date",
+        }
+        assert delta["deleted"]["holds"]
+        assert delta["cursor"] != first["cursor"]